@@ -9,10 +9,10 @@ Usage:
 
 import uvicorn
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv(override=True)
+# Importing src loads environment variables from .env exactly once
+# (see src/__init__.py) - no need to call load_dotenv() again here
+import src  # noqa: F401
 
 
 def main():
@@ -24,12 +24,22 @@ def main():
     port = int(os.getenv("PORT", 8000))
     reload = os.getenv("RELOAD", "true").lower() == "true"
 
+    # Workers use all cores in production; uvicorn forbids workers>1
+    # together with reload, so development keeps a single worker
+    workers = 1 if reload else int(os.getenv("WORKERS", os.cpu_count() or 1))
+
     # Run uvicorn server
+    # loop="uvloop" and http="httptools" select the C-accelerated event
+    # loop and HTTP parser (installed via uvicorn[standard]) explicitly
+    # instead of relying on auto-detection
     uvicorn.run(
         "src.api.app:app",
         host=host,
         port=port,
         reload=reload,
+        loop="uvloop",
+        http="httptools",
+        workers=workers,
         log_level="info"
     )
 
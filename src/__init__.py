@@ -14,15 +14,20 @@ from pathlib import Path
 try:
     from dotenv import load_dotenv
 
-    # Find .env file in project root (parent of src/)
-    project_root = Path(__file__).parent.parent
-    env_file = project_root / ".env"
+    # Sentinel guard: parsing .env allocates noticeably at startup, so only
+    # do it once per process (uvicorn reload/workers re-import this module)
+    if not os.getenv("_DOTENV_LOADED"):
+        # Find .env file in project root (parent of src/)
+        project_root = Path(__file__).parent.parent
+        env_file = project_root / ".env"
 
-    if env_file.exists():
-        load_dotenv(dotenv_path=env_file, override=True)
-    else:
-        # If .env doesn't exist, try to load from current directory
-        load_dotenv(override=True)
+        if env_file.exists():
+            load_dotenv(dotenv_path=env_file, override=True)
+        else:
+            # If .env doesn't exist, try to load from current directory
+            load_dotenv(override=True)
+
+        os.environ["_DOTENV_LOADED"] = "1"
 
 except ImportError:
     # python-dotenv not installed - environment variables must come from system
@@ -5,14 +5,17 @@ This module provides the agent system that orchestrates LLM interactions
 and tool execution to answer user questions.
 """
 
-from .agent import Agent, create_agent
+from .agent import Agent, create_agent, get_session_agent, close_session_agents
 from .tools import Tool, ToolParameter, ToolRegistry, get_tool_registry
 from .tools_articles import register_article_tools, format_article_for_display, format_articles_list
 from .tools_sql import register_sql_tools, execute_custom_sql_query
+from .semantic_cache import SemanticCache, get_semantic_cache
 
 __all__ = [
     "Agent",
     "create_agent",
+    "get_session_agent",
+    "close_session_agents",
     "Tool",
     "ToolParameter",
     "ToolRegistry",
@@ -22,4 +25,6 @@ __all__ = [
     "format_articles_list",
     "register_sql_tools",
     "execute_custom_sql_query",
+    "SemanticCache",
+    "get_semantic_cache",
 ]
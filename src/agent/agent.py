@@ -5,14 +5,107 @@ This module provides the main Agent class that orchestrates LLM interactions
 and tool execution to answer user questions.
 """
 
+import asyncio
+import hashlib
 import json
-import re
-from typing import List, Dict, Any, Optional
+import logging
+import os
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Deque, Optional, Tuple
 from src.llm import BaseLLMProvider, LLMMessage
 from src.utils import logger, truncate_text
 from .tools import ToolRegistry, get_tool_registry
-from .tools_articles import register_article_tools, format_articles_list
-from .tools_sql import register_sql_tools
+from .tools_articles import (
+    register_article_tools,
+    format_article_for_display,
+    format_articles_list
+)
+from .tools_sql import (
+    register_sql_tools,
+    execute_custom_sql_query,
+    format_sql_results
+)
+from .semantic_cache import get_semantic_cache
+
+# orjson (Rust) parses and serializes JSON several times faster than the
+# stdlib - fall back to stdlib json so the package stays installable
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data)
+
+
+# Decodes tool-call arguments in place: raw_decode consumes exactly one
+# JSON object at a given offset and reports where it ended, so no payload
+# substring has to be sliced out first
+_JSON_DECODER = json.JSONDecoder()
+
+# Keyword fragments that suggest the user wants a database-backed answer.
+# Derived from the registered tool descriptions - keep in sync when adding
+# new tool categories.
+_TOOL_HINT_KEYWORDS = (
+    "article", "approve", "reject", "count", "how many", "list", "search",
+    "find", "show", "sql", "query", "database", "user", "date", "headline",
+    "publication", "recent", "latest",
+)
+
+# Messages longer than this always go through the full tool prompt
+_TRIVIAL_MESSAGE_MAX_LENGTH = 120
+
+# Minimal prompt for small-talk turns that clearly need no tools - avoids
+# sending the large tool catalog just to answer a greeting
+_DIRECT_ANSWER_SYSTEM_PROMPT = (
+    "You are a helpful AI assistant for a news article database service. "
+    "Answer the user directly, concisely, and helpfully."
+)
+
+# Shared message object for the direct-answer prompt - treated as read-only
+_DIRECT_ANSWER_SYSTEM_MESSAGE = LLMMessage(
+    role="system", content=_DIRECT_ANSWER_SYSTEM_PROMPT
+)
+
+# Exact-match response cache: duplicate submissions (retries, tests,
+# identical FAQs) short-circuit the LLM entirely. Keyed on the full
+# (system prompt, history, message) context so it is safe on any turn,
+# unlike the first-turn-only semantic cache. LRU-evicted at
+# _EXACT_CACHE_MAX.
+_EXACT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_EXACT_CACHE_MAX = int(os.getenv("AGENT_EXACT_CACHE_SIZE", 4096))
+
+
+def _exact_cache_key(system_prompt: str, history, user_message: str) -> str:
+    """
+    Build a digest key over the full conversation context.
+
+    Args:
+        system_prompt: Agent system prompt
+        history: Conversation history (iterable of LLMMessage)
+        user_message: Incoming user message
+
+    Returns:
+        str: blake2b hex digest of the context
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(system_prompt.encode())
+    for message in history:
+        hasher.update(b"\0")
+        hasher.update(message.role.encode())
+        hasher.update(b"\0")
+        hasher.update(message.content.encode())
+    hasher.update(b"\0")
+    hasher.update(user_message.encode())
+    return hasher.hexdigest()
 
 
 class Agent:
@@ -27,7 +120,8 @@ class Agent:
         self,
         llm_provider: BaseLLMProvider,
         tool_registry: Optional[ToolRegistry] = None,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        session_id: Optional[str] = None
     ):
         """
         Initialize the agent.
@@ -36,28 +130,68 @@ class Agent:
             llm_provider: LLM provider instance
             tool_registry: Tool registry (uses global if not provided)
             system_prompt: Custom system prompt (uses default if not provided)
+            session_id: Optional session identifier used to name the
+                        on-disk history log (see AGENT_HISTORY_LOG_DIR)
         """
         self.llm = llm_provider
         self.registry = tool_registry or get_tool_registry()
-        self.conversation_history: List[LLMMessage] = []
 
-        # Register article tools if not already registered
-        if not self.registry.list_tools():
+        # Sliding context window: a bounded deque keeps memory and prompt
+        # size constant per turn instead of growing with session length.
+        # Old turns are truncated verbatim, never summarized - rewriting
+        # the prefix would invalidate provider-side KV caches.
+        self.conversation_history: Deque[LLMMessage] = deque(
+            maxlen=int(os.getenv("AGENT_HISTORY_TURNS", 40))
+        )
+
+        # Optional append-only spill log: turns evicted from the live
+        # window are written to disk so full-session recall is possible
+        # without keeping every turn in RAM (off unless the env var is set)
+        self._history_log_path: Optional[str] = None
+        log_dir = os.getenv("AGENT_HISTORY_LOG_DIR")
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+            log_name = session_id or f"agent-{id(self):x}"
+            self._history_log_path = os.path.join(log_dir, f"{log_name}.jsonl")
+
+        # Register article tools if not already registered - bool(registry)
+        # is O(1), unlike list_tools() which copies the tool list
+        if not self.registry:
             register_article_tools(self.registry)
             register_sql_tools(self.registry)
 
         self.system_prompt = system_prompt or self._default_system_prompt()
 
+        # Built once - reused for every turn instead of constructing a new
+        # system LLMMessage per call
+        self._system_message = LLMMessage(role="system", content=self.system_prompt)
+
+        # Shared response cache - repeat questions (modulo case and
+        # punctuation) skip the LLM round-trip entirely (first-turn
+        # questions only)
+        self._response_cache = get_semantic_cache()
+
     def _default_system_prompt(self) -> str:
         """
         Generate the default system prompt with tool descriptions.
 
+        The rendered prompt is cached on the tool registry and reused for
+        every agent sharing that registry. Keeping the prompt byte-identical
+        across turns also lets provider-side prompt caching hit.
+
         Returns:
             str: System prompt
         """
-        tools_desc = self.registry.get_tools_description()
+        registry = self.registry
+
+        # Reuse cached prompt unless the tool set changed since it was built
+        if (registry._system_prompt_cache is not None
+                and registry._system_prompt_version == registry._tools_version):
+            return registry._system_prompt_cache
+
+        tools_desc = registry.get_tools_description()
 
-        return f"""You are a helpful AI assistant with access to a database of approved news articles.
+        prompt = f"""You are a helpful AI assistant with access to a database of approved news articles.
 
 You have access to the following tools to query the ArticleApproveds database:
 
@@ -77,37 +211,221 @@ When a user asks a question that requires querying the database, you should:
 
 3. After receiving tool results, use them to answer the user's question in a helpful way
 
+If answering requires several independent queries, you may emit multiple
+TOOL_CALL blocks in one response; they will be executed concurrently.
+
 If the user's question doesn't require database queries, answer directly.
 
 Be concise, accurate, and helpful. When presenting article results, format them clearly.
 """
 
-    def _parse_tool_call(self, response: str) -> Optional[Dict[str, Any]]:
+        registry._system_prompt_cache = prompt
+        registry._system_prompt_version = registry._tools_version
+        return prompt
+
+    def _is_trivial_message(self, user_message: str) -> bool:
         """
-        Parse a tool call from the LLM response.
+        Check whether a message can be answered without the tool catalog.
+
+        Args:
+            user_message: User's message
+
+        Returns:
+            bool: True if the message is short and mentions no tool keywords
+        """
+        if len(user_message) >= _TRIVIAL_MESSAGE_MAX_LENGTH:
+            return False
+
+        message_lower = user_message.lower()
+        return not any(keyword in message_lower for keyword in _TOOL_HINT_KEYWORDS)
+
+    def _remember(self, message: LLMMessage) -> None:
+        """
+        Append a message to history, spilling the evicted turn to disk.
+
+        When the sliding window is full, the oldest message is written to
+        the session's append-only JSONL log (if configured) before the
+        deque drops it.
+
+        Args:
+            message: Message to append
+        """
+        history = self.conversation_history
+        if (self._history_log_path is not None
+                and len(history) == history.maxlen):
+            evicted = history[0]
+            with open(self._history_log_path, "a") as log_file:
+                log_file.write(_json_dumps(
+                    {"role": evicted.role, "content": evicted.content}
+                ) + "\n")
+        history.append(message)
+
+    def _build_messages(self, system_message: LLMMessage) -> List[LLMMessage]:
+        """
+        Build the per-call messages list from the conversation history.
+
+        Allocates the list at its final size and fills the history with
+        one slice assignment, instead of growing it through unpacking
+        plus repeated appends - two fewer list copies per call on long
+        conversations.
+
+        Args:
+            system_message: System message to place at index 0
+
+        Returns:
+            List[LLMMessage]: [system, *history], safe for further appends
+        """
+        history = self.conversation_history
+        messages: List[LLMMessage] = [system_message] * (len(history) + 1)
+        messages[1:] = history
+        return messages
+
+    async def _chat_until_tool_call(self, messages: List[LLMMessage]) -> str:
+        """
+        Stream a chat completion, stopping early after a tool-call block.
+
+        Args:
+            messages: Conversation messages to send
+
+        Returns:
+            str: Accumulated response text (complete, or truncated just
+                 after the first END_TOOL_CALL sentinel)
+        """
+        chunks = []
+        # Only the tail spanning the last two chunks can complete the
+        # sentinel, so the check stays O(chunk) instead of O(response)
+        tail = ""
+        stream = self.llm.stream_chat(messages, temperature=0.3)
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                tail = (tail + chunk)[-64:]
+                if "END_TOOL_CALL" in tail:
+                    break
+        finally:
+            await stream.aclose()
+
+        return "".join(chunks)
+
+    def _parse_tool_calls(self, response: str) -> List[Dict[str, Any]]:
+        """
+        Parse all tool calls from the LLM response.
+
+        The LLM may emit several TOOL_CALL blocks when a question needs
+        independent queries; each block is parsed separately so they can
+        be executed concurrently.
 
         Args:
             response: LLM response text
 
         Returns:
-            Optional[Dict[str, Any]]: Parsed tool call or None
+            List[Dict[str, Any]]: Parsed tool calls (empty if none found)
         """
-        # Look for TOOL_CALL pattern
-        tool_pattern = r"TOOL_CALL:\s*(\w+)\s*ARGUMENTS:\s*({.*?})\s*END_TOOL_CALL"
-        match = re.search(tool_pattern, response, re.DOTALL)
+        # Fast fail: most chat responses carry no tool call at all, so a
+        # substring check avoids any further scanning on the common path
+        if "TOOL_CALL:" not in response:
+            return []
+
+        # Structural str.find scan instead of a DOTALL regex: each marker
+        # lookup is a single C-level substring search with no backtracking.
+        # Arguments are decoded in place with raw_decode, which consumes
+        # exactly one JSON object starting at the opening brace - no payload
+        # slice, and the END_TOOL_CALL sentinel is no longer required, so
+        # blocks where the LLM forgot the closer still parse.
+        tool_calls = []
+        cursor = 0
+        while True:
+            call_idx = response.find("TOOL_CALL:", cursor)
+            if call_idx == -1:
+                break
+
+            args_idx = response.find("ARGUMENTS:", call_idx)
+            if args_idx == -1:
+                break
+            brace_idx = response.find("{", args_idx)
+            if brace_idx == -1:
+                break
 
-        if match:
-            tool_name = match.group(1).strip()
             try:
-                arguments = json.loads(match.group(2))
-                return {
-                    "tool_name": tool_name,
+                arguments, cursor = _JSON_DECODER.raw_decode(response, brace_idx)
+            except ValueError:
+                # Malformed JSON - skip past this block and keep scanning
+                cursor = args_idx + 10
+                continue
+
+            if isinstance(arguments, dict):
+                tool_calls.append({
+                    "tool_name": response[call_idx + 10:args_idx].strip(),
                     "arguments": arguments
-                }
-            except json.JSONDecodeError:
-                return None
+                })
 
-        return None
+        return tool_calls
+
+    def _parse_tool_call(self, response: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse the first tool call from the LLM response.
+
+        Args:
+            response: LLM response text
+
+        Returns:
+            Optional[Dict[str, Any]]: Parsed tool call or None
+        """
+        tool_calls = self._parse_tool_calls(response)
+        return tool_calls[0] if tool_calls else None
+
+    async def _execute_tool_call(self, tool_call: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a single parsed tool call.
+
+        Args:
+            tool_call: Parsed tool call with 'tool_name' and 'arguments'
+
+        Returns:
+            Dict[str, Any]: Execution result with status and data
+        """
+        # Special handling for SQL tool to pass LLM provider
+        if tool_call["tool_name"] == "execute_custom_sql":
+            return await execute_custom_sql_query(
+                llm_provider=self.llm,  # Pass agent's LLM provider
+                **tool_call["arguments"]
+            )
+
+        return await self.registry.execute_tool(
+            tool_call["tool_name"],
+            **tool_call["arguments"]
+        )
+
+    def _format_tool_result(self, tool_call: Dict[str, Any], tool_result: Dict[str, Any]) -> str:
+        """
+        Format a tool result message for the follow-up LLM turn.
+
+        Args:
+            tool_call: Parsed tool call with 'tool_name' and 'arguments'
+            tool_result: Execution result from the tool
+
+        Returns:
+            str: Formatted tool result message
+        """
+        if not tool_result["success"]:
+            return f"Tool '{tool_call['tool_name']}' failed: {tool_result['error']}"
+
+        # Special formatting for SQL tool results
+        if tool_call["tool_name"] == "execute_custom_sql":
+            formatted_data = format_sql_results(tool_result)
+            return f"Tool '{tool_call['tool_name']}' executed successfully.\n\n{formatted_data}"
+
+        data = tool_result["data"]
+
+        # O(1) formatter dispatch: formatters are registered alongside each
+        # tool, replacing the per-response data-shape sniffing cascade
+        formatter = self.registry.get_formatter(tool_call["tool_name"])
+        if formatter is not None and data is not None:
+            formatted_data = formatter(data)
+        else:
+            formatted_data = str(data)
+
+        return f"Tool '{tool_call['tool_name']}' executed successfully.\n\nResult:\n{formatted_data}"
 
     async def process_sql_query(
         self,
@@ -131,26 +449,48 @@ Be concise, accurate, and helpful. When presenting article results, format them
             >>> agent = Agent(llm_provider)
             >>> response = await agent.process_sql_query("Show articles from California")
         """
+        # Same first-turn caching as process_message - cached answers have
+        # a bounded TTL so database-derived results cannot go stale for long
+        first_turn = not self.conversation_history
+        if first_turn:
+            cached_response = self._response_cache.get(user_question)
+            if cached_response is not None:
+                self._remember(
+                    LLMMessage(role="user", content=user_question)
+                )
+                self._remember(
+                    LLMMessage(role="assistant", content=cached_response)
+                )
+                return cached_response
+
         # Add user message to history
-        self.conversation_history.append(
+        self._remember(
             LLMMessage(role="user", content=user_question)
         )
 
+        # Truncated once - the preview is reused by the progress update
+        # and log lines below instead of re-scanning the question per use
+        question_preview = truncate_text(user_question)
+
+        # Progress callbacks are scheduled as tasks instead of awaited
+        # inline, so slow clients never stall the request path; they are
+        # joined just before returning
+        pending_progress: List[asyncio.Task] = []
+
         try:
             # Send progress: Generating SQL
-            if progress_callback:
-                await progress_callback(
-                    "sql_generation",
-                    "Generating SQL query from your question...",
-                    {"question": truncate_text(user_question)}
-                )
+            self._emit_progress(
+                pending_progress, progress_callback,
+                "sql_generation",
+                "Generating SQL query from your question...",
+                {"question": question_preview}
+            )
 
             # Directly execute SQL tool with agent's LLM provider
-            logger.info(f"[TOOL] Executing: execute_custom_sql (forced)")
-            logger.info(f"[TOOL] Question: {truncate_text(user_question)}")
+            logger.info("[TOOL] Executing: execute_custom_sql (forced)")
+            logger.info("[TOOL] Question: %s", question_preview)
 
             # Call SQL tool function directly to pass llm_provider
-            from .tools_sql import execute_custom_sql_query
             tool_result = await execute_custom_sql_query(
                 question=user_question,
                 llm_provider=self.llm  # Pass agent's LLM provider
@@ -158,68 +498,73 @@ Be concise, accurate, and helpful. When presenting article results, format them
 
             # Log tool result
             if tool_result["success"]:
-                result_data = str(tool_result.get("data", ""))
-                logger.info(f"[TOOL] Success | Output length: {len(result_data)} chars")
+                if logger.isEnabledFor(logging.INFO):
+                    result_data = str(tool_result.get("data", ""))
+                    logger.info("[TOOL] Success | Output length: %d chars", len(result_data))
 
                 # Send progress: SQL executed successfully
-                if progress_callback:
-                    row_count = tool_result.get('row_count', 'unknown')
-                    await progress_callback(
-                        "sql_executed",
-                        f"SQL query executed successfully. Found {row_count} result(s).",
-                        {"sql": tool_result.get("sql", ""), "row_count": row_count}
-                    )
+                row_count = tool_result.get('row_count', 'unknown')
+                self._emit_progress(
+                    pending_progress, progress_callback,
+                    "sql_executed",
+                    f"SQL query executed successfully. Found {row_count} result(s).",
+                    {"sql": tool_result.get("sql", ""), "row_count": row_count}
+                )
             else:
-                logger.info(f"[TOOL] Failed | Error: {tool_result.get('error', 'Unknown error')}")
+                logger.info("[TOOL] Failed | Error: %s", tool_result.get('error', 'Unknown error'))
 
                 # Send progress: SQL execution failed
-                if progress_callback:
-                    await progress_callback(
-                        "sql_error",
-                        f"SQL execution failed: {tool_result.get('error', 'Unknown error')}",
-                        {"error": tool_result.get("error")}
-                    )
+                self._emit_progress(
+                    pending_progress, progress_callback,
+                    "sql_error",
+                    f"SQL execution failed: {tool_result.get('error', 'Unknown error')}",
+                    {"error": tool_result.get("error")}
+                )
 
             # Format SQL results
-            from .tools_sql import format_sql_results
             formatted_data = format_sql_results(tool_result)
 
             # Send progress: Generating natural language response
-            if progress_callback:
-                await progress_callback(
-                    "llm_summarizing",
-                    "Generating natural language summary of results..."
-                )
+            self._emit_progress(
+                pending_progress, progress_callback,
+                "llm_summarizing",
+                "Generating natural language summary of results..."
+            )
 
             # Send formatted results to LLM for natural language response
-            messages = [
-                LLMMessage(role="system", content=self.system_prompt),
-                *self.conversation_history,
+            messages = self._build_messages(self._system_message)
+            messages.append(
                 LLMMessage(
                     role="user",
                     content=f"SQL query results:\n\n{formatted_data}\n\nPlease provide a clear, natural language summary of these results for the user."
                 )
-            ]
+            )
 
             final_response = await self.llm.chat(messages, temperature=0.3)
             response_text = final_response.content
 
             # Add assistant response to history
-            self.conversation_history.append(
+            self._remember(
                 LLMMessage(role="assistant", content=response_text)
             )
 
+            # Only successful SQL runs are cacheable - a summary of a
+            # failed execution must not be replayed on retry
+            if first_turn and tool_result["success"]:
+                self._response_cache.put(user_question, response_text)
+            await self._drain_progress(pending_progress)
             return response_text
 
         except Exception as e:
             error_msg = f"Error executing SQL query: {str(e)}"
-            logger.error(f"[TOOL] {error_msg}")
+            logger.error("[TOOL] %s", error_msg)
 
             # Add error to history
-            self.conversation_history.append(
+            self._remember(
                 LLMMessage(role="assistant", content=error_msg)
             )
 
+            await self._drain_progress(pending_progress)
             return error_msg
 
     async def process_message(
@@ -243,134 +588,284 @@ Be concise, accurate, and helpful. When presenting article results, format them
             >>> agent = Agent(llm_provider)
             >>> response = await agent.process_message("How many articles are approved?")
         """
+        # First-turn questions can be answered straight from the response
+        # cache; later turns depend on conversation context the cache
+        # cannot see, so they always go to the LLM
+        first_turn = not self.conversation_history
+        if first_turn:
+            cached_response = self._response_cache.get(user_message)
+            if cached_response is not None:
+                self._remember(
+                    LLMMessage(role="user", content=user_message)
+                )
+                self._remember(
+                    LLMMessage(role="assistant", content=cached_response)
+                )
+                return cached_response
+
+        # Exact-match cache: a duplicate submission over an identical
+        # context returns the stored response without touching the LLM
+        cache_key = _exact_cache_key(
+            self.system_prompt, self.conversation_history, user_message
+        )
+        cached_response = _EXACT_CACHE.get(cache_key)
+        if cached_response is not None:
+            _EXACT_CACHE.move_to_end(cache_key)
+            self._remember(
+                LLMMessage(role="user", content=user_message)
+            )
+            self._remember(
+                LLMMessage(role="assistant", content=cached_response)
+            )
+            return cached_response
+
         # Add user message to history
-        self.conversation_history.append(
+        self._remember(
             LLMMessage(role="user", content=user_message)
         )
 
+        # Progress callbacks are fire-and-forget tasks, joined before
+        # each return so errors still surface without blocking the
+        # request path per update
+        pending_progress: List[asyncio.Task] = []
+
         # Send progress: Analyzing question
-        if progress_callback:
-            await progress_callback(
-                "analyzing",
-                "Analyzing your question...",
-                {"message": truncate_text(user_message)}
+        self._emit_progress(
+            pending_progress, progress_callback,
+            "analyzing",
+            "Analyzing your question...",
+            {"message": truncate_text(user_message)}
+        )
+
+        # Short-circuit: short messages with no database-related keywords
+        # (greetings, chit-chat) skip the tool catalog entirely, saving a
+        # large prompt per turn and leaving the cached tool prompt intact
+        if self._is_trivial_message(user_message):
+            messages = self._build_messages(_DIRECT_ANSWER_SYSTEM_MESSAGE)
+
+            llm_response = await self.llm.chat(messages, temperature=0.3)
+            response_text = llm_response.content
+
+            # Add assistant response to history
+            self._remember(
+                LLMMessage(role="assistant", content=response_text)
             )
 
-        # Get initial LLM response
-        messages = [
-            LLMMessage(role="system", content=self.system_prompt),
-            *self.conversation_history
-        ]
+            if first_turn:
+                self._response_cache.put(user_message, response_text)
+            self._store_exact(cache_key, response_text)
+            await self._drain_progress(pending_progress)
+            return response_text
+
+        # Get initial LLM response - the messages list is sized once and
+        # filled with a single slice assignment (see _build_messages)
+        messages = self._build_messages(self._system_message)
+
+        # Stream the response and stop as soon as a complete tool-call
+        # block has arrived: tool dispatch then costs only the tokens up
+        # to END_TOOL_CALL instead of the full message
+        response_text = await self._chat_until_tool_call(messages)
 
-        llm_response = await self.llm.chat(messages, temperature=0.3)
-        response_text = llm_response.content
+        # Check if LLM wants to call tools
+        tool_calls = self._parse_tool_calls(response_text)
 
-        # Check if LLM wants to call a tool
-        tool_call = self._parse_tool_call(response_text)
+        # Responses built on a failed tool explain a transient error;
+        # caching them would replay the failure on the retry the caches
+        # exist to speed up, so any failure below blocks both cache puts
+        tools_succeeded = True
 
-        if tool_call:
-            # Log tool execution
-            args_preview = truncate_text(json.dumps(tool_call["arguments"]))
-            logger.info(f"[TOOL] Executing: {tool_call['tool_name']}")
-            logger.info(f"[TOOL] Arguments: {args_preview}")
+        if tool_calls:
+            # Log tool execution - serialize arguments only when the
+            # record will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                for tool_call in tool_calls:
+                    logger.info("[TOOL] Executing: %s", tool_call['tool_name'])
+                    logger.info("[TOOL] Arguments: %s", truncate_text(_json_dumps(tool_call["arguments"])))
 
             # Send progress: Tool execution started
-            if progress_callback:
-                await progress_callback(
+            for tool_call in tool_calls:
+                self._emit_progress(
+                    pending_progress, progress_callback,
                     "tool_execution",
                     f"Executing tool: {tool_call['tool_name']}",
                     {"tool": tool_call['tool_name'], "arguments": tool_call["arguments"]}
                 )
 
-            # Execute the tool
-            # Special handling for SQL tool to pass LLM provider
-            if tool_call["tool_name"] == "execute_custom_sql":
-                from .tools_sql import execute_custom_sql_query
-                tool_result = await execute_custom_sql_query(
-                    llm_provider=self.llm,  # Pass agent's LLM provider
-                    **tool_call["arguments"]
-                )
-            else:
-                tool_result = await self.registry.execute_tool(
-                    tool_call["tool_name"],
-                    **tool_call["arguments"]
-                )
+            # Execute all tool calls concurrently - independent DB/SQL tools
+            # overlap their I/O, so wall time is max() instead of sum()
+            tool_results = await asyncio.gather(
+                *(self._execute_tool_call(tool_call) for tool_call in tool_calls),
+                return_exceptions=True
+            )
 
-            # Log tool result
-            if tool_result["success"]:
-                # Calculate output length based on result type
-                result_data = str(tool_result.get("data", ""))
-                logger.info(f"[TOOL] Success | Output length: {len(result_data)} chars | Preview: \"{truncate_text(result_data)}\"")
-
-                # Send progress: Tool execution succeeded
-                if progress_callback:
-                    await progress_callback(
-                        "tool_success",
-                        f"Tool '{tool_call['tool_name']}' executed successfully",
-                        {"tool": tool_call['tool_name'], "output_length": len(result_data)}
-                    )
-            else:
-                logger.info(f"[TOOL] Failed | Error: {tool_result.get('error', 'Unknown error')}")
+            # Normalize unexpected exceptions to the standard failure shape
+            tool_results = [
+                result if not isinstance(result, Exception)
+                else {"success": False, "error": str(result), "data": None}
+                for result in tool_results
+            ]
+
+            tools_succeeded = all(result["success"] for result in tool_results)
+
+            # Log tool results
+            for tool_call, tool_result in zip(tool_calls, tool_results):
+                if tool_result["success"]:
+                    # Stringify the payload for measurement only when a
+                    # consumer (log record or progress update) needs it
+                    if logger.isEnabledFor(logging.INFO):
+                        result_data = str(tool_result.get("data", ""))
+                        logger.info("[TOOL] Success | Output length: %d chars | Preview: \"%s\"", len(result_data), truncate_text(result_data))
+
+                    # Send progress: Tool execution succeeded
+                    if progress_callback:
+                        data = tool_result.get("data", "")
+                        output_length = len(data) if isinstance(data, (str, list, dict)) else len(str(data))
+                        self._emit_progress(
+                            pending_progress, progress_callback,
+                            "tool_success",
+                            f"Tool '{tool_call['tool_name']}' executed successfully",
+                            {"tool": tool_call['tool_name'], "output_length": output_length}
+                        )
+                else:
+                    logger.info("[TOOL] Failed | Error: %s", tool_result.get('error', 'Unknown error'))
 
-                # Send progress: Tool execution failed
-                if progress_callback:
-                    await progress_callback(
+                    # Send progress: Tool execution failed
+                    self._emit_progress(
+                        pending_progress, progress_callback,
                         "tool_error",
                         f"Tool '{tool_call['tool_name']}' failed: {tool_result.get('error', 'Unknown error')}",
                         {"tool": tool_call['tool_name'], "error": tool_result.get("error")}
                     )
 
-            # Format tool result for LLM
-            if tool_result["success"]:
-                # Special formatting for SQL tool results
-                if tool_call["tool_name"] == "execute_custom_sql":
-                    from .tools_sql import format_sql_results
-                    formatted_data = format_sql_results(tool_result)
-                    tool_result_message = f"Tool '{tool_call['tool_name']}' executed successfully.\n\n{formatted_data}"
-                else:
-                    data = tool_result["data"]
-
-                    # Special formatting for article lists
-                    if isinstance(data, list) and data and isinstance(data[0], dict):
-                        if "headlineForPdfReport" in data[0]:
-                            formatted_data = format_articles_list(data)
-                        else:
-                            formatted_data = json.dumps(data, indent=2)
-                    elif isinstance(data, dict) and "headlineForPdfReport" in data:
-                        from .tools_articles import format_article_for_display
-                        formatted_data = format_article_for_display(data)
-                    else:
-                        formatted_data = str(data)
-
-                    tool_result_message = f"Tool '{tool_call['tool_name']}' executed successfully.\n\nResult:\n{formatted_data}"
-            else:
-                tool_result_message = f"Tool '{tool_call['tool_name']}' failed: {tool_result['error']}"
-
-            # Send tool result back to LLM for final response
-            messages.append(
-                LLMMessage(role="assistant", content=response_text)
-            )
-            messages.append(
-                LLMMessage(role="user", content=tool_result_message)
+            # Format tool results for LLM
+            tool_result_message = "\n\n".join(
+                self._format_tool_result(tool_call, tool_result)
+                for tool_call, tool_result in zip(tool_calls, tool_results)
             )
 
+            # Send tool result back to LLM for final response, and persist
+            # the same turns verbatim into the conversation history: the
+            # next request's prompt is then a strict byte-extension of this
+            # one, so provider-side prefix/KV caches keep their hits.
+            # History must never be summarized or rewritten for the same
+            # reason.
+            tool_call_message = LLMMessage(role="assistant", content=response_text)
+            tool_result_llm_message = LLMMessage(role="user", content=tool_result_message)
+            messages.append(tool_call_message)
+            messages.append(tool_result_llm_message)
+            self._remember(tool_call_message)
+            self._remember(tool_result_llm_message)
+
             # Send progress: Generating final response
-            if progress_callback:
-                await progress_callback(
-                    "generating_response",
-                    "Generating final response..."
-                )
+            self._emit_progress(
+                pending_progress, progress_callback,
+                "generating_response",
+                "Generating final response..."
+            )
 
             final_response = await self.llm.chat(messages, temperature=0.3)
             response_text = final_response.content
 
         # Add assistant response to history
-        self.conversation_history.append(
+        self._remember(
             LLMMessage(role="assistant", content=response_text)
         )
 
+        if tools_succeeded:
+            if first_turn:
+                self._response_cache.put(user_message, response_text)
+            self._store_exact(cache_key, response_text)
+        await self._drain_progress(pending_progress)
         return response_text
 
+    @staticmethod
+    def _emit_progress(
+        pending: List[asyncio.Task],
+        progress_callback: Optional[callable],
+        *args
+    ) -> None:
+        """
+        Schedule a progress callback without blocking the request path.
+
+        Args:
+            pending: Task list the scheduled callback is tracked in
+            progress_callback: Optional async callback(stage, message, details)
+            *args: Arguments forwarded to the callback
+        """
+        if progress_callback:
+            pending.append(asyncio.create_task(progress_callback(*args)))
+
+    @staticmethod
+    async def _drain_progress(pending: List[asyncio.Task]) -> None:
+        """
+        Wait for all scheduled progress callbacks to finish.
+
+        Args:
+            pending: Tasks created by _emit_progress
+        """
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    def _store_exact(cache_key: str, response_text: str) -> None:
+        """
+        Store a response in the exact-match cache with LRU eviction.
+
+        Args:
+            cache_key: Context digest from _exact_cache_key
+            response_text: Final response to cache
+        """
+        _EXACT_CACHE[cache_key] = response_text
+        _EXACT_CACHE.move_to_end(cache_key)
+        while len(_EXACT_CACHE) > _EXACT_CACHE_MAX:
+            _EXACT_CACHE.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Clear the exact-match and semantic response caches."""
+        _EXACT_CACHE.clear()
+        self._response_cache.clear()
+
+    async def process_batch(
+        self,
+        messages: List[str],
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Process independent user messages concurrently.
+
+        Each message is handled by a disposable sub-agent with its own
+        conversation history, so responses don't leak between inputs.
+        Concurrency is bounded by a semaphore to stay within provider
+        rate limits while still overlapping I/O-bound LLM calls.
+
+        Args:
+            messages: List of independent user messages
+            max_concurrency: Maximum number of messages processed at once
+
+        Returns:
+            List[str]: Responses in the same order as the input messages
+
+        Example:
+            >>> responses = await agent.process_batch([
+            ...     "How many articles are approved?",
+            ...     "Show me the latest 5 articles"
+            ... ])
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def process_one(message: str) -> str:
+            async with semaphore:
+                # History-isolated sub-agent sharing this agent's LLM
+                # provider, registry, and (cached) system prompt
+                sub_agent = Agent(
+                    llm_provider=self.llm,
+                    tool_registry=self.registry,
+                    system_prompt=self.system_prompt
+                )
+                return await sub_agent.process_message(message)
+
+        return await asyncio.gather(*(process_one(m) for m in messages))
+
     async def stream_response(self, user_message: str):
         """
         Process a user message and stream the response.
@@ -386,52 +881,66 @@ Be concise, accurate, and helpful. When presenting article results, format them
             ...     print(chunk, end="", flush=True)
         """
         # Add user message to history
-        self.conversation_history.append(
+        self._remember(
             LLMMessage(role="user", content=user_message)
         )
 
         # For streaming, we'll use a simpler approach without tool calls
-        # (Tool calls don't work well with streaming)
-        messages = [
-            LLMMessage(role="system", content=self.system_prompt),
-            *self.conversation_history
-        ]
-
-        full_response = ""
-        async for chunk in self.llm.stream_generate(
-            prompt=user_message,
-            system_prompt=self.system_prompt,
-            temperature=0.3
-        ):
-            full_response += chunk
+        # (Tool calls don't work well with streaming). stream_chat keeps
+        # the [system, *history] prefix byte-identical to the non-streamed
+        # paths, so provider-side prompt/KV caching stays warm between
+        # turns instead of being reset by a history-less prompt.
+        messages = self._build_messages(self._system_message)
+
+        # Accumulate chunks in a list - repeated string concatenation is
+        # O(n^2) in chunk count for long replies, a single join is O(n)
+        chunks: List[str] = []
+        async for chunk in self.llm.stream_chat(messages, temperature=0.3):
+            chunks.append(chunk)
             yield chunk
 
         # Add complete response to history
-        self.conversation_history.append(
-            LLMMessage(role="assistant", content=full_response)
+        self._remember(
+            LLMMessage(role="assistant", content="".join(chunks))
         )
 
     def clear_history(self) -> None:
         """Clear the conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
+
+    def get_history(self) -> Tuple[LLMMessage, ...]:
+        """
+        Get a read-only snapshot of the conversation history.
+
+        Returns a tuple rather than a list copy - tuples are cheaper to
+        allocate and make it explicit that callers should not mutate
+        the history through this accessor.
 
-    def get_history(self) -> List[LLMMessage]:
+        Returns:
+            Tuple[LLMMessage, ...]: Conversation history snapshot
+        """
+        return tuple(self.conversation_history)
+
+    def history_len(self) -> int:
         """
-        Get the conversation history.
+        Get the number of messages in the conversation history.
+
+        O(1) alternative to len(get_history()) for callers that only
+        need the count - no snapshot is allocated.
 
         Returns:
-            List[LLMMessage]: Conversation history
+            int: Number of messages in history
         """
-        return self.conversation_history.copy()
+        return len(self.conversation_history)
 
-    def get_available_tools(self) -> List[str]:
+    def get_available_tools(self) -> Tuple[str, ...]:
         """
-        Get list of available tool names.
+        Get the available tool names.
 
         Returns:
-            List[str]: Tool names
+            Tuple[str, ...]: Cached tool names from the registry
         """
-        return [tool.name for tool in self.registry.list_tools()]
+        return self.registry.tool_names()
 
 
 # Factory function for easy agent creation
@@ -460,3 +969,58 @@ def create_agent(
         register_sql_tools(registry)
 
     return Agent(llm_provider=llm_provider, tool_registry=registry)
+
+
+# Per-session agent cache: sessions that reconnect reuse their agent (tool
+# registry, cached system prompt, and conversation history) instead of
+# paying full construction on every connection
+_session_agents: Dict[str, Agent] = {}
+
+# Oldest sessions are evicted once the cache is full to bound memory
+_MAX_SESSION_AGENTS = int(os.getenv("AGENT_SESSION_CACHE_SIZE", 1024))
+
+
+def get_session_agent(session_id: str, llm_provider: BaseLLMProvider) -> Agent:
+    """
+    Get (or lazily create) the agent for a session.
+
+    Args:
+        session_id: Unique session identifier (e.g., WebSocket client_id)
+        llm_provider: LLM provider to use for this session
+
+    Returns:
+        Agent: Cached or newly created agent for the session
+
+    Example:
+        >>> agent = get_session_agent(client_id, llm)
+    """
+    agent = _session_agents.get(session_id)
+
+    if agent is None:
+        # Evict the oldest session first - dicts preserve insertion order
+        if len(_session_agents) >= _MAX_SESSION_AGENTS:
+            _session_agents.pop(next(iter(_session_agents)))
+
+        agent = create_agent(llm_provider)
+        _session_agents[session_id] = agent
+    else:
+        # Honor a provider/model switch on reconnect while keeping history.
+        # The replaced provider is not closed here: provider instances are
+        # memoized per configuration and shared across sessions, and the
+        # factory closes them all at shutdown
+        agent.llm = llm_provider
+
+    return agent
+
+
+async def close_session_agents() -> None:
+    """
+    Close all cached session agents' provider resources.
+
+    Called on application shutdown so pooled HTTP connections held by
+    per-session LLM providers are released cleanly.
+    """
+    agents = list(_session_agents.values())
+    _session_agents.clear()
+    for agent in agents:
+        await agent.llm.aclose()
@@ -0,0 +1,157 @@
+"""
+Semantic response cache for Fluxion00API agent.
+
+Caches final agent responses keyed by a normalized form of the user's
+question, so case, punctuation and spacing variants ("Show articles
+from CA?" vs "show articles from CA") hit the cache. A hit returns in
+microseconds and skips the LLM round-trip entirely.
+
+Matching is deliberately exact on the normalized key. A fuzzy
+(character-similarity) layer was tried and removed: single-character
+edits are exactly where answers diverge ("user 5" vs "user 6",
+"approved" vs "unapproved"), so near-identical strings are the least
+safe to conflate, while true paraphrases score too low to hit anyway.
+
+Entries carry a TTL so answers derived from the database cannot go
+stale indefinitely. The cache only serves first-turn questions (see
+Agent.process_message) because later turns depend on conversation
+context the cache cannot see.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+# Normalized keys keep only lowercase word characters so punctuation and
+# spacing differences don't defeat exact-match hits. Memoized because the
+# same question strings recur by design (that is what the cache is for),
+# and normalization is the per-lookup preprocessing cost
+@lru_cache(maxsize=4096)
+def _normalize(text: str) -> str:
+    """
+    Normalize a query for cache keying.
+
+    Args:
+        text: Raw user question
+
+    Returns:
+        str: Lowercased text with punctuation removed and whitespace collapsed
+    """
+    return " ".join(
+        "".join(ch for ch in text.lower() if ch.isalnum() or ch.isspace()).split()
+    )
+
+
+class SemanticCache:
+    """
+    Normalized response cache with LRU eviction and per-entry TTL.
+
+    Lookup is an exact O(1) hit on the normalized key (see _normalize),
+    so only case, punctuation and spacing variants of the same question
+    share an entry - never questions differing in a digit or word.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 300.0,
+        enabled: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses before LRU eviction
+            ttl_seconds: Seconds before a cached response expires
+            enabled: If False, get() always misses and put() is a no-op
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        # key -> (response, expiry timestamp); OrderedDict gives LRU order
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str) -> Optional[str]:
+        """
+        Look up a cached response for a query.
+
+        Args:
+            query: Raw user question
+
+        Returns:
+            Optional[str]: Cached response, or None on miss/expiry
+        """
+        if not self.enabled or not self._entries:
+            return None
+
+        key = _normalize(query)
+        now = time.monotonic()
+
+        # Exact normalized hit - O(1)
+        entry = self._entries.get(key)
+        if entry is not None:
+            response, expires_at = entry
+            if now < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def put(self, query: str, response: str) -> None:
+        """
+        Store a response for a query.
+
+        Args:
+            query: Raw user question
+            response: Final agent response to cache
+        """
+        if not self.enabled:
+            return
+
+        key = _normalize(query)
+        if not key:
+            return
+
+        self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached responses and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+
+# Global cache instance shared by all agents in the process - responses
+# are keyed only by the question, which is safe because agents share the
+# same tool registry and system prompt
+_global_cache = SemanticCache(
+    max_entries=int(os.getenv("AGENT_SEMANTIC_CACHE_SIZE", 256)),
+    ttl_seconds=float(os.getenv("AGENT_SEMANTIC_CACHE_TTL", 300)),
+    enabled=os.getenv("AGENT_SEMANTIC_CACHE", "1") != "0"
+)
+
+
+def get_semantic_cache() -> SemanticCache:
+    """
+    Get the global semantic cache instance.
+
+    Returns:
+        SemanticCache: The global semantic cache
+    """
+    return _global_cache
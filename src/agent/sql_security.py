@@ -6,6 +6,7 @@ that LLM-generated SQL queries are safe to execute against the database.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 
@@ -36,6 +37,16 @@ MAX_RESULT_ROWS = 1000
 # Maximum allowed query complexity (approximate token count)
 MAX_QUERY_LENGTH = 2000
 
+# Precompiled patterns - validation runs on every LLM-generated query, so
+# avoid per-call pattern-cache lookups and re.escape work
+_FORBIDDEN_SET = frozenset(FORBIDDEN_SQL_KEYWORDS)
+_WORD_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_STRIP_RE = re.compile(r"'[^']*'|\"[^\"]*\"|--[^\n]*|/\*.*?\*/", re.DOTALL)
+_SELECT_START_RE = re.compile(r'^\s*(SELECT|WITH)\s+', re.IGNORECASE)
+_SELECT_COUNT_RE = re.compile(r'\bSELECT\b', re.IGNORECASE)
+
+_TABLE_RE = re.compile(r'\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
+
 
 class SQLSecurityError(Exception):
     """Exception raised when SQL query fails security validation."""
@@ -52,30 +63,38 @@ class SQLSecurityError(Exception):
         self.reason = reason
 
 
+def _strip_noise(sql: str) -> str:
+    """
+    Remove string literals and comments from SQL in a single pass.
+
+    One combined alternation means one linear scan and one allocation
+    instead of four separate re.sub passes.
+
+    Args:
+        sql: Raw SQL query string
+
+    Returns:
+        str: SQL with string literals and comments removed
+    """
+    return _STRIP_RE.sub('', sql)
+
+
 def validate_keyword_blocklist(sql: str) -> Dict[str, Any]:
     """
     Check if SQL contains forbidden keywords.
 
     Args:
-        sql: SQL query string
+        sql: SQL query string with literals/comments already stripped
+             (see _strip_noise) so quoted keywords don't false-positive
 
     Returns:
         Dict with 'valid' (bool) and optional 'error' (str), 'reason' (str)
     """
-    # Normalize SQL for checking
-    sql_upper = sql.upper()
-
-    # Remove string literals to avoid false positives
-    # (e.g., SELECT 'DELETE' should be allowed)
-    sql_no_strings = re.sub(r"'[^']*'", '', sql_upper)
-    sql_no_strings = re.sub(r'"[^"]*"', '', sql_no_strings)
-
-    # Check for forbidden keywords
-    for keyword in FORBIDDEN_SQL_KEYWORDS:
-        # Use word boundaries to avoid false positives
-        # (e.g., "DELETED_AT" column should be allowed)
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, sql_no_strings):
+    # Tokenize and test membership in a frozenset: one O(n) scan plus
+    # O(1) hash lookups, and whole-word tokens still allow e.g. "DELETED_AT"
+    for token in _WORD_RE.finditer(sql):
+        keyword = token.group().upper()
+        if keyword in _FORBIDDEN_SET:
             return {
                 'valid': False,
                 'error': f'Query contains forbidden SQL keyword: {keyword}',
@@ -91,18 +110,14 @@ def validate_select_only(sql: str) -> Dict[str, Any]:
     Validate that SQL is a SELECT statement only.
 
     Args:
-        sql: SQL query string
+        sql: SQL query string with literals/comments already stripped
+             (see _strip_noise)
 
     Returns:
         Dict with 'valid' (bool) and optional 'error' (str), 'reason' (str)
     """
-    # Remove comments and normalize whitespace
-    sql_clean = re.sub(r'--[^\n]*', '', sql)
-    sql_clean = re.sub(r'/\*.*?\*/', '', sql_clean, flags=re.DOTALL)
-    sql_clean = sql_clean.strip()
-
     # Check if query starts with SELECT or WITH (for CTEs)
-    if not re.match(r'^\s*(SELECT|WITH)\s+', sql_clean, re.IGNORECASE):
+    if not _SELECT_START_RE.match(sql.strip()):
         return {
             'valid': False,
             'error': 'Query must be a SELECT statement (or CTE starting with WITH)',
@@ -131,7 +146,7 @@ def validate_query_complexity(sql: str) -> Dict[str, Any]:
         }
 
     # Count subqueries (as rough complexity measure)
-    subquery_count = len(re.findall(r'\bSELECT\b', sql, re.IGNORECASE))
+    subquery_count = len(_SELECT_COUNT_RE.findall(sql))
     if subquery_count > 5:
         return {
             'valid': False,
@@ -153,8 +168,7 @@ def extract_table_names(sql: str) -> List[str]:
         List of table names found in query
     """
     # Simple pattern matching for FROM and JOIN clauses
-    pattern = r'\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)'
-    matches = re.findall(pattern, sql, re.IGNORECASE)
+    matches = _TABLE_RE.findall(sql)
     return list(set(matches))
 
 
@@ -165,6 +179,11 @@ def validate_sql_security(sql: str) -> Dict[str, Any]:
     This is the main entry point for SQL security validation.
     Runs multiple validation layers and returns comprehensive results.
 
+    Validation is pure over the query string, so results are memoized
+    with an LRU cache - LLM-generated queries often repeat verbatim
+    across retries and agent loops. Callers must treat the returned
+    dict as read-only.
+
     Args:
         sql: SQL query string
 
@@ -176,6 +195,20 @@ def validate_sql_security(sql: str) -> Dict[str, Any]:
             - 'validations' (dict): Individual validation results
             - 'metadata' (dict): Query metadata (tables, etc.)
     """
+    return _validate_sql_security_cached(sql)
+
+
+@lru_cache(maxsize=2048)
+def _validate_sql_security_cached(sql: str) -> Dict[str, Any]:
+    """
+    Cached implementation behind validate_sql_security().
+
+    Args:
+        sql: SQL query string
+
+    Returns:
+        Dict with validation results (shared across callers - read-only)
+    """
     if not sql or not sql.strip():
         return {
             'valid': False,
@@ -185,20 +218,33 @@ def validate_sql_security(sql: str) -> Dict[str, Any]:
 
     validations = {}
 
-    # Layer 1: Keyword blocklist
-    keyword_result = validate_keyword_blocklist(sql)
-    validations['keyword_blocklist'] = keyword_result
-    if not keyword_result['valid']:
+    # Cheapest checks run first so obviously-bad input is rejected
+    # before any token scanning: O(1) length test, then a head check
+    # that the statement starts with SELECT/WITH
+    if len(sql) > MAX_QUERY_LENGTH:
+        validations['complexity'] = {
+            'valid': False,
+            'error': f'Query exceeds maximum length of {MAX_QUERY_LENGTH} characters',
+            'reason': 'query_too_long'
+        }
         return {
             'valid': False,
-            'error': keyword_result['error'],
-            'reason': keyword_result['reason'],
-            'validations': validations,
-            'blocked_keyword': keyword_result.get('blocked_keyword')
+            'error': validations['complexity']['error'],
+            'reason': 'query_too_long',
+            'validations': validations
         }
 
-    # Layer 2: SELECT-only validation
-    select_result = validate_select_only(sql)
+    # Fast path for the common LLM output shape: a plain SELECT with no
+    # string literals or comments has nothing to strip, so skip the
+    # _STRIP_RE pass and validate the raw text directly
+    if "'" not in sql and '"' not in sql and '--' not in sql and '/*' not in sql:
+        sql_clean = sql
+    else:
+        # Strip string literals and comments once; all checks below
+        # operate on the cleaned text
+        sql_clean = _strip_noise(sql)
+
+    select_result = validate_select_only(sql_clean)
     validations['select_only'] = select_result
     if not select_result['valid']:
         return {
@@ -208,8 +254,50 @@ def validate_sql_security(sql: str) -> Dict[str, Any]:
             'validations': validations
         }
 
-    # Layer 3: Query complexity
-    complexity_result = validate_query_complexity(sql)
+    # Single linear sweep collects the forbidden-keyword hit and the
+    # SELECT count together instead of re-scanning the whole string per
+    # validation layer - word tokens against a frozenset beat running a
+    # 19-branch regex alternation
+    blocked_keyword = None
+    select_count = 0
+    for token in _WORD_RE.finditer(sql_clean):
+        word = token.group().upper()
+        if word in _FORBIDDEN_SET:
+            blocked_keyword = word
+            break
+        if word == 'SELECT':
+            select_count += 1
+
+    # Keyword blocklist
+    if blocked_keyword:
+        keyword_result = {
+            'valid': False,
+            'error': f'Query contains forbidden SQL keyword: {blocked_keyword}',
+            'reason': 'keyword_blocklist',
+            'blocked_keyword': blocked_keyword
+        }
+    else:
+        keyword_result = {'valid': True}
+    validations['keyword_blocklist'] = keyword_result
+    if not keyword_result['valid']:
+        return {
+            'valid': False,
+            'error': keyword_result['error'],
+            'reason': keyword_result['reason'],
+            'validations': validations,
+            'blocked_keyword': keyword_result.get('blocked_keyword')
+        }
+
+    # Query complexity (subquery count from the sweep; length already
+    # checked up front)
+    if select_count > 5:
+        complexity_result = {
+            'valid': False,
+            'error': f'Query is too complex (contains {select_count} SELECT statements)',
+            'reason': 'too_many_subqueries'
+        }
+    else:
+        complexity_result = {'valid': True}
     validations['complexity'] = complexity_result
     if not complexity_result['valid']:
         return {
@@ -232,29 +320,40 @@ def validate_sql_security(sql: str) -> Dict[str, Any]:
     }
 
 
-def enforce_result_limit(cursor, max_rows: int = MAX_RESULT_ROWS) -> List[Dict[str, Any]]:
+def enforce_result_limit(cursor, max_rows: int = MAX_RESULT_ROWS) -> Dict[str, Any]:
     """
     Fetch results with enforced row limit.
 
+    fetchmany(max_rows + 1) bounds how much of the result set is ever
+    pulled into memory, and the column-name list is built once from
+    cursor.description instead of per row via dict(row).
+
     Args:
         cursor: Database cursor after query execution
         max_rows: Maximum number of rows to fetch
 
     Returns:
-        List of result rows as dictionaries
+        Dict with 'data' (list of row dicts), 'truncated' and, when
+        truncated, 'max_rows' and 'warning'
     """
     rows = cursor.fetchmany(max_rows + 1)
+    columns = [d[0] for d in cursor.description] if cursor.description else []
 
     if len(rows) > max_rows:
         # Truncate and warn
         return {
             'truncated': True,
             'max_rows': max_rows,
-            'data': [dict(row) for row in rows[:max_rows]],
+            'data': [dict(zip(columns, row)) for row in rows[:max_rows]],
             'warning': f'Results truncated to {max_rows} rows'
         }
 
     return {
         'truncated': False,
-        'data': [dict(row) for row in rows]
+        'data': [dict(zip(columns, row)) for row in rows]
     }
+
+
+def clear_security_cache() -> None:
+    """Clear the memoized validation results (e.g. after config changes)."""
+    _validate_sql_security_cached.cache_clear()
@@ -5,13 +5,39 @@ This module provides a tool registry and execution system that allows
 the agent to call functions and use their results to answer questions.
 """
 
-from typing import Callable, Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
 import json
 import inspect
+import time
 
+# orjson (Rust) serializes the nested tool dicts several times faster
+# than the stdlib - fall back to stdlib json so the package stays
+# installable. Encoding runs once per tool at registration, but a large
+# registry still benefits at startup
+try:
+    import orjson
 
-@dataclass
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, separators=(',', ':'))
+
+
+# Shared pool for synchronous tool functions. Running them here instead of
+# inline keeps the event loop free to service other WebSocket connections
+# while a DB query runs; max_workers bounds parallelism so concurrent tools
+# don't pile up on the single sqlite connection
+_SYNC_TOOL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+
+
+@dataclass(slots=True)
 class ToolParameter:
     """Represents a parameter for a tool."""
     name: str
@@ -21,7 +47,7 @@ class ToolParameter:
     default: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Tool:
     """
     Represents a tool that the agent can use.
@@ -32,12 +58,41 @@ class Tool:
     name: str
     description: str
     function: Callable
-    parameters: List[ToolParameter] = field(default_factory=list)
+    parameters: Tuple[ToolParameter, ...] = ()
     category: str = "general"
+    formatter: Optional[Callable] = None
+    cacheable: bool = False
+
+    # Derived attributes filled in by __post_init__ - declared so slots
+    # reserves storage for them
+    _cached_dict: Dict[str, Any] = field(init=False, repr=False, default=None)
+    _cached_desc: str = field(init=False, repr=False, default="")
+    _cached_json: str = field(init=False, repr=False, default="")
+    _valid_params: frozenset = field(init=False, repr=False, default=frozenset())
+    _is_async: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self):
+        """
+        Freeze parameters and precompute derived representations.
 
-    def to_dict(self) -> Dict[str, Any]:
+        Tools are registered once at startup, so the dict and LLM-prompt
+        forms are built here and returned as cached values afterwards -
+        prompt assembly per request becomes attribute lookups.
         """
-        Convert tool to dictionary format for LLM prompts.
+        self.parameters = tuple(self.parameters)
+        self._cached_dict = self._build_dict()
+        self._cached_desc = self._build_llm_description()
+
+        self._cached_json = _json_dumps(self._cached_dict)
+
+        # Per-call execute() overhead hoisted to construction time: the
+        # valid-parameter set and the coroutine check never change
+        self._valid_params = frozenset(p.name for p in self.parameters)
+        self._is_async = inspect.iscoroutinefunction(self.function)
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """
+        Build the dictionary representation of the tool.
 
         Returns:
             Dict[str, Any]: Tool description in dictionary format
@@ -58,9 +113,9 @@ class Tool:
             ]
         }
 
-    def to_llm_description(self) -> str:
+    def _build_llm_description(self) -> str:
         """
-        Format tool description for LLM prompt.
+        Build the LLM-prompt representation of the tool.
 
         Returns:
             str: Formatted tool description
@@ -81,25 +136,61 @@ Parameters:
 {params_str}
 """.strip()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert tool to dictionary format for LLM prompts.
+
+        Returns:
+            Dict[str, Any]: Precomputed tool dictionary (treat as read-only)
+        """
+        return self._cached_dict
+
+    def to_llm_description(self) -> str:
+        """
+        Format tool description for LLM prompt.
+
+        Returns:
+            str: Precomputed tool description
+        """
+        return self._cached_desc
+
+    def to_json(self) -> str:
+        """
+        Get the tool description as a compact JSON string.
+
+        Returns:
+            str: Precomputed JSON encoding of to_dict()
+        """
+        return self._cached_json
+
     async def execute(self, **kwargs) -> Any:
         """
         Execute the tool with given arguments.
 
+        Synchronous functions are dispatched to a bounded thread pool so
+        they don't block the event loop; async functions are awaited
+        directly.
+
         Args:
             **kwargs: Tool arguments
 
         Returns:
             Any: Tool execution result
         """
-        # Filter kwargs to only include valid parameters
-        valid_params = {p.name for p in self.parameters}
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in valid_params}
+        # Filter kwargs to only include valid parameters - the common
+        # case (everything valid) skips the rebuild entirely, and the
+        # fallback uses a C-level set intersection
+        if kwargs.keys() <= self._valid_params:
+            filtered_kwargs = kwargs
+        else:
+            filtered_kwargs = {k: kwargs[k] for k in kwargs.keys() & self._valid_params}
 
-        # Check if function is async
-        if inspect.iscoroutinefunction(self.function):
+        if self._is_async:
             return await self.function(**filtered_kwargs)
-        else:
-            return self.function(**filtered_kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            _SYNC_TOOL_POOL, partial(self.function, **filtered_kwargs)
+        )
 
 
 class ToolRegistry:
@@ -114,6 +205,38 @@ class ToolRegistry:
         """Initialize the tool registry."""
         self.tools: Dict[str, Tool] = {}
 
+        # Version counter bumped on every register() so that consumers
+        # (e.g. the agent's system prompt) can cache derived strings and
+        # invalidate only when the tool set actually changes
+        self._tools_version: int = 0
+        self._system_prompt_cache: Optional[str] = None
+        self._system_prompt_version: int = -1
+        self._tools_description_cache: Optional[str] = None
+        self._tools_description_version: int = -1
+
+        # Frozen tool-name tuple kept in sync by register() so per-request
+        # callers (e.g. /api/info) don't rebuild a list every call
+        self._tool_names: Tuple[str, ...] = ()
+
+        # Category -> tools index so list_by_category is O(tools in that
+        # category) instead of a scan over every registered tool
+        self._by_category: Dict[str, List[Tool]] = {}
+
+        # Result cache for tools marked cacheable=True: the article-read
+        # tools are deterministic against the read-only DB within a short
+        # TTL, and LLM agent loops re-invoke them with identical arguments
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._result_cache_max = 256
+        self._result_cache_ttl = 30.0
+
+    def __len__(self) -> int:
+        """Number of registered tools."""
+        return len(self.tools)
+
+    def __bool__(self) -> bool:
+        """True if any tools are registered - O(1), no list copy."""
+        return bool(self.tools)
+
     def register(self, tool: Tool) -> None:
         """
         Register a tool.
@@ -121,7 +244,16 @@ class ToolRegistry:
         Args:
             tool: Tool to register
         """
+        # Re-registering a name replaces the old tool, so drop it from the
+        # category index before adding the new one
+        previous = self.tools.get(tool.name)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous)
+
         self.tools[tool.name] = tool
+        self._by_category.setdefault(tool.category, []).append(tool)
+        self._tools_version += 1
+        self._tool_names = tuple(self.tools.keys())
 
     def register_function(
         self,
@@ -129,7 +261,9 @@ class ToolRegistry:
         description: str,
         function: Callable,
         parameters: List[ToolParameter],
-        category: str = "general"
+        category: str = "general",
+        formatter: Optional[Callable] = None,
+        cacheable: bool = False
     ) -> Tool:
         """
         Register a function as a tool.
@@ -140,6 +274,10 @@ class ToolRegistry:
             function: Function to execute
             parameters: List of parameters
             category: Tool category
+            formatter: Optional callable that formats the tool's result data
+                       for display (falls back to str() if not provided)
+            cacheable: Whether results may be memoized briefly - only safe
+                       for read-only tools with deterministic output
 
         Returns:
             Tool: The registered tool
@@ -148,8 +286,10 @@ class ToolRegistry:
             name=name,
             description=description,
             function=function,
-            parameters=parameters,
-            category=category
+            parameters=tuple(parameters),
+            category=category,
+            formatter=formatter,
+            cacheable=cacheable
         )
         self.register(tool)
         return tool
@@ -166,6 +306,28 @@ class ToolRegistry:
         """
         return self.tools.get(name)
 
+    def get_formatter(self, name: str) -> Optional[Callable]:
+        """
+        Get the result formatter registered for a tool.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Optional[Callable]: Formatter function, or None if not set
+        """
+        tool = self.tools.get(name)
+        return tool.formatter if tool else None
+
+    def tool_names(self) -> Tuple[str, ...]:
+        """
+        Get the names of all registered tools.
+
+        Returns:
+            Tuple[str, ...]: Cached tuple of tool names - no per-call allocation
+        """
+        return self._tool_names
+
     def list_tools(self) -> List[Tool]:
         """
         Get list of all registered tools.
@@ -185,23 +347,46 @@ class ToolRegistry:
         Returns:
             List[Tool]: List of tools in category
         """
-        return [tool for tool in self.tools.values() if tool.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_tools_description(self) -> str:
         """
         Get formatted description of all tools for LLM prompt.
 
+        The rendered block is memoized against the registry version so
+        per-request callers don't re-assemble the same ~KB string; it is
+        rebuilt only when a tool is (re)registered.
+
         Returns:
             str: Formatted tools description
         """
+        if self._tools_description_version == self._tools_version:
+            return self._tools_description_cache
+
         if not self.tools:
-            return "No tools available."
+            description = "No tools available."
+        else:
+            description = "\n\n".join(
+                tool.to_llm_description() for tool in self.tools.values()
+            )
 
-        descriptions = []
-        for tool in self.tools.values():
-            descriptions.append(tool.to_llm_description())
+        self._tools_description_cache = description
+        self._tools_description_version = self._tools_version
+        return description
 
-        return "\n\n".join(descriptions)
+    def get_tools_json(self) -> str:
+        """
+        Get a JSON array describing all registered tools.
+
+        Joins the per-tool precomputed JSON strings, so no JSON encoding
+        happens per request.
+
+        Returns:
+            str: JSON array of tool descriptions
+        """
+        return '[' + ','.join(
+            tool.to_json() for tool in self.tools.values()
+        ) + ']'
 
     async def execute_tool(self, name: str, **kwargs) -> Dict[str, Any]:
         """
@@ -223,22 +408,73 @@ class ToolRegistry:
                 "data": None
             }
 
+        # Memoize read-only tool results briefly - agent loops often
+        # re-invoke the same tool with identical arguments. Unhashable
+        # argument values simply bypass the cache.
+        cache_key = None
+        if tool.cacheable:
+            try:
+                cache_key = (name, frozenset(kwargs.items()))
+            except TypeError:
+                cache_key = None
+
+            if cache_key is not None:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    stored_at, result = cached
+                    if time.monotonic() - stored_at < self._result_cache_ttl:
+                        self._result_cache.move_to_end(cache_key)
+                        return result
+                    del self._result_cache[cache_key]
+
         try:
             result = await tool.execute(**kwargs)
-            return {
+            response = {
                 "success": True,
                 "error": None,
                 "data": result,
                 "tool_name": name
             }
         except Exception as e:
+            # error_type gives consumers a structured code to branch or
+            # log on without parsing the message text
             return {
                 "success": False,
                 "error": str(e),
+                "error_type": type(e).__name__,
                 "data": None,
                 "tool_name": name
             }
 
+        if cache_key is not None:
+            self._result_cache[cache_key] = (time.monotonic(), response)
+            while len(self._result_cache) > self._result_cache_max:
+                self._result_cache.popitem(last=False)
+
+        return response
+
+    async def execute_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several tools concurrently.
+
+        I/O-bound tools (DB queries, LLM sub-calls) overlap, so wall time
+        approaches the slowest call instead of the sum. execute_tool
+        already traps exceptions into the result dict, so gather never
+        raises and results stay aligned with the input order.
+
+        Args:
+            calls: List of (tool_name, kwargs) pairs
+
+        Returns:
+            List[Dict[str, Any]]: Execution results in input order
+        """
+        return await asyncio.gather(
+            *(self.execute_tool(name, **kwargs) for name, kwargs in calls)
+        )
+
 
 # Global tool registry instance
 _global_registry = ToolRegistry()
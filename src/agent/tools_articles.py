@@ -5,6 +5,7 @@ This module provides tool wrappers around the ArticleApproveds query functions,
 making them accessible to the agent for answering questions about articles.
 """
 
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from src.queries.queries_approved_articles import (
     get_approved_articles_count,
@@ -17,110 +18,153 @@ from src.queries.queries_approved_articles import (
 from .tools import ToolRegistry, ToolParameter
 
 
-def register_article_tools(registry: ToolRegistry) -> None:
+def format_article_for_display(article: Dict[str, Any]) -> str:
     """
-    Register all article-related tools with the registry.
+    Format an article dictionary for display to the user.
 
     Args:
-        registry: Tool registry to register tools with
+        article: Article dictionary from query
+
+    Returns:
+        str: Formatted article string
     """
+    headline = article.get('headlineForPdfReport', 'No headline')
+    publication = article.get('publicationNameForPdfReport', 'Unknown')
+    date = article.get('publicationDateForPdfReport', 'Unknown date')
+    url = article.get('urlForPdfReport', 'No URL')
 
-    # Tool 1: Count approved articles
-    registry.register_function(
-        name="count_approved_articles",
-        description=(
+    # Truncate text if too long
+    text = article.get('textForPdfReport', '')
+    if text and len(text) > 200:
+        text = text[:200] + "..."
+
+    return f"""
+**{headline}**
+Publication: {publication}
+Date: {date}
+URL: {url}
+{f"Text: {text}" if text else ""}
+""".strip()
+
+
+def format_articles_list(articles: List[Dict[str, Any]], max_display: int = 5) -> str:
+    """
+    Format a list of articles for display to the user.
+
+    Args:
+        articles: List of article dictionaries
+        max_display: Maximum number of articles to display in full detail
+
+    Returns:
+        str: Formatted articles list
+    """
+    if not articles:
+        return "No articles found."
+
+    total = len(articles)
+    parts = [f"Found {total} article(s).\n\n"]
+
+    # Display detailed info for first few articles - islice avoids
+    # copying a slice of what may be a large result list
+    for i, article in enumerate(islice(articles, max_display)):
+        parts.append(f"--- Article {i + 1} ---\n")
+        parts.append(format_article_for_display(article))
+        parts.append("\n\n")
+
+    # If there are more articles, just mention them
+    if total > max_display:
+        parts.append(f"... and {total - max_display} more article(s).")
+
+    return "".join(parts).strip()
+
+
+# Parameter specs shared by several tools - built once at import instead
+# of re-allocated per registration block
+_IS_APPROVED_PARAM = ToolParameter(
+    name="is_approved",
+    type="boolean",
+    description="Filter by approval status (True=approved, False=rejected, None=all)",
+    required=False,
+    default=True
+)
+_LIMIT_PARAM = ToolParameter(
+    name="limit",
+    type="integer",
+    description="Maximum number of results to return",
+    required=False,
+    default=10
+)
+
+# Declarative tool table: (name, description, function, formatter, parameters).
+# register_article_tools walks this in one loop, replacing six near-identical
+# register_function blocks
+_ARTICLE_TOOLS = (
+    (
+        "count_approved_articles",
+        (
             "Get the count of approved or not-approved articles in the ArticleApproveds table. "
             "Use this when the user asks how many articles have been approved or rejected."
         ),
-        function=get_approved_articles_count,
-        parameters=[
+        get_approved_articles_count,
+        None,
+        (
             ToolParameter(
                 name="is_approved",
                 type="boolean",
                 description="True to count approved articles, False to count rejected articles",
                 required=False,
                 default=True
-            )
-        ],
-        category="articles"
-    )
-
-    # Tool 2: Search articles by text
-    registry.register_function(
-        name="search_approved_articles",
-        description=(
+            ),
+        )
+    ),
+    (
+        "search_approved_articles",
+        (
             "Search for articles by text content across headlines, publication names, "
             "article text, and knowledge manager notes. Use this when the user wants to "
             "find articles about a specific topic or keyword."
         ),
-        function=search_approved_articles_by_text,
-        parameters=[
+        search_approved_articles_by_text,
+        format_articles_list,
+        (
             ToolParameter(
                 name="search_text",
                 type="string",
                 description="Text to search for in articles",
                 required=True
             ),
-            ToolParameter(
-                name="is_approved",
-                type="boolean",
-                description="Filter by approval status (True=approved, False=rejected, None=all)",
-                required=False,
-                default=True
-            ),
-            ToolParameter(
-                name="limit",
-                type="integer",
-                description="Maximum number of results to return",
-                required=False,
-                default=10
-            )
-        ],
-        category="articles"
-    )
-
-    # Tool 3: Get articles by user
-    registry.register_function(
-        name="get_articles_by_user",
-        description=(
+            _IS_APPROVED_PARAM,
+            _LIMIT_PARAM
+        )
+    ),
+    (
+        "get_articles_by_user",
+        (
             "Get articles approved or reviewed by a specific user. "
             "Use this when the user asks about articles associated with a particular user ID."
         ),
-        function=get_approved_articles_by_user,
-        parameters=[
+        get_approved_articles_by_user,
+        format_articles_list,
+        (
             ToolParameter(
                 name="user_id",
                 type="integer",
                 description="ID of the user who approved the articles",
                 required=True
             ),
-            ToolParameter(
-                name="is_approved",
-                type="boolean",
-                description="Filter by approval status (True=approved, False=rejected, None=all)",
-                required=False,
-                default=True
-            ),
-            ToolParameter(
-                name="limit",
-                type="integer",
-                description="Maximum number of results to return",
-                required=False,
-                default=10
-            )
-        ],
-        category="articles"
-    )
-
-    # Tool 4: Get articles by date range
-    registry.register_function(
-        name="get_articles_by_date_range",
-        description=(
+            _IS_APPROVED_PARAM,
+            _LIMIT_PARAM
+        )
+    ),
+    (
+        "get_articles_by_date_range",
+        (
             "Get articles within a specific date range. "
             "Use this when the user asks about articles from a particular time period."
         ),
-        function=get_approved_articles_by_date_range,
-        parameters=[
+        get_approved_articles_by_date_range,
+        format_articles_list,
+        (
             ToolParameter(
                 name="start_date",
                 type="string",
@@ -135,66 +179,38 @@ def register_article_tools(registry: ToolRegistry) -> None:
                 required=False,
                 default=None
             ),
-            ToolParameter(
-                name="is_approved",
-                type="boolean",
-                description="Filter by approval status (True=approved, False=rejected, None=all)",
-                required=False,
-                default=True
-            ),
-            ToolParameter(
-                name="limit",
-                type="integer",
-                description="Maximum number of results to return",
-                required=False,
-                default=10
-            )
-        ],
-        category="articles"
-    )
-
-    # Tool 5: Get article by ID
-    registry.register_function(
-        name="get_article_by_id",
-        description=(
+            _IS_APPROVED_PARAM,
+            _LIMIT_PARAM
+        )
+    ),
+    (
+        "get_article_by_id",
+        (
             "Get a specific article by its ArticleApproved ID. "
             "Use this when the user asks about a specific article by ID number."
         ),
-        function=get_approved_article_by_id,
-        parameters=[
+        get_approved_article_by_id,
+        format_article_for_display,
+        (
             ToolParameter(
                 name="article_approved_id",
                 type="integer",
                 description="ID of the ArticleApproved record",
                 required=True
-            )
-        ],
-        category="articles"
-    )
-
-    # Tool 6: Get all approved articles (paginated)
-    registry.register_function(
-        name="list_approved_articles",
-        description=(
+            ),
+        )
+    ),
+    (
+        "list_approved_articles",
+        (
             "Get a list of approved articles with pagination. "
             "Use this when the user wants to see a list of articles or browse through them."
         ),
-        function=get_all_approved_articles,
-        parameters=[
-            ToolParameter(
-                name="is_approved",
-                type="boolean",
-                description="Filter by approval status (True=approved, False=rejected, None=all)",
-                required=False,
-                default=True
-            ),
-            ToolParameter(
-                name="limit",
-                type="integer",
-                description="Maximum number of results to return",
-                required=False,
-                default=10
-            ),
+        get_all_approved_articles,
+        format_articles_list,
+        (
+            _IS_APPROVED_PARAM,
+            _LIMIT_PARAM,
             ToolParameter(
                 name="offset",
                 type="integer",
@@ -202,65 +218,25 @@ def register_article_tools(registry: ToolRegistry) -> None:
                 required=False,
                 default=0
             )
-        ],
-        category="articles"
-    )
-
-
-def format_article_for_display(article: Dict[str, Any]) -> str:
-    """
-    Format an article dictionary for display to the user.
-
-    Args:
-        article: Article dictionary from query
-
-    Returns:
-        str: Formatted article string
-    """
-    headline = article.get('headlineForPdfReport', 'No headline')
-    publication = article.get('publicationNameForPdfReport', 'Unknown')
-    date = article.get('publicationDateForPdfReport', 'Unknown date')
-    url = article.get('urlForPdfReport', 'No URL')
-
-    # Truncate text if too long
-    text = article.get('textForPdfReport', '')
-    if text and len(text) > 200:
-        text = text[:200] + "..."
-
-    return f"""
-**{headline}**
-Publication: {publication}
-Date: {date}
-URL: {url}
-{f"Text: {text}" if text else ""}
-""".strip()
+        )
+    ),
+)
 
 
-def format_articles_list(articles: List[Dict[str, Any]], max_display: int = 5) -> str:
+def register_article_tools(registry: ToolRegistry) -> None:
     """
-    Format a list of articles for display to the user.
+    Register all article-related tools with the registry.
 
     Args:
-        articles: List of article dictionaries
-        max_display: Maximum number of articles to display in full detail
-
-    Returns:
-        str: Formatted articles list
+        registry: Tool registry to register tools with
     """
-    if not articles:
-        return "No articles found."
-
-    result = f"Found {len(articles)} article(s).\n\n"
-
-    # Display detailed info for first few articles
-    for i, article in enumerate(articles[:max_display]):
-        result += f"--- Article {i + 1} ---\n"
-        result += format_article_for_display(article)
-        result += "\n\n"
-
-    # If there are more articles, just mention them
-    if len(articles) > max_display:
-        remaining = len(articles) - max_display
-        result += f"... and {remaining} more article(s)."
-
-    return result.strip()
+    for name, description, function, formatter, parameters in _ARTICLE_TOOLS:
+        registry.register_function(
+            name=name,
+            description=description,
+            function=function,
+            parameters=parameters,
+            category="articles",
+            formatter=formatter,
+            cacheable=True
+        )
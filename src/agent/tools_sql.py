@@ -5,11 +5,11 @@ This module provides a fallback tool that allows the LLM to generate
 and execute custom SQL queries when pre-defined tools are insufficient.
 """
 
+import asyncio
 import re
 import sqlite3
 from pathlib import Path
-from typing import Dict, Any, Optional
-from src.database.readonly_connection import get_readonly_db
+from typing import Dict, Any, Optional, Tuple
 from .sql_security import validate_sql_security, enforce_result_limit, SQLSecurityError
 from .tools import ToolRegistry, ToolParameter
 
@@ -18,24 +18,103 @@ from .tools import ToolRegistry, ToolParameter
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 SQL_SCHEMA_PATH = PROJECT_ROOT / 'docs' / 'SQL_SCHEMA.md'
 
+# Compiled once - extract_sql_from_llm_response runs on every Text-to-SQL
+# call, so skip the per-call pattern-cache lookup and parse
+_SQL_BLOCK_RE = re.compile(r'```(?:sql)?\s*(.*?)\s*```', re.DOTALL | re.IGNORECASE)
+_SELECT_RE = re.compile(r'((?:WITH|SELECT)\s+.*?)(?:\n\n|$)', re.DOTALL | re.IGNORECASE)
+_TRAIL_SEMI_RE = re.compile(r'[;]\s*$')
+
+# (st_mtime_ns, text) of the last schema read - the file rarely changes,
+# so repeat Text-to-SQL calls cost one stat() instead of a full read
+_schema_cache: Optional[Tuple[int, str]] = None
+
+# (schema_mtime_ns, prefix, suffix) for the SQL-generation prompt. Only
+# the user question varies per call, so the multi-KB schema + instruction
+# blocks are rendered once and reused until the schema file changes
+_prompt_cache: Optional[Tuple[int, str, str]] = None
+
 
 def load_sql_schema() -> str:
     """
     Load the SQL schema reference for Text-to-SQL operations.
 
+    The file contents are cached and invalidated by mtime, so the
+    multi-KB markdown file is only re-read when it actually changes.
+
     Returns:
         str: SQL schema markdown content
 
     Raises:
         FileNotFoundError: If SQL_SCHEMA.md doesn't exist
     """
-    if not SQL_SCHEMA_PATH.exists():
+    global _schema_cache
+
+    try:
+        stat = SQL_SCHEMA_PATH.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"SQL_SCHEMA.md not found at {SQL_SCHEMA_PATH}. "
             "This file is required for Text-to-SQL functionality."
         )
 
-    return SQL_SCHEMA_PATH.read_text()
+    if _schema_cache is not None and _schema_cache[0] == stat.st_mtime_ns:
+        return _schema_cache[1]
+
+    text = SQL_SCHEMA_PATH.read_text()
+    _schema_cache = (stat.st_mtime_ns, text)
+    return text
+
+
+def invalidate_schema_cache() -> None:
+    """Drop the cached schema so the next call re-reads the file."""
+    global _schema_cache, _prompt_cache
+    _schema_cache = None
+    _prompt_cache = None
+
+
+def _build_sql_prompt(question: str) -> str:
+    """
+    Build the SQL-generation prompt for a question.
+
+    The static prefix (instructions + schema) and suffix are cached
+    against the schema file's mtime, so per call this is a stat() plus
+    one string concatenation instead of a multi-KB f-string render.
+
+    Args:
+        question: Natural language question about the database
+
+    Returns:
+        str: Complete prompt for the LLM
+
+    Raises:
+        FileNotFoundError: If SQL_SCHEMA.md doesn't exist
+    """
+    global _prompt_cache
+
+    schema = load_sql_schema()
+    mtime_ns = _schema_cache[0]
+
+    if _prompt_cache is None or _prompt_cache[0] != mtime_ns:
+        prefix = f"""You are a SQL expert. Given the following database schema and a user question, generate a SQL query to answer the question.
+
+DATABASE SCHEMA:
+{schema}
+
+USER QUESTION: """
+        suffix = """
+
+INSTRUCTIONS:
+1. Generate a SELECT query only (no INSERT, UPDATE, DELETE, etc.)
+2. Use proper SQLite syntax
+3. Include appropriate WHERE clauses, JOINs, and aggregations as needed
+4. Return ONLY the SQL query in a code block, no explanation
+5. Ensure the query is efficient and answers the question directly
+
+SQL QUERY:
+"""
+        _prompt_cache = (mtime_ns, prefix, suffix)
+
+    return _prompt_cache[1] + question + _prompt_cache[2]
 
 
 def extract_sql_from_llm_response(response: str) -> Optional[str]:
@@ -50,20 +129,26 @@ def extract_sql_from_llm_response(response: str) -> Optional[str]:
     Returns:
         Optional[str]: Extracted SQL query, or None if not found
     """
+    # Fast fail: responses without a code fence or SELECT/WITH keyword
+    # can't contain SQL, so skip the regex work entirely
+    response_upper = response.upper()
+    if ('```' not in response
+            and 'SELECT' not in response_upper
+            and 'WITH' not in response_upper):
+        return None
+
     # Try to find SQL in code blocks first
     # Pattern 1: ```sql ... ```
-    sql_block_pattern = r'```(?:sql)?\s*(.*?)\s*```'
-    match = re.search(sql_block_pattern, response, re.DOTALL | re.IGNORECASE)
+    match = _SQL_BLOCK_RE.search(response)
     if match:
         return match.group(1).strip()
 
     # Pattern 2: Look for SELECT statement directly
-    select_pattern = r'((?:WITH|SELECT)\s+.*?)(?:\n\n|$)'
-    match = re.search(select_pattern, response, re.DOTALL | re.IGNORECASE)
+    match = _SELECT_RE.search(response)
     if match:
         sql = match.group(1).strip()
         # Clean up any trailing text
-        sql = re.sub(r'[;]\s*$', '', sql)
+        sql = _TRAIL_SEMI_RE.sub('', sql)
         return sql
 
     return None
@@ -99,9 +184,10 @@ async def execute_custom_sql_query(
     from src.llm.base import BaseLLMProvider
 
     try:
-        # Load SQL schema
+        # Build the prompt - the schema read (cache miss only) happens
+        # off the event loop so concurrent requests aren't stalled behind it
         try:
-            schema = load_sql_schema()
+            prompt = await asyncio.to_thread(_build_sql_prompt, question)
         except FileNotFoundError as e:
             return {
                 'success': False,
@@ -109,24 +195,6 @@ async def execute_custom_sql_query(
                 'reason': 'schema_not_found'
             }
 
-        # Prepare prompt for LLM
-        prompt = f"""You are a SQL expert. Given the following database schema and a user question, generate a SQL query to answer the question.
-
-DATABASE SCHEMA:
-{schema}
-
-USER QUESTION: {question}
-
-INSTRUCTIONS:
-1. Generate a SELECT query only (no INSERT, UPDATE, DELETE, etc.)
-2. Use proper SQLite syntax
-3. Include appropriate WHERE clauses, JOINs, and aggregations as needed
-4. Return ONLY the SQL query in a code block, no explanation
-5. Ensure the query is efficient and answers the question directly
-
-SQL QUERY:
-"""
-
         # Use provided LLM provider or default to Ollama
         llm = llm_provider if llm_provider else get_ollama_provider()
         response = await llm.generate(
@@ -158,27 +226,28 @@ SQL QUERY:
                 'security_info': security_result
             }
 
-        # Execute query on read-only connection
+        # Execute query on read-only connection. sqlite3 blocks the
+        # calling thread, so the query runs in a worker thread and other
+        # coroutines (including concurrent tool calls) keep making
+        # progress while it executes
         try:
-            db = get_readonly_db()
-            with db.get_cursor() as cursor:
-                cursor.execute(sql)
-                result_data = enforce_result_limit(cursor)
-
-                return {
-                    'success': True,
-                    'sql': sql,
-                    'data': result_data['data'],
-                    'truncated': result_data.get('truncated', False),
-                    'warning': result_data.get('warning'),
-                    'security_info': security_result,
-                    'row_count': len(result_data['data'])
-                }
+            result_data = await asyncio.to_thread(_run_readonly_query, sql)
+
+            return {
+                'success': True,
+                'sql': sql,
+                'data': result_data['data'],
+                'truncated': result_data.get('truncated', False),
+                'warning': result_data.get('warning'),
+                'security_info': security_result,
+                'row_count': len(result_data['data'])
+            }
 
         except sqlite3.Error as e:
             return {
                 'success': False,
                 'error': f'Database error: {str(e)}',
+                'error_type': type(e).__name__,
                 'reason': 'database_error',
                 'sql': sql,
                 'security_info': security_result
@@ -188,10 +257,34 @@ SQL QUERY:
         return {
             'success': False,
             'error': f'Unexpected error: {str(e)}',
+            'error_type': type(e).__name__,
             'reason': 'unexpected_error'
         }
 
 
+def _run_readonly_query(sql: str) -> Dict[str, Any]:
+    """
+    Execute a validated query on the read-only connection (blocking).
+
+    Runs in a worker thread via asyncio.to_thread - the read-only
+    connection is created with check_same_thread=False.
+
+    Args:
+        sql: Validated SQL query
+
+    Returns:
+        Dict with 'data', 'truncated' and optional 'warning' keys
+    """
+    # Imported here rather than at module load - the database module is
+    # only needed once a Text-to-SQL query actually executes
+    from src.database.readonly_connection import get_readonly_db
+
+    db = get_readonly_db()
+    with db.get_cursor() as cursor:
+        cursor.execute(sql)
+        return enforce_result_limit(cursor)
+
+
 def format_sql_results(results: Dict[str, Any]) -> str:
     """
     Format SQL query results for display to the user.
@@ -212,38 +305,39 @@ def format_sql_results(results: Dict[str, Any]) -> str:
     sql = results['sql']
     row_count = results.get('row_count', len(data))
 
-    # Build formatted output
-    output = f"Query executed successfully. Found {row_count} result(s).\n\n"
+    # Accumulate into a list and join once - repeated str += reallocates
+    # the whole buffer, which hurts on wide multi-row results
+    parts = [f"Query executed successfully. Found {row_count} result(s).\n\n"]
 
     if results.get('truncated'):
-        output += f"⚠️ {results.get('warning', 'Results truncated')}\n\n"
+        parts.append(f"⚠️ {results.get('warning', 'Results truncated')}\n\n")
 
     # Show generated SQL
-    output += f"Generated SQL:\n```sql\n{sql}\n```\n\n"
+    parts.append(f"Generated SQL:\n```sql\n{sql}\n```\n\n")
 
     # Format results
     if not data:
-        output += "No results found."
+        parts.append("No results found.")
     elif len(data) == 1 and len(data[0]) == 1:
         # Single value result (e.g., COUNT)
         key = list(data[0].keys())[0]
         value = data[0][key]
-        output += f"Result: {value}"
+        parts.append(f"Result: {value}")
     else:
         # Table of results
-        output += "Results:\n"
+        parts.append("Results:\n")
         for i, row in enumerate(data[:10], 1):  # Show first 10 rows
-            output += f"\n--- Row {i} ---\n"
+            parts.append(f"\n--- Row {i} ---\n")
             for key, value in row.items():
                 # Truncate long values
                 if isinstance(value, str) and len(value) > 100:
                     value = value[:100] + "..."
-                output += f"{key}: {value}\n"
+                parts.append(f"{key}: {value}\n")
 
         if len(data) > 10:
-            output += f"\n... and {len(data) - 10} more row(s)"
+            parts.append(f"\n... and {len(data) - 10} more row(s)")
 
-    return output
+    return "".join(parts)
 
 
 def register_sql_tools(registry: ToolRegistry) -> None:
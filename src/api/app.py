@@ -5,6 +5,7 @@ This module provides the FastAPI application with WebSocket chat endpoints,
 static file serving, and agent integration.
 """
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
@@ -12,15 +13,14 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
 
-from src.llm import get_provider, get_provider_info
-from src.agent import create_agent
+from src.llm import get_provider, get_provider_info, close_all_providers
+from src.agent import create_agent, get_session_agent, close_session_agents
 from src.auth import authenticate_token, extract_token_from_query, JWTAuthError
+from src.utils import logger
 from .websocket import ConnectionManager, websocket_endpoint
 
-# Load environment variables
-load_dotenv(override=True)
+# Environment variables are loaded once by src/__init__.py on package import
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -83,9 +83,12 @@ async def api_info():
     Returns:
         dict: API information including available tools and supported providers
     """
-    # Create a temporary agent to get tool info (using default provider)
+    # Create a temporary agent to get tool info. The provider comes from
+    # the memoized factory, so it must not be closed here - its pooled
+    # client is shared with live connections
     llm = get_provider("ollama")
     agent = create_agent(llm)
+    available_tools = agent.get_available_tools()
 
     return {
         "name": "Fluxion00API",
@@ -101,7 +104,7 @@ async def api_info():
                 "description": "OpenAI GPT models"
             }
         },
-        "available_tools": agent.get_available_tools(),
+        "available_tools": available_tools,
         "database": {
             "path": os.getenv("PATH_TO_DATABASE"),
             "name": os.getenv("NAME_DB")
@@ -152,7 +155,7 @@ async def websocket_chat(websocket: WebSocket, client_id: str):
     try:
         llm = get_provider(provider_type, model=model)
         provider_info = get_provider_info(llm)
-        print(f"[WEBSOCKET] Creating connection with {provider_info['type']} ({provider_info['model']})")
+        logger.info("[WEBSOCKET] Creating connection with %s (%s)", provider_info['type'], provider_info['model'])
     except ValueError as e:
         await websocket.close(code=4000, reason=f"Invalid provider: {str(e)}")
         return
@@ -160,7 +163,9 @@ async def websocket_chat(websocket: WebSocket, client_id: str):
         await websocket.close(code=4000, reason=f"Provider initialization error: {str(e)}")
         return
 
-    agent = create_agent(llm)
+    # Reuse the session's cached agent when the client reconnects so the
+    # conversation history and compiled system prompt survive reconnects
+    agent = get_session_agent(client_id, llm)
 
     # Handle WebSocket connection with authenticated user
     await websocket_endpoint(websocket, client_id, manager, agent, user)
@@ -171,9 +176,13 @@ async def startup_event():
     """
     Application startup event handler.
     """
+    # Confirms uvloop is actually driving the server (run.py requests
+    # loop="uvloop") - a selector loop here means the C loop didn't load
+    loop_class = type(asyncio.get_running_loop()).__name__
     print("="*60)
     print("Fluxion00API Starting...")
     print("="*60)
+    print(f"Event loop: {loop_class}")
     print(f"Database: {os.getenv('PATH_TO_DATABASE')}/{os.getenv('NAME_DB')}")
     print(f"Ollama URL: {os.getenv('URL_BASE_OLLAMA')}")
     print(f"Static files: {STATIC_DIR}")
@@ -181,6 +190,15 @@ async def startup_event():
     print(f"Server ready! Open http://localhost:{int(os.getenv('PORT', 8000))} in your browser")
     print("="*60)
 
+    # Pre-warm the default provider's connection pool so the first user
+    # request doesn't pay the TCP/TLS handshake on its critical path.
+    # Best-effort: an unreachable endpoint shouldn't block startup
+    try:
+        await get_provider("ollama").warm_up()
+        logger.info("[STARTUP] Ollama connection pre-warmed")
+    except Exception as e:
+        logger.warning("[STARTUP] Provider warm-up skipped: %s", e)
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -188,3 +206,9 @@ async def shutdown_event():
     Application shutdown event handler.
     """
     print("\nShutting down Fluxion00API...")
+
+    # Release pooled HTTP connections held by per-session LLM providers
+    # and by the memoized factory instances (aclose is idempotent, so
+    # providers reachable both ways are closed safely once)
+    await close_session_agents()
+    await close_all_providers()
@@ -5,11 +5,110 @@ This module provides WebSocket endpoint management for real-time chat
 with the agent system.
 """
 
+import asyncio
 import json
-from typing import Dict, Set, Any
+import logging
+import time
+from typing import Dict, Iterable, Optional, Set, Any
 from fastapi import WebSocket, WebSocketDisconnect
 from src.agent import Agent
-from src.utils import logger
+from src.utils import logger, truncate_text
+
+# orjson (Rust) encodes/decodes the small per-frame dicts several times
+# faster than the stdlib - fall back to stdlib json so the package stays
+# installable. Frames stay text so the browser client keeps working
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data)
+
+
+# Constant protocol frames never change - serialize them once at import
+# so the hot paths (ping floods, malformed input) skip encoding entirely
+_PONG_FRAME = '{"type": "pong"}'
+_ERR_BAD_JSON_FRAME = '{"type": "error", "content": "Invalid message format"}'
+_ERR_NO_AGENT_FRAME = '{"type": "error", "content": "Agent not initialized"}'
+
+# Constant-shape message templates - copy() and fill one slot instead of
+# building a fresh dict literal (hash + insert per key) per message. The
+# typing frames are fully constant and reused as-is; they are only ever
+# serialized, never mutated
+_TPL_USER_ECHO = {"type": "user_echo", "content": None}
+_TPL_AGENT_MESSAGE = {"type": "agent_message", "content": None}
+_TYPING_ON = {"type": "typing", "content": True}
+_TYPING_OFF = {"type": "typing", "content": False}
+
+# Broadcasts send to this many clients per gather before yielding to the
+# event loop, so a large fan-out can't starve other connections
+_BROADCAST_BATCH_SIZE = 50
+
+# Outbound frames waiting per client before the oldest is dropped - a
+# slow consumer loses stale frames rather than stalling the agent
+_SEND_QUEUE_SIZE = 64
+
+
+class _ClientEntry:
+    """Per-client record: websocket, agent, user and outbound queue."""
+
+    __slots__ = ("websocket", "agent", "user", "send_queue", "writer_task")
+
+    def __init__(self, websocket: WebSocket, agent: Agent, user: Dict[str, Any]):
+        self.websocket = websocket
+        self.agent = agent
+        self.user = user
+        self.send_queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+        self.writer_task: Optional[asyncio.Task] = None
+
+    def enqueue(self, payload: str) -> None:
+        """
+        Queue an outbound frame without blocking.
+
+        On overflow the oldest queued frame is dropped, so a
+        backpressured TCP client sheds stale messages instead of
+        stalling the coroutine that produced them.
+
+        Args:
+            payload: Serialized frame to send
+        """
+        try:
+            self.send_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            try:
+                self.send_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self.send_queue.put_nowait(payload)
+
+
+async def _writer_loop(websocket: WebSocket, send_queue: "asyncio.Queue[str]") -> None:
+    """
+    Drain a client's send queue onto its socket.
+
+    Runs as a task per connection so socket writes never block the
+    coroutine processing the agent turn. Ends silently when the socket
+    goes away; the endpoint's disconnect handling does the cleanup.
+
+    Args:
+        websocket: WebSocket connection to write to
+        send_queue: Queue of serialized frames
+    """
+    try:
+        while True:
+            payload = await send_queue.get()
+            await websocket.send_text(payload)
+    except (WebSocketDisconnect, RuntimeError, asyncio.CancelledError):
+        pass
 
 
 class ConnectionManager:
@@ -21,9 +120,9 @@ class ConnectionManager:
 
     def __init__(self):
         """Initialize the connection manager."""
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.agents: Dict[str, Agent] = {}
-        self.users: Dict[str, Dict[str, Any]] = {}
+        # One record per client instead of three parallel dicts - every
+        # lookup on the send path is a single hash probe
+        self._clients: Dict[str, _ClientEntry] = {}
 
     async def connect(self, websocket: WebSocket, client_id: str, agent: Agent, user: Dict[str, Any]):
         """
@@ -36,9 +135,11 @@ class ConnectionManager:
             user: Authenticated user data from JWT
         """
         await websocket.accept()
-        self.active_connections[client_id] = websocket
-        self.agents[client_id] = agent
-        self.users[client_id] = user
+        entry = _ClientEntry(websocket, agent, user)
+        entry.writer_task = asyncio.create_task(
+            _writer_loop(websocket, entry.send_queue)
+        )
+        self._clients[client_id] = entry
 
     def disconnect(self, client_id: str):
         """
@@ -47,12 +148,9 @@ class ConnectionManager:
         Args:
             client_id: Client identifier to disconnect
         """
-        if client_id in self.active_connections:
-            del self.active_connections[client_id]
-        if client_id in self.agents:
-            del self.agents[client_id]
-        if client_id in self.users:
-            del self.users[client_id]
+        entry = self._clients.pop(client_id, None)
+        if entry is not None and entry.writer_task is not None:
+            entry.writer_task.cancel()
 
     async def send_message(self, client_id: str, message: Dict):
         """
@@ -62,9 +160,31 @@ class ConnectionManager:
             client_id: Client identifier
             message: Message dictionary to send
         """
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            await websocket.send_json(message)
+        entry = self._clients.get(client_id)
+        if entry is not None:
+            # Serialize here instead of send_json so the fast encoder is
+            # used when available; the writer task does the socket write
+            entry.enqueue(_json_dumps(message))
+
+    async def send_batch(self, client_id: str, messages: list):
+        """
+        Send several messages to a client in one frame.
+
+        The messages are wrapped in a single batch frame, so consecutive
+        protocol messages (e.g. echo + typing indicator) cost one
+        serialization and one socket write instead of one each. The
+        client unpacks the items in order.
+
+        Args:
+            client_id: Client identifier
+            messages: List of message dictionaries to send, in order
+        """
+        entry = self._clients.get(client_id)
+        if entry is not None:
+            entry.enqueue(_json_dumps({
+                "type": "batch",
+                "items": messages
+            }))
 
     async def send_text(self, client_id: str, text: str):
         """
@@ -74,9 +194,46 @@ class ConnectionManager:
             client_id: Client identifier
             text: Text message to send
         """
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            await websocket.send_text(text)
+        entry = self._clients.get(client_id)
+        if entry is not None:
+            entry.enqueue(text)
+
+    async def broadcast(
+        self,
+        message: Dict,
+        client_ids: Optional[Iterable[str]] = None
+    ):
+        """
+        Send one message to many clients.
+
+        The message is serialized once and handed to every target's
+        send queue in bounded batches, yielding to the event loop
+        between batches; the per-client writer tasks perform the actual
+        socket writes concurrently.
+
+        Args:
+            message: Message dictionary to send
+            client_ids: Clients to target; all active clients if None
+        """
+        if client_ids is None:
+            targets = list(self._clients.values())
+        else:
+            targets = [
+                self._clients[cid]
+                for cid in client_ids
+                if cid in self._clients
+            ]
+
+        if not targets:
+            return
+
+        payload = _json_dumps(message)
+
+        for start in range(0, len(targets), _BROADCAST_BATCH_SIZE):
+            for entry in targets[start:start + _BROADCAST_BATCH_SIZE]:
+                entry.enqueue(payload)
+            # Let other coroutines (including the writers) run between batches
+            await asyncio.sleep(0)
 
     def get_agent(self, client_id: str) -> Agent:
         """
@@ -88,7 +245,8 @@ class ConnectionManager:
         Returns:
             Agent: Agent instance for the client
         """
-        return self.agents.get(client_id)
+        entry = self._clients.get(client_id)
+        return entry.agent if entry is not None else None
 
     def get_user(self, client_id: str) -> Dict[str, Any]:
         """
@@ -100,7 +258,8 @@ class ConnectionManager:
         Returns:
             Dict: User data from JWT authentication
         """
-        return self.users.get(client_id)
+        entry = self._clients.get(client_id)
+        return entry.user if entry is not None else None
 
     def get_connection_count(self) -> int:
         """
@@ -109,7 +268,7 @@ class ConnectionManager:
         Returns:
             int: Number of active connections
         """
-        return len(self.active_connections)
+        return len(self._clients)
 
 
 async def send_progress(
@@ -129,8 +288,6 @@ async def send_progress(
         message: Human-readable progress message
         details: Optional additional details
     """
-    import time
-
     progress_message = {
         "type": "agent_progress",
         "stage": stage,
@@ -165,10 +322,7 @@ async def handle_chat_message(
 
     agent = manager.get_agent(client_id)
     if not agent:
-        await manager.send_message(client_id, {
-            "type": "error",
-            "content": "Agent not initialized"
-        })
+        await manager.send_text(client_id, _ERR_NO_AGENT_FRAME)
         return
 
     # Get user context for logging
@@ -176,34 +330,36 @@ async def handle_chat_message(
     username = user.get('username', 'Unknown') if user else 'Unknown'
 
     if message_type == "user_message":
-        # Check for /sql command prefix
+        # Check for /sql command prefix - one lstrip and an indexed test
+        # instead of stripping the (possibly long) message three times
         use_sql_mode = False
         sql_query = content
 
-        if content.strip().startswith('/sql'):
+        # Guard the per-message log lines so the f-string interpolation
+        # and truncate_text pass are skipped entirely when INFO is off
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        stripped = content.lstrip()
+        if stripped.startswith('/sql') and (len(stripped) == 4 or stripped[4].isspace()):
             use_sql_mode = True
-            sql_query = content.strip()[4:].strip()  # Remove '/sql ' prefix
-            logger.info(f"[AGENT] {username} (client_id: {client_id}) | SQL mode triggered by /sql prefix")
+            sql_query = stripped[4:].strip()  # Remove '/sql ' prefix
+            if log_info:
+                logger.info("[AGENT] %s (client_id: %s) | SQL mode triggered by /sql prefix", username, client_id)
         elif mode == "sql":
             use_sql_mode = True
-            logger.info(f"[AGENT] {username} (client_id: {client_id}) | SQL mode triggered by mode=sql")
+            if log_info:
+                logger.info("[AGENT] %s (client_id: %s) | SQL mode triggered by mode=sql", username, client_id)
 
         # Log user message
-        from src.utils import truncate_text
-        mode_indicator = "[SQL MODE] " if use_sql_mode else ""
-        logger.info(f"[AGENT] {mode_indicator}{username} (client_id: {client_id}) | Message: \"{truncate_text(sql_query if use_sql_mode else content)}\"")
+        if log_info:
+            mode_indicator = "[SQL MODE] " if use_sql_mode else ""
+            logger.info("[AGENT] %s%s (client_id: %s) | Message: \"%s\"", mode_indicator, username, client_id, truncate_text(sql_query if use_sql_mode else content))
 
-        # Send acknowledgment
-        await manager.send_message(client_id, {
-            "type": "user_echo",
-            "content": content
-        })
-
-        # Send typing indicator
-        await manager.send_message(client_id, {
-            "type": "typing",
-            "content": True
-        })
+        # Send acknowledgment and typing indicator in one frame
+        echo = _TPL_USER_ECHO.copy()
+        echo["content"] = content
+        await manager.send_batch(client_id, [echo, _TYPING_ON])
+        typing_active = True
 
         # Create progress callback
         async def progress_callback(stage: str, message: str, details: Dict = None):
@@ -223,31 +379,38 @@ async def handle_chat_message(
                 response = await agent.process_message(content, progress_callback)
 
             # Log agent response
-            logger.info(f"[AGENT] {username} (client_id: {client_id}) | Response sent | Length: {len(response)} chars")
-
-            # Send completion progress update
-            await progress_callback("completed", "Response generated")
-
-            # Send agent response
-            await manager.send_message(client_id, {
-                "type": "agent_message",
-                "content": response
-            })
+            if log_info:
+                logger.info("[AGENT] %s (client_id: %s) | Response sent | Length: %s chars", username, client_id, len(response))
+
+            # Send completion progress, the agent response and the typing
+            # stop in one frame - no separate trailing typing frame needed
+            agent_message = _TPL_AGENT_MESSAGE.copy()
+            agent_message["content"] = response
+            await manager.send_batch(client_id, [
+                {
+                    "type": "agent_progress",
+                    "stage": "completed",
+                    "message": "Response generated",
+                    "timestamp": time.time()
+                },
+                agent_message,
+                _TYPING_OFF
+            ])
+            typing_active = False
 
         except Exception as e:
             # Send error message
-            logger.error(f"[AGENT] {username} (client_id: {client_id}) | Error: {str(e)}")
+            logger.error("[AGENT] %s (client_id: %s) | Error: %s", username, client_id, str(e))
             await manager.send_message(client_id, {
                 "type": "error",
                 "content": f"Error processing message: {str(e)}"
             })
 
         finally:
-            # Stop typing indicator
-            await manager.send_message(client_id, {
-                "type": "typing",
-                "content": False
-            })
+            # Stop typing indicator - only needed on the error path, the
+            # success batch above already carried the stop
+            if typing_active:
+                await manager.send_message(client_id, _TYPING_OFF)
 
     elif message_type == "clear_history":
         # Clear conversation history
@@ -258,10 +421,8 @@ async def handle_chat_message(
         })
 
     elif message_type == "ping":
-        # Respond to ping
-        await manager.send_message(client_id, {
-            "type": "pong"
-        })
+        # Respond to ping with the preserialized frame
+        await manager.send_text(client_id, _PONG_FRAME)
 
 
 async def websocket_endpoint(
@@ -286,7 +447,7 @@ async def websocket_endpoint(
     # Log connection
     username = user.get('username', 'User')
     user_id = user.get('id', 'Unknown')
-    logger.info(f"[WEBSOCKET] User connected: {username} (ID: {user_id}, client_id: {client_id})")
+    logger.info("[WEBSOCKET] User connected: %s (ID: %s, client_id: %s)", username, user_id, client_id)
 
     try:
         # Send welcome message with username
@@ -295,24 +456,31 @@ async def websocket_endpoint(
             "content": f"Welcome {username}! Connected to Fluxion00API. How can I help you today?"
         })
 
-        # Message loop
-        while True:
-            # Receive message
-            data = await websocket.receive_text()
+        # Message loop - iter_text handles the disconnect internally and
+        # ends the iteration, so there is no per-message try/except for
+        # WebSocketDisconnect
+        async for data in websocket.iter_text():
+            # Heartbeat fast path: the client's ping frame is a fixed
+            # string, so an equality check (a C-level memcmp) replaces
+            # the JSON decode and handler dispatch on the most frequent
+            # frame
+            if data == '{"type":"ping"}':
+                await manager.send_text(client_id, _PONG_FRAME)
+                continue
 
             try:
-                message = json.loads(data)
+                message = _json_loads(data)
                 await handle_chat_message(websocket, client_id, manager, message)
-            except json.JSONDecodeError:
-                await manager.send_message(client_id, {
-                    "type": "error",
-                    "content": "Invalid message format"
-                })
+            except ValueError:
+                await manager.send_text(client_id, _ERR_BAD_JSON_FRAME)
+
+        logger.info("[WEBSOCKET] User disconnected: %s (client_id: %s)", username, client_id)
+        manager.disconnect(client_id)
 
     except WebSocketDisconnect:
-        logger.info(f"[WEBSOCKET] User disconnected: {username} (client_id: {client_id})")
+        logger.info("[WEBSOCKET] User disconnected: %s (client_id: %s)", username, client_id)
         manager.disconnect(client_id)
 
     except Exception as e:
-        logger.error(f"[WEBSOCKET] Connection error for {username} (client_id: {client_id}): {e}")
+        logger.error("[WEBSOCKET] Connection error for %s (client_id: %s): %s", username, client_id, e)
         manager.disconnect(client_id)
@@ -10,6 +10,7 @@ from .jwt_handler import (
     verify_token,
     verify_user_exists,
     authenticate_token,
+    clear_auth_cache,
     extract_token_from_query
 )
 
@@ -18,5 +19,6 @@ __all__ = [
     'verify_token',
     'verify_user_exists',
     'authenticate_token',
+    'clear_auth_cache',
     'extract_token_from_query'
 ]
@@ -5,12 +5,34 @@ This module provides JWT token verification compatible with News Nexus API
 (ExpressJS/TypeScript) tokens using the same JWT_SECRET.
 """
 
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
+
 import jwt
 from typing import Optional, Dict, Any
 from src.database import get_db
 
 
+# Authenticated-user cache keyed by a BLAKE2 hash of the token. NN API
+# tokens have no expiration, so a successful verify + user lookup is
+# stable per token; reconnecting clients (common on flaky networks) skip
+# the HMAC verify and DB roundtrip. Hashing the key bounds memory and
+# keeps raw tokens out of the cache. Entries carry a TTL so a deleted
+# user stops authenticating within _AUTH_CACHE_TTL seconds.
+_AUTH_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_AUTH_CACHE_MAX = 4096
+_AUTH_CACHE_TTL = 300.0
+_auth_cache_lock = threading.Lock()
+
+# Decode arguments never vary - build them once instead of allocating a
+# list and dict per verify
+_JWT_ALGORITHMS = ['HS256']
+_JWT_OPTIONS = {'verify_exp': False}
+
+
 class JWTAuthError(Exception):
     """Exception raised when JWT authentication fails."""
 
@@ -27,9 +49,14 @@ class JWTAuthError(Exception):
         self.code = code
 
 
+# Secret read once per process - the environment doesn't change after
+# startup, so per-verify os.getenv lookups are wasted work
+_jwt_secret: Optional[str] = None
+
+
 def get_jwt_secret() -> str:
     """
-    Get JWT secret from environment variables.
+    Get JWT secret from environment variables (cached after first read).
 
     Returns:
         str: JWT secret key
@@ -37,12 +64,17 @@ def get_jwt_secret() -> str:
     Raises:
         ValueError: If JWT_SECRET not found in environment
     """
-    secret = os.getenv('JWT_SECRET')
-    if not secret:
-        raise ValueError(
-            "JWT_SECRET environment variable is required for authentication"
-        )
-    return secret
+    global _jwt_secret
+
+    if _jwt_secret is None:
+        secret = os.getenv('JWT_SECRET')
+        if not secret:
+            raise ValueError(
+                "JWT_SECRET environment variable is required for authentication"
+            )
+        _jwt_secret = secret
+
+    return _jwt_secret
 
 
 def verify_token(token: str) -> Dict[str, Any]:
@@ -73,12 +105,12 @@ def verify_token(token: str) -> Dict[str, Any]:
 
         # Decode and verify token
         # algorithm='HS256' matches Node.js jsonwebtoken default
-        # options={'verify_exp': False} because NN API tokens don't have expiration
+        # verify_exp is off because NN API tokens don't have expiration
         payload = jwt.decode(
             token,
             secret,
-            algorithms=['HS256'],
-            options={'verify_exp': False}
+            algorithms=_JWT_ALGORITHMS,
+            options=_JWT_OPTIONS
         )
 
         # Validate payload structure
@@ -156,6 +188,18 @@ def authenticate_token(token: str) -> Dict[str, Any]:
         >>> user = authenticate_token(token)
         >>> print(f"Authenticated user: {user['username']}")
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest() if token else None
+
+    if cache_key is not None:
+        with _auth_cache_lock:
+            cached = _AUTH_CACHE.get(cache_key)
+            if cached is not None:
+                expires_at, user = cached
+                if time.monotonic() < expires_at:
+                    _AUTH_CACHE.move_to_end(cache_key)
+                    return dict(user)
+                del _AUTH_CACHE[cache_key]
+
     # Step 1: Verify and decode token
     payload = verify_token(token)
     user_id = payload['id']
@@ -169,9 +213,21 @@ def authenticate_token(token: str) -> Dict[str, Any]:
             "user_not_found"
         )
 
+    if cache_key is not None:
+        with _auth_cache_lock:
+            _AUTH_CACHE[cache_key] = (time.monotonic() + _AUTH_CACHE_TTL, user)
+            while len(_AUTH_CACHE) > _AUTH_CACHE_MAX:
+                _AUTH_CACHE.popitem(last=False)
+
     return user
 
 
+def clear_auth_cache() -> None:
+    """Clear cached authentications (e.g. after revoking a user)."""
+    with _auth_cache_lock:
+        _AUTH_CACHE.clear()
+
+
 def extract_token_from_query(query_params: Dict[str, str]) -> Optional[str]:
     """
     Extract JWT token from query parameters.
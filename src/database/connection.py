@@ -7,6 +7,7 @@ using raw SQL queries via the sqlite3 library.
 
 import sqlite3
 import os
+import threading
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
@@ -34,6 +35,18 @@ class DatabaseConnection:
 
         self.full_path = Path(self.db_path) / self.db_name
 
+        # Cached long-lived connection (created lazily) plus a lock that
+        # serializes cursor use - opening a fresh connection per query
+        # costs open/mmap/close syscalls that dwarf the small SELECTs
+        # this class serves
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_lock = threading.Lock()
+
+        # Bumped by close() so callers caching connection-scoped state
+        # (e.g. the temp-schema FTS index) can tell that a reconnect
+        # discarded it (same pattern as readonly_connection.py)
+        self._generation = 0
+
     def get_connection(self) -> sqlite3.Connection:
         """
         Create and return a new database connection.
@@ -50,14 +63,70 @@ class DatabaseConnection:
 
         # Enable row factory for dict-like access
         conn = sqlite3.connect(str(self.full_path))
+        self._apply_read_pragmas(conn)
         conn.row_factory = sqlite3.Row
         return conn
 
+    @staticmethod
+    def _apply_read_pragmas(conn: sqlite3.Connection) -> None:
+        """
+        Apply per-connection read-side tuning pragmas.
+
+        Memory-maps the file so hot pages are served from the page cache
+        instead of pread() syscalls, grows the page cache (-64 MB) and
+        keeps temp structures in memory. These are per-connection
+        settings; nothing that persists into the shared NewsNexus
+        database file (e.g. journal_mode) is touched - that file belongs
+        to another application.
+
+        Args:
+            conn: Freshly opened SQLite connection to tune
+        """
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    def connect(self) -> sqlite3.Connection:
+        """
+        Get the cached long-lived connection, creating it on first use.
+
+        Returns:
+            sqlite3.Connection: Shared database connection object
+
+        Raises:
+            FileNotFoundError: If database file doesn't exist
+            sqlite3.Error: If connection fails
+        """
+        if self._connection is None:
+            if not self.full_path.exists():
+                raise FileNotFoundError(f"Database file not found: {self.full_path}")
+
+            # check_same_thread=False because queries run from the tool
+            # thread pool; the lock in get_cursor serializes access.
+            # cached_statements is raised so recurring parameterized
+            # statements (the per-connect Users lookup, query-function
+            # SQL) keep their prepared plans warm
+            self._connection = sqlite3.connect(
+                str(self.full_path),
+                check_same_thread=False,
+                cached_statements=256
+            )
+
+            self._apply_read_pragmas(self._connection)
+
+            self._connection.row_factory = sqlite3.Row
+
+        return self._connection
+
     @contextmanager
     def get_cursor(self):
         """
         Context manager for database operations.
 
+        Reuses one cached connection instead of opening and closing a
+        new one per call; the lock keeps concurrent callers (WebSocket
+        auth, tool threads) from interleaving on the shared connection.
+
         Yields:
             sqlite3.Cursor: Database cursor object
 
@@ -66,17 +135,35 @@ class DatabaseConnection:
                 cursor.execute("SELECT * FROM table")
                 results = cursor.fetchall()
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            cursor.close()
-            conn.close()
+        with self._connection_lock:
+            conn = self.connect()
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            finally:
+                cursor.close()
+
+    @property
+    def generation(self) -> int:
+        """
+        Monotonic counter identifying the current cached connection.
+
+        Returns:
+            int: Incremented every time close() discards the connection
+        """
+        return self._generation
+
+    def close(self):
+        """Close the cached connection (for shutdown hooks)."""
+        with self._connection_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+                self._generation += 1
 
 
 # Global database connection instance
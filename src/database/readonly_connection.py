@@ -6,11 +6,43 @@ any data modification operations from LLM-generated SQL queries.
 """
 
 import sqlite3
-from typing import Optional
+import threading
+from typing import List, Optional
 from contextlib import contextmanager
 from .connection import DatabaseConnection
 
 
+# Operations the authorizer permits for untrusted queries: reading rows,
+# running SELECT statements (including recursive CTEs) and calling SQL
+# functions. Everything else - writes, schema changes, PRAGMA, ATTACH -
+# is rejected by SQLite's own parser before execution, at C speed
+_ALLOWED_AUTHORIZER_OPS = frozenset({
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+})
+
+
+def _readonly_authorizer(action, arg1, arg2, db_name, trigger_name) -> int:
+    """
+    SQLite authorizer callback denying everything except read operations.
+
+    Args:
+        action: SQLite action code (e.g. sqlite3.SQLITE_SELECT)
+        arg1: Action-dependent argument (e.g. table name)
+        arg2: Action-dependent argument (e.g. column name)
+        db_name: Database name
+        trigger_name: Name of the innermost trigger or view
+
+    Returns:
+        int: sqlite3.SQLITE_OK for allowed operations, SQLITE_DENY otherwise
+    """
+    if action in _ALLOWED_AUTHORIZER_OPS:
+        return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+
 class ReadOnlyDatabaseConnection(DatabaseConnection):
     """
     Read-only database connection for executing untrusted SQL queries.
@@ -28,37 +60,73 @@ class ReadOnlyDatabaseConnection(DatabaseConnection):
             db_name: Database filename
         """
         super().__init__(db_path, db_name)
-        self._readonly_connection: Optional[sqlite3.Connection] = None
+
+        # One connection per worker thread: a single shared connection
+        # serializes every query on SQLite's internal mutex, while
+        # per-thread connections let concurrent SELECTs from different
+        # clients actually overlap. The list tracks every connection so
+        # close() can tear them all down
+        self._tls = threading.local()
+        self._open_connections: List[sqlite3.Connection] = []
+        self._open_lock = threading.Lock()
+        self._generation = 0
 
     def connect(self) -> sqlite3.Connection:
         """
-        Create a read-only database connection.
+        Get this thread's read-only connection, creating it on first use.
 
         Returns:
             sqlite3.Connection: Read-only database connection
         """
-        if self._readonly_connection is None:
-            # Open connection in read-only mode
-            db_uri = f"file:{self.full_path}?mode=ro"
-            self._readonly_connection = sqlite3.connect(
-                db_uri,
-                uri=True,
-                check_same_thread=False
-            )
-
-            # Enable query_only pragma for extra safety
-            # This prevents write operations at SQLite engine level
-            try:
-                self._readonly_connection.execute("PRAGMA query_only = ON")
-            except sqlite3.OperationalError:
-                # Some SQLite versions don't support query_only pragma
-                # The read-only file mode is still enforced
-                pass
-
-            # Return rows as dictionaries
-            self._readonly_connection.row_factory = sqlite3.Row
-
-        return self._readonly_connection
+        connection = getattr(self._tls, 'connection', None)
+        if connection is not None and self._tls.generation == self._generation:
+            return connection
+
+        # Open connection in read-only mode. cached_statements is
+        # raised from the default 128 so recurring LLM-generated
+        # query texts reuse their prepared plans instead of being
+        # re-parsed and re-planned
+        # check_same_thread=False only so close() can tear connections
+        # down from the shutdown thread - each connection is still used
+        # by exactly one worker thread for queries
+        db_uri = f"file:{self.full_path}?mode=ro"
+        connection = sqlite3.connect(
+            db_uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256
+        )
+
+        # Enable query_only pragma for extra safety
+        # This prevents write operations at SQLite engine level
+        try:
+            connection.execute("PRAGMA query_only = ON")
+        except sqlite3.OperationalError:
+            # Some SQLite versions don't support query_only pragma
+            # The read-only file mode is still enforced
+            pass
+
+        # Per-connection read tuning (must run before the authorizer
+        # is installed, which denies PRAGMA statements): mmap the
+        # file and enlarge the page cache for repeated scans
+        connection.execute("PRAGMA mmap_size=268435456")
+        connection.execute("PRAGMA cache_size=-65536")
+        connection.execute("PRAGMA temp_store=MEMORY")
+
+        # Authoritative gate: SQLite's authorizer rejects disallowed
+        # operations at the parser level, regardless of what the
+        # regex/keyword validation layer concluded
+        connection.set_authorizer(_readonly_authorizer)
+
+        # Return rows as dictionaries
+        connection.row_factory = sqlite3.Row
+
+        self._tls.connection = connection
+        self._tls.generation = self._generation
+        with self._open_lock:
+            self._open_connections.append(connection)
+
+        return connection
 
     @contextmanager
     def get_cursor(self):
@@ -76,10 +144,14 @@ class ReadOnlyDatabaseConnection(DatabaseConnection):
             cursor.close()
 
     def close(self):
-        """Close the read-only database connection."""
-        if self._readonly_connection:
-            self._readonly_connection.close()
-            self._readonly_connection = None
+        """Close all threads' read-only connections."""
+        with self._open_lock:
+            # Bump the generation so threads still holding a reference
+            # reopen on their next connect() instead of using a closed one
+            self._generation += 1
+            for connection in self._open_connections:
+                connection.close()
+            self._open_connections.clear()
 
 
 # Global read-only database instance
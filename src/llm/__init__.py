@@ -2,21 +2,58 @@
 LLM integration module for Fluxion00API.
 
 This module provides interfaces and implementations for various LLM providers.
+
+Exports are resolved lazily (PEP 562): importing the package costs only
+this file, and the provider modules - which pull in httpx's transport
+stack and orjson - load on first attribute access. Code that only needs
+the lightweight pieces (LLMMessage, the cache, the rate limiter) never
+pays for the HTTP stack, which trims cold-start for short-lived workers.
 """
 
-from .base import BaseLLMProvider, LLMMessage, LLMResponse
-from .ollama_client import OllamaProvider, get_ollama_provider
-from .openai_client import OpenAIProvider, get_openai_provider
-from .provider_factory import get_provider, get_provider_info
-
-__all__ = [
-    "BaseLLMProvider",
-    "LLMMessage",
-    "LLMResponse",
-    "OllamaProvider",
-    "get_ollama_provider",
-    "OpenAIProvider",
-    "get_openai_provider",
-    "get_provider",
-    "get_provider_info",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Export name -> submodule it lives in
+_EXPORTS = {
+    "BaseLLMProvider": ".base",
+    "LLMMessage": ".base",
+    "LLMResponse": ".base",
+    "LLMCache": ".cache",
+    "get_llm_cache": ".cache",
+    "AsyncTokenBucket": ".rate_limit",
+    "OllamaProvider": ".ollama_client",
+    "get_ollama_provider": ".ollama_client",
+    "OpenAIProvider": ".openai_client",
+    "get_openai_provider": ".openai_client",
+    "get_provider": ".provider_factory",
+    "get_provider_info": ".provider_factory",
+    "register_provider": ".provider_factory",
+    "close_all_providers": ".provider_factory",
+    "BatchingLLMProvider": ".batching",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .base import BaseLLMProvider, LLMMessage, LLMResponse
+    from .cache import LLMCache, get_llm_cache
+    from .rate_limit import AsyncTokenBucket
+    from .ollama_client import OllamaProvider, get_ollama_provider
+    from .openai_client import OpenAIProvider, get_openai_provider
+    from .provider_factory import (
+        get_provider,
+        get_provider_info,
+        register_provider,
+        close_all_providers,
+    )
+    from .batching import BatchingLLMProvider
+
+
+def __getattr__(name):
+    """Resolve an export on first access and cache it on the package."""
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,274 @@
+"""
+Batching LLM provider wrapper for Fluxion00API.
+
+Coalesces concurrent chat() calls into a single LLM invocation. Under
+concurrent server load, each user turn pays the fixed per-request cost
+(connection, prompt ingestion) separately; marshaling several requests
+into one prompt amortizes that cost and lifts throughput past
+per-request rate limits.
+
+Usage:
+    llm = BatchingLLMProvider(get_ollama_provider())
+    agent = Agent(llm_provider=llm)
+
+The wrapper is transparent: callers still await chat() per request and
+receive their own LLMResponse. If the combined response cannot be split
+back into one answer per request, the batch falls back to individual
+calls, so correctness never depends on the model honoring the format.
+"""
+
+import asyncio
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+from .base import BaseLLMProvider, LLMMessage, LLMResponse
+
+
+# Delimiter the model is asked to emit between answers; unusual enough
+# that it should never occur in normal output
+_ANSWER_DELIMITER = "===ANSWER_BREAK==="
+
+
+class BatchingLLMProvider(BaseLLMProvider):
+    """
+    Wraps another provider and batches concurrent chat() calls.
+
+    Requests arriving within a small time window are grouped (per
+    model/temperature/max_tokens so sampling settings are preserved)
+    and sent as one marshaled prompt; the single response is split back
+    into per-request answers. A group of one is passed straight through
+    to the inner provider with no marshaling overhead.
+    """
+
+    def __init__(
+        self,
+        inner: BaseLLMProvider,
+        window_ms: float = 15.0,
+        max_batch: int = 8
+    ):
+        """
+        Initialize the batching wrapper.
+
+        Args:
+            inner: The provider that performs the actual LLM calls
+            window_ms: How long to wait for more requests before flushing
+            max_batch: Maximum requests marshaled into one LLM call
+        """
+        super().__init__(api_key=inner.api_key, base_url=inner.base_url)
+        self.inner = inner
+        self.window_ms = window_ms
+        self.max_batch = max_batch
+
+        # (messages, params, future) tuples awaiting the next flush; the
+        # drain task is started lazily because __init__ may run before an
+        # event loop exists
+        self._pending: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def chat(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Enqueue a chat request and await its (possibly batched) response.
+
+        Args:
+            messages: List of conversation messages
+            model: Model identifier (provider-specific)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse: The response for this request only
+        """
+        # Requests with provider-specific kwargs can't be safely marshaled
+        if kwargs:
+            return await self.inner.chat(
+                messages, model=model, temperature=temperature,
+                max_tokens=max_tokens, **kwargs
+            )
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((messages, (model, temperature, max_tokens), future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_after_window())
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Wait out the batching window, then flush all pending requests."""
+        await asyncio.sleep(self.window_ms / 1000.0)
+
+        pending, self._pending = self._pending, []
+
+        # Group by sampling parameters so batching never changes them
+        groups: Dict[tuple, List[tuple]] = {}
+        for request in pending:
+            groups.setdefault(request[1], []).append(request)
+
+        await asyncio.gather(
+            *(self._run_group(params, group) for params, group in groups.items())
+        )
+
+    async def _run_group(self, params: tuple, group: List[tuple]) -> None:
+        """
+        Execute one parameter-group of requests.
+
+        Args:
+            params: (model, temperature, max_tokens) shared by the group
+            group: List of (messages, params, future) tuples
+        """
+        model, temperature, max_tokens = params
+
+        # Chunk oversized groups so quality stays flat at bounded batch size
+        for start in range(0, len(group), self.max_batch):
+            batch = group[start:start + self.max_batch]
+
+            if len(batch) == 1:
+                messages, _, future = batch[0]
+                await self._settle_single(messages, params, future)
+                continue
+
+            prompt = self._marshal_prompt(batch)
+            try:
+                response = await self.inner.generate(
+                    prompt,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+                answers = [a.strip() for a in response.content.split(_ANSWER_DELIMITER)]
+            except Exception:
+                answers = []
+
+            if len(answers) == len(batch):
+                for (_, _, future), answer in zip(batch, answers):
+                    if not future.done():
+                        future.set_result(LLMResponse(
+                            content=answer,
+                            model=response.model,
+                            finish_reason=response.finish_reason
+                        ))
+            else:
+                # Model ignored the marshaling format (or the call failed) -
+                # fall back to one inner call per request
+                await asyncio.gather(
+                    *(self._settle_single(messages, params, future)
+                      for messages, _, future in batch)
+                )
+
+    async def _settle_single(self, messages, params, future) -> None:
+        """Resolve one request with a direct inner.chat call."""
+        model, temperature, max_tokens = params
+        try:
+            response = await self.inner.chat(
+                messages, model=model, temperature=temperature,
+                max_tokens=max_tokens
+            )
+            if not future.done():
+                future.set_result(response)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+
+    @staticmethod
+    def _marshal_prompt(batch: List[tuple]) -> str:
+        """
+        Render several conversations into one marshaled prompt.
+
+        Args:
+            batch: List of (messages, params, future) tuples
+
+        Returns:
+            str: Combined prompt instructing the model to answer each
+                 request and separate answers with the delimiter
+        """
+        sections = []
+        for index, (messages, _, _) in enumerate(batch, start=1):
+            rendered = "\n".join(
+                f"{message.role}: {message.content}" for message in messages
+            )
+            sections.append(f"--- Request {index} ---\n{rendered}")
+
+        requests_block = "\n\n".join(sections)
+        return (
+            f"Answer each of the following {len(batch)} independent requests.\n"
+            f"Write only the answers, in order, separated by a line containing "
+            f"exactly {_ANSWER_DELIMITER} (no delimiter after the last answer).\n\n"
+            f"{requests_block}"
+        )
+
+    async def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate a completion from a single prompt (delegated unbatched).
+
+        Args:
+            prompt: The input prompt
+            model: Model identifier (provider-specific)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            LLMResponse: The generated response
+        """
+        return await self.inner.generate(
+            prompt, model=model, temperature=temperature,
+            max_tokens=max_tokens, system_prompt=system_prompt, **kwargs
+        )
+
+    async def stream_generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion (delegated unbatched - streams can't be merged).
+
+        Args:
+            prompt: The input prompt
+            model: Model identifier (provider-specific)
+            temperature: Sampling temperature (0.0 to 1.0)
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            str: Chunks of the generated response
+        """
+        async for chunk in self.inner.stream_generate(
+            prompt, model=model, temperature=temperature,
+            max_tokens=max_tokens, system_prompt=system_prompt, **kwargs
+        ):
+            yield chunk
+
+    def get_available_models(self) -> List[str]:
+        """
+        Get list of available models from the inner provider.
+
+        Returns:
+            List[str]: List of model identifiers
+        """
+        return self.inner.get_available_models()
+
+    async def aclose(self) -> None:
+        """Close the inner provider's pooled resources."""
+        await self.inner.aclose()
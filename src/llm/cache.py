@@ -0,0 +1,176 @@
+"""
+Response cache for deterministic LLM completions.
+
+Caches LLMResponse objects keyed by a hash of the full request
+(model, prompt/messages, temperature, max_tokens) and short-circuits
+the HTTP call on a hit. Only near-deterministic requests (temperature
+at or below a configurable threshold) are cached - sampled completions
+are expected to differ between calls, so caching them would change
+behavior.
+
+Typical beneficiaries are retry loops, test runs, and classification or
+extraction pipelines that re-issue identical low-temperature prompts: a
+hit skips the entire network round-trip and its token cost.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from .base import LLMResponse
+
+
+def make_cache_key(
+    model: str,
+    content: Any,
+    temperature: float,
+    max_tokens: Optional[int]
+) -> str:
+    """
+    Build a cache key for an LLM request.
+
+    Args:
+        model: Model identifier
+        content: Prompt string or messages list (anything JSON-serializable)
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+
+    Returns:
+        str: Hex digest uniquely identifying the request
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "content": content,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """
+    LRU response cache with per-entry TTL for deterministic completions.
+
+    Lookups and stores are O(1); OrderedDict provides LRU ordering and
+    oldest-first eviction once max_entries is reached. Cached responses
+    are shared across callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600.0,
+        temperature_threshold: float = 0.0,
+        enabled: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum cached responses before LRU eviction
+            ttl_seconds: Seconds before a cached response expires
+            temperature_threshold: Requests with temperature at or below
+                this value are cacheable (default: exactly 0.0)
+            enabled: If False, get() always misses and set() is a no-op
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.temperature_threshold = temperature_threshold
+        self.enabled = enabled
+
+        # key -> (response, expiry timestamp); OrderedDict gives LRU order
+        self._entries: "OrderedDict[str, Tuple[LLMResponse, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def cacheable(self, temperature: float) -> bool:
+        """
+        Check whether a request with this temperature should be cached.
+
+        Args:
+            temperature: Sampling temperature of the request
+
+        Returns:
+            bool: True if the cache is enabled and the request is
+                  deterministic enough to cache
+        """
+        return self.enabled and temperature <= self.temperature_threshold
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            Optional[LLMResponse]: Cached response, or None on miss/expiry
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            response, expires_at = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_cache_key
+            response: Response to cache (treated as read-only thereafter)
+        """
+        if not self.enabled:
+            return
+
+        self._entries[key] = (response, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached responses and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+
+# Shared default instance - providers created without an explicit cache
+# use this one, so identical deterministic requests hit across provider
+# instances (each WebSocket connection gets its own provider)
+_default_cache = LLMCache(
+    max_entries=int(os.getenv("LLM_CACHE_SIZE", 256)),
+    ttl_seconds=float(os.getenv("LLM_CACHE_TTL", 3600)),
+    temperature_threshold=float(os.getenv("LLM_CACHE_TEMPERATURE_THRESHOLD", 0.0)),
+    enabled=os.getenv("LLM_CACHE", "1") != "0"
+)
+
+
+def get_llm_cache() -> LLMCache:
+    """
+    Get the shared default LLM response cache.
+
+    Returns:
+        LLMCache: The process-wide default cache
+    """
+    return _default_cache
@@ -5,12 +5,85 @@ This module provides integration with the OpenAI API for GPT models.
 """
 
 import os
+import time
 import httpx
 import json
 from typing import List, Optional, AsyncIterator, Dict, Any
 from .base import BaseLLMProvider, LLMMessage, LLMResponse
+from .cache import LLMCache, get_llm_cache, make_cache_key
+from .rate_limit import AsyncTokenBucket, estimate_tokens
+from .retry import async_retry
 from src.utils import logger, truncate_text
 
+# orjson (when installed) serializes and parses JSON several times faster
+# than the stdlib, which matters on the per-chunk SSE parse path
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode()
+
+    _json_loads = json.loads
+
+
+async def _iter_sse_content(response) -> AsyncIterator[str]:
+    """
+    Yield delta content from a streaming chat-completions response.
+
+    Frames SSE lines manually from raw byte chunks: aiter_lines() does
+    UTF-8 decoding and line buffering in Python per line, while a
+    bytearray splitter plus orjson on the raw bytes costs roughly one
+    Python-level call per token less on the hot path.
+
+    Args:
+        response: Open httpx streaming response
+
+    Yields:
+        str: Non-empty content deltas
+    """
+    buf = bytearray()
+    async for chunk in response.aiter_bytes():
+        buf.extend(chunk)
+        while (newline := buf.find(b"\n")) != -1:
+            line = bytes(buf[:newline]).rstrip(b"\r")
+            del buf[:newline + 1]
+            if not line.startswith(b"data: "):
+                continue
+            data_bytes = line[6:]  # Remove "data: " prefix
+
+            # [DONE] marker ends the stream
+            if data_bytes == b"[DONE]":
+                return
+
+            try:
+                data = _json_loads(data_bytes)
+            except ValueError:
+                continue
+            content = data.get("choices", [{}])[0].get("delta", {}).get("content")
+            if content:
+                yield content
+
+
+# How long a successful connection test stays vouched for (seconds).
+# Health checks poll test_connection; re-probing the endpoint on every
+# poll wastes a round-trip when one just succeeded
+_CONN_TEST_TTL = 30.0
+
+
+# Static model catalog - get_available_models returns this shared list
+# instead of allocating a fresh one per call
+_AVAILABLE_MODELS = [
+    "gpt-4o-mini",
+    "gpt-4-turbo",
+    "gpt-4",
+    "gpt-3.5-turbo",
+]
+
 
 class OpenAIProvider(BaseLLMProvider):
     """
@@ -20,12 +93,17 @@ class OpenAIProvider(BaseLLMProvider):
     like gpt-4o-mini, gpt-4-turbo, etc.
     """
 
+    PROVIDER_TYPE = "openai"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         default_model: str = "gpt-4o-mini",
-        timeout: float = 120.0
+        timeout: float = 120.0,
+        cache: Optional[LLMCache] = None,
+        keep_raw_response: bool = False,
+        prefer_http2: bool = True
     ):
         """
         Initialize the OpenAI provider.
@@ -35,11 +113,24 @@ class OpenAIProvider(BaseLLMProvider):
             base_url: Base URL for OpenAI API (reads from URL_BASE_OPENAI env var if not provided)
             default_model: Default model to use (default: "gpt-4o-mini")
             timeout: Request timeout in seconds (default: 120.0)
+            cache: Response cache for deterministic completions (defaults
+                to the shared process-wide cache; disable via LLM_CACHE=0)
+            keep_raw_response: Retain the full decoded API payload on
+                LLMResponse.raw_response (off by default - logprobs and
+                tool-call trees are pure memory overhead unless a caller
+                actually inspects them)
+            prefer_http2: Negotiate HTTP/2 so concurrent calls multiplex
+                over one TLS connection (requires the h2 package; falls
+                back to HTTP/1.1 silently when it's missing)
         """
         api_key = api_key or os.getenv('KEY_OPENAI')
         base_url = base_url or os.getenv('URL_BASE_OPENAI', 'https://api.openai.com/v1')
 
-        super().__init__(api_key=api_key, base_url=base_url)
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            cache=cache if cache is not None else get_llm_cache()
+        )
 
         if not self.api_key:
             raise ValueError(
@@ -49,59 +140,170 @@ class OpenAIProvider(BaseLLMProvider):
 
         self.default_model = default_model
         self.timeout = timeout
+        self.keep_raw_response = keep_raw_response
         self.api_endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
 
+        # Headers (including the Bearer string) never change for the life
+        # of the provider - build the dict once instead of per request
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+
+        # Monotonic deadline until which test_connection trusts its last
+        # successful probe (0.0 = never probed)
+        self._conn_ok_until = 0.0
+
+        # Client-side token buckets smooth bursts into OpenAI's allowed
+        # request and token rates instead of bouncing off 429s and paying
+        # backoff tail latency (tune via OPENAI_RPS / OPENAI_TPM)
+        self._rps_limiter = AsyncTokenBucket(
+            rate=float(os.getenv("OPENAI_RPS", 50)),
+            burst=100
+        )
+        self._tpm_limiter = AsyncTokenBucket(
+            rate=float(os.getenv("OPENAI_TPM", 100000)) / 60.0,
+            burst=10000
+        )
+
+        # One long-lived client per provider: keep-alive sockets are reused
+        # across generate/chat/stream calls instead of paying a fresh TCP +
+        # TLS handshake (~150-300ms to api.openai.com) per request. With
+        # HTTP/2 negotiated, concurrent calls additionally multiplex over a
+        # single TLS connection instead of opening N parallel sockets
+        limits = httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30.0
+        )
+        try:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=limits,
+                http2=prefer_http2
+            )
+            self.http2_enabled = prefer_http2
+        except ImportError:
+            # httpx[http2] extra (the h2 package) isn't installed -
+            # HTTP/1.1 with keep-alive still works, just without
+            # multiplexing
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+            self.http2_enabled = False
+            if prefer_http2:
+                logger.warning(
+                    "[LLM] h2 package not installed; OpenAI client falling "
+                    "back to HTTP/1.1 (pip install 'httpx[http2]' to enable "
+                    "multiplexing)"
+                )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and its keep-alive sockets."""
+        await self._client.aclose()
+
+    async def warm_up(self) -> None:
+        """
+        Open a keep-alive connection to the OpenAI endpoint.
+
+        A GET against /models (a cheap list endpoint) pays the TLS
+        handshake (~150-300ms) during startup so the first completion
+        call doesn't carry it on the user path. Failures propagate to
+        the caller, which typically gathers warm-ups with
+        return_exceptions=True.
+        """
+        await self._client.get(
+            f"{self.base_url.rstrip('/')}/models",
+            headers=self._headers,
+            timeout=5.0
+        )
+
     def _get_headers(self) -> Dict[str, str]:
         """
         Get HTTP headers for OpenAI API requests.
 
         Returns:
-            Dict[str, str]: Headers dictionary
+            Dict[str, str]: Cached headers dictionary (built in __init__)
         """
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
+        return self._headers
 
-    async def generate(
-        self,
+    async def _throttle(self, payload: Dict[str, Any]) -> None:
+        """
+        Await request and token budget before hitting the API.
+
+        Args:
+            payload: Request payload about to be sent (its messages and
+                max_tokens drive the token estimate)
+        """
+        content_chars = sum(
+            len(message.get("content") or "")
+            for message in payload.get("messages", ())
+        )
+        await self._rps_limiter.acquire()
+        await self._tpm_limiter.acquire(
+            estimate_tokens(content_chars, payload.get("max_tokens") or 0)
+        )
+
+    @staticmethod
+    def _assemble_messages(
         prompt: str,
-        model: Optional[str] = None,
-        temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
         system_prompt: Optional[str] = None,
-        **kwargs
-    ) -> LLMResponse:
+        static_context: Optional[str] = None
+    ) -> List[Dict[str, str]]:
         """
-        Generate a completion from a single prompt using OpenAI.
+        Build a messages list ordered for prompt-prefix cache hits.
+
+        OpenAI's server-side prompt caching only hits on an identical
+        token prefix, so large static content (system prompt, tool specs,
+        document context) must always come first and the dynamic user
+        input last. Mixing dynamic text into the front of the prompt
+        breaks the cache on every call.
 
         Args:
-            prompt: The input prompt
-            model: Model identifier (default: gpt-4o-mini)
-            temperature: Sampling temperature (0.0 to 2.0)
-            max_tokens: Maximum tokens to generate
-            system_prompt: Optional system prompt
-            **kwargs: Additional OpenAI-specific parameters
+            prompt: Dynamic user input (always last)
+            system_prompt: Optional system prompt (always first)
+            static_context: Optional static context block (schema, tool
+                specs, templates) emitted after the system prompt
 
         Returns:
-            LLMResponse: The generated response
-
-        Example:
-            >>> provider = OpenAIProvider()
-            >>> response = await provider.generate("Hello, how are you?")
-            >>> print(response.content)
+            List[Dict[str, str]]: Messages in [system, static, user] order
         """
-        model = model or self.default_model
-
-        # Build messages list
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
+        if static_context:
+            messages.append({"role": "system", "content": static_context})
         messages.append({"role": "user", "content": prompt})
+        return messages
 
+    @async_retry()
+    async def _request_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        extra: Dict[str, Any]
+    ) -> LLMResponse:
+        """
+        Issue a single /chat/completions request and parse the response.
+
+        Args:
+            model: Resolved model identifier
+            messages: Messages in OpenAI wire format
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate
+            extra: Additional OpenAI-specific payload fields
+
+        Returns:
+            LLMResponse: The generated response
+        """
         # Log LLM call
-        logger.info(f"[LLM] Making call to OpenAI...")
-        logger.info(f"[LLM] Model: {model} | Prompt length: {len(prompt)} chars | Preview: \"{truncate_text(prompt)}\"")
+        total_length = sum(len(msg.get("content") or "") for msg in messages)
+        preview = messages[-1].get("content", "") if messages else ""
+        logger.info("[LLM] Making call to OpenAI...")
+        logger.info(
+            '[LLM] Model: %s | Messages: %d | Total length: %d chars | Preview: "%s"',
+            model, len(messages), total_length, truncate_text(preview)
+        )
 
         # Build request payload
         payload = {
@@ -113,19 +315,22 @@ class OpenAIProvider(BaseLLMProvider):
         if max_tokens:
             payload["max_tokens"] = max_tokens
 
-        # Add any additional kwargs
-        for key, value in kwargs.items():
+        # Add any additional fields
+        for key, value in extra.items():
             payload[key] = value
 
-        # Make API request
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                self.api_endpoint,
-                json=payload,
-                headers=self._get_headers()
-            )
-            response.raise_for_status()
-            data = response.json()
+        # Smooth bursts into the configured rate before going to the wire
+        await self._throttle(payload)
+
+        # Make API request on the pooled client; payload is serialized
+        # with orjson (when available) rather than httpx's stdlib json
+        response = await self._client.post(
+            self.api_endpoint,
+            content=_json_dumps(payload),
+            headers=self._headers
+        )
+        response.raise_for_status()
+        data = _json_loads(response.content)
 
         # Parse response
         choice = data.get("choices", [{}])[0]
@@ -141,20 +346,78 @@ class OpenAIProvider(BaseLLMProvider):
                 "completion_tokens": usage.get("completion_tokens", 0),
                 "total_tokens": usage.get("total_tokens", 0)
             },
-            raw_response=data
+            raw_response=data if self.keep_raw_response else None
         )
 
         # Log response
-        logger.info(f"[LLM] Response length: {len(llm_response.content)} chars | Tokens: {usage.get('total_tokens', 0)}")
+        logger.info("[LLM] Response length: %s chars | Tokens: %s", len(llm_response.content), usage.get('total_tokens', 0))
 
         return llm_response
 
+    async def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        static_context: Optional[str] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Generate a completion from a single prompt using OpenAI.
+
+        Args:
+            prompt: The input prompt (dynamic content - always last so
+                the static prefix stays cacheable server-side)
+            model: Model identifier (default: gpt-4o-mini)
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate
+            system_prompt: Optional system prompt
+            static_context: Optional static context block (schema,
+                templates) emitted before the user prompt
+            **kwargs: Additional OpenAI-specific parameters
+
+        Returns:
+            LLMResponse: The generated response
+
+        Example:
+            >>> provider = OpenAIProvider()
+            >>> response = await provider.generate("Hello, how are you?")
+            >>> print(response.content)
+        """
+        model = model or self.default_model
+
+        # Build messages list - static content first, dynamic input last
+        messages = self._assemble_messages(prompt, system_prompt, static_context)
+
+        # Requests with provider-specific kwargs are neither cached nor
+        # coalesced - those options also shape the output
+        if kwargs or self.cache is None or not self.cache.cacheable(temperature):
+            return await self._request_completion(model, messages, temperature, max_tokens, kwargs)
+
+        # Deterministic requests are served from the response cache when
+        # possible - a hit skips the network round-trip and token cost
+        cache_key = make_cache_key(model, messages, temperature, max_tokens)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("[LLM] Response cache hit for OpenAI (%s)", model)
+            return cached
+
+        # A cache miss with an identical request already on the wire
+        # awaits that request's future instead of firing a duplicate
+        return await self._call_coalesced(
+            cache_key,
+            lambda: self._request_completion(model, messages, temperature, max_tokens, kwargs)
+        )
+
     async def chat(
         self,
         messages: List[LLMMessage],
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        static_context: Optional[str] = None,
         **kwargs
     ) -> LLMResponse:
         """
@@ -165,6 +428,9 @@ class OpenAIProvider(BaseLLMProvider):
             model: Model identifier (default: gpt-4o-mini)
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens to generate
+            static_context: Optional static context block inserted after
+                the leading system messages so the token prefix stays
+                identical across calls (see _assemble_messages)
             **kwargs: Additional OpenAI-specific parameters
 
         Returns:
@@ -185,16 +451,76 @@ class OpenAIProvider(BaseLLMProvider):
             for msg in messages
         ]
 
-        # Log LLM call
-        total_length = sum(len(msg.content) for msg in messages)
-        logger.info(f"[LLM] Making chat call to OpenAI...")
-        logger.info(f"[LLM] Model: {model} | Messages: {len(messages)} | Total length: {total_length} chars")
+        # Static context rides directly after the leading system messages,
+        # keeping the cacheable prefix ahead of the dynamic conversation
+        if static_context:
+            insert_at = 0
+            while (insert_at < len(openai_messages)
+                   and openai_messages[insert_at]["role"] == "system"):
+                insert_at += 1
+            openai_messages.insert(
+                insert_at, {"role": "system", "content": static_context}
+            )
+
+        # Requests with provider-specific kwargs are neither cached nor
+        # coalesced (see generate)
+        if kwargs or self.cache is None or not self.cache.cacheable(temperature):
+            return await self._request_completion(model, openai_messages, temperature, max_tokens, kwargs)
+
+        # Deterministic requests are served from the response cache when
+        # possible - a hit skips the network round-trip and token cost
+        cache_key = make_cache_key(model, openai_messages, temperature, max_tokens)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("[LLM] Response cache hit for OpenAI (%s)", model)
+            return cached
+
+        # A cache miss with an identical request already on the wire
+        # awaits that request's future instead of firing a duplicate
+        return await self._call_coalesced(
+            cache_key,
+            lambda: self._request_completion(model, openai_messages, temperature, max_tokens, kwargs)
+        )
+
+    async def stream_chat(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Generate a streaming completion from a conversation history.
+
+        Native override of the base helper: the full message list goes to
+        the chat completions endpoint, so the conversation prefix stays
+        byte-identical across turns and server-side prompt caching can hit.
+
+        Args:
+            messages: List of conversation messages
+            model: Model identifier (default: gpt-4o-mini)
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional OpenAI-specific parameters
+
+        Yields:
+            str: Chunks of the generated response
+        """
+        model = model or self.default_model
+
+        # Convert LLMMessage objects to OpenAI format
+        openai_messages = [
+            {"role": msg.role, "content": msg.content}
+            for msg in messages
+        ]
 
         # Build request payload
         payload = {
             "model": model,
             "messages": openai_messages,
             "temperature": temperature,
+            "stream": True  # Enable streaming
         }
 
         if max_tokens:
@@ -204,37 +530,20 @@ class OpenAIProvider(BaseLLMProvider):
         for key, value in kwargs.items():
             payload[key] = value
 
-        # Make API request
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                self.api_endpoint,
-                json=payload,
-                headers=self._get_headers()
-            )
+        # Smooth bursts into the configured rate before going to the wire
+        await self._throttle(payload)
+
+        # Make streaming API request on the pooled client; SSE frames are
+        # parsed at the byte level (see _iter_sse_content)
+        async with self._client.stream(
+            "POST",
+            self.api_endpoint,
+            content=_json_dumps(payload),
+            headers=self._headers
+        ) as response:
             response.raise_for_status()
-            data = response.json()
-
-        # Parse response
-        choice = data.get("choices", [{}])[0]
-        message = choice.get("message", {})
-        usage = data.get("usage", {})
-
-        llm_response = LLMResponse(
-            content=message.get("content", ""),
-            model=data.get("model", model),
-            finish_reason=choice.get("finish_reason"),
-            usage={
-                "prompt_tokens": usage.get("prompt_tokens", 0),
-                "completion_tokens": usage.get("completion_tokens", 0),
-                "total_tokens": usage.get("total_tokens", 0)
-            },
-            raw_response=data
-        )
-
-        # Log response
-        logger.info(f"[LLM] Response length: {len(llm_response.content)} chars | Tokens: {usage.get('total_tokens', 0)}")
-
-        return llm_response
+            async for content in _iter_sse_content(response):
+                yield content
 
     async def stream_generate(
         self,
@@ -243,6 +552,7 @@ class OpenAIProvider(BaseLLMProvider):
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         system_prompt: Optional[str] = None,
+        static_context: Optional[str] = None,
         **kwargs
     ) -> AsyncIterator[str]:
         """
@@ -254,6 +564,8 @@ class OpenAIProvider(BaseLLMProvider):
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens to generate
             system_prompt: Optional system prompt
+            static_context: Optional static context block emitted before
+                the user prompt (see _assemble_messages)
             **kwargs: Additional OpenAI-specific parameters
 
         Yields:
@@ -265,11 +577,8 @@ class OpenAIProvider(BaseLLMProvider):
         """
         model = model or self.default_model
 
-        # Build messages list
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
+        # Build messages list - static content first, dynamic input last
+        messages = self._assemble_messages(prompt, system_prompt, static_context)
 
         # Build request payload
         payload = {
@@ -286,32 +595,175 @@ class OpenAIProvider(BaseLLMProvider):
         for key, value in kwargs.items():
             payload[key] = value
 
-        # Make streaming API request
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(
-                "POST",
-                self.api_endpoint,
-                json=payload,
-                headers=self._get_headers()
-            ) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data_str = line[6:]  # Remove "data: " prefix
-
-                        # Skip [DONE] marker
-                        if data_str.strip() == "[DONE]":
-                            break
-
-                        try:
-                            data = json.loads(data_str)
-                            delta = data.get("choices", [{}])[0].get("delta", {})
-                            content = delta.get("content")
-
-                            if content:
-                                yield content
-                        except json.JSONDecodeError:
-                            continue
+        # Smooth bursts into the configured rate before going to the wire
+        await self._throttle(payload)
+
+        # Make streaming API request on the pooled client; SSE frames are
+        # parsed at the byte level (see _iter_sse_content)
+        async with self._client.stream(
+            "POST",
+            self.api_endpoint,
+            content=_json_dumps(payload),
+            headers=self._headers
+        ) as response:
+            response.raise_for_status()
+            async for content in _iter_sse_content(response):
+                yield content
+
+    async def submit_batch(self, items: List[Dict[str, Any]]) -> str:
+        """
+        Submit a JSONL batch job via OpenAI's Batch API.
+
+        For workloads that can tolerate up to 24h turnaround (backfills,
+        document analysis, eval runs) the /batches endpoint charges 50%
+        of the real-time token price and has separate, higher rate limits.
+
+        Args:
+            items: One request body per completion, each a dict in
+                   /chat/completions format ({"messages": [...], ...});
+                   "model" defaults to this provider's default model
+
+        Returns:
+            str: Batch job ID for use with poll_batch / fetch_batch_results
+
+        Example:
+            >>> batch_id = await provider.submit_batch([
+            ...     {"messages": [{"role": "user", "content": "Summarize: ..."}]}
+            ... ])
+        """
+        base = self.base_url.rstrip('/')
+
+        # One JSONL line per request; custom_id preserves ordering since
+        # the Batch API returns results in arbitrary order
+        lines = []
+        for i, body in enumerate(items):
+            body = dict(body)
+            body.setdefault("model", self.default_model)
+            lines.append(json.dumps({
+                "custom_id": f"req-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+        jsonl = "\n".join(lines).encode()
+
+        logger.info("[LLM] Submitting OpenAI batch job with %s requests...", len(items))
+
+        # Upload the JSONL as a batch-purpose file (multipart, so only the
+        # auth header - httpx sets the Content-Type boundary itself)
+        file_response = await self._client.post(
+            f"{base}/files",
+            files={"file": ("batch.jsonl", jsonl)},
+            data={"purpose": "batch"},
+            headers={"Authorization": f"Bearer {self.api_key}"}
+        )
+        file_response.raise_for_status()
+        input_file_id = file_response.json()["id"]
+
+        # Create the batch job pointing at the uploaded file
+        batch_response = await self._client.post(
+            f"{base}/batches",
+            json={
+                "input_file_id": input_file_id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h"
+            },
+            headers=self._headers
+        )
+        batch_response.raise_for_status()
+        batch_id = batch_response.json()["id"]
+
+        logger.info("[LLM] Batch job created: %s", batch_id)
+        return batch_id
+
+    async def poll_batch(self, batch_id: str) -> tuple:
+        """
+        Check the status of a batch job.
+
+        Args:
+            batch_id: Batch job ID from submit_batch
+
+        Returns:
+            tuple: (status, completed request count, total request count);
+                   status is e.g. "validating", "in_progress", "completed"
+        """
+        response = await self._client.get(
+            f"{self.base_url.rstrip('/')}/batches/{batch_id}",
+            headers=self._headers
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        counts = data.get("request_counts", {})
+        return (
+            data.get("status"),
+            counts.get("completed", 0),
+            counts.get("total", 0)
+        )
+
+    async def fetch_batch_results(self, batch_id: str) -> List[LLMResponse]:
+        """
+        Download and parse the results of a completed batch job.
+
+        Args:
+            batch_id: Batch job ID from submit_batch
+
+        Returns:
+            List[LLMResponse]: One response per submitted request, in
+                submission order (recovered from custom_id)
+
+        Raises:
+            RuntimeError: If the batch has not completed or produced no
+                output file
+        """
+        base = self.base_url.rstrip('/')
+
+        response = await self._client.get(
+            f"{base}/batches/{batch_id}",
+            headers=self._headers
+        )
+        response.raise_for_status()
+        batch = response.json()
+
+        output_file_id = batch.get("output_file_id")
+        if batch.get("status") != "completed" or not output_file_id:
+            raise RuntimeError(
+                f"Batch {batch_id} is not ready (status: {batch.get('status')})"
+            )
+
+        content_response = await self._client.get(
+            f"{base}/files/{output_file_id}/content",
+            headers=self._headers
+        )
+        content_response.raise_for_status()
+
+        # Each output line carries the full /chat/completions response
+        # under response.body; re-order by custom_id back to submission order
+        results = {}
+        for line in content_response.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = int(record["custom_id"].split("-", 1)[1])
+            body = (record.get("response") or {}).get("body", {})
+
+            choice = body.get("choices", [{}])[0]
+            message = choice.get("message", {})
+            usage = body.get("usage", {})
+
+            results[index] = LLMResponse(
+                content=message.get("content", ""),
+                model=body.get("model", self.default_model),
+                finish_reason=choice.get("finish_reason"),
+                usage={
+                    "prompt_tokens": usage.get("prompt_tokens", 0),
+                    "completion_tokens": usage.get("completion_tokens", 0),
+                    "total_tokens": usage.get("total_tokens", 0)
+                },
+                raw_response=record if self.keep_raw_response else None
+            )
+
+        return [results[index] for index in sorted(results)]
 
     def get_available_models(self) -> List[str]:
         """
@@ -321,29 +773,42 @@ class OpenAIProvider(BaseLLMProvider):
         any model string and lets OpenAI API validate it.
 
         Returns:
-            List[str]: List of common OpenAI model identifiers
+            List[str]: Shared constant list of common OpenAI model
+                identifiers - treat as read-only
         """
-        return [
-            "gpt-4o-mini",
-            "gpt-4-turbo",
-            "gpt-4",
-            "gpt-3.5-turbo",
-        ]
+        return _AVAILABLE_MODELS
 
     async def test_connection(self) -> bool:
         """
         Test the connection to the OpenAI API.
 
+        Probes the /models list endpoint instead of running a real
+        completion - it validates the endpoint and API key without
+        spending tokens on a throwaway generation. A success is
+        remembered for a short TTL so polling health checks don't
+        re-probe the endpoint every few seconds.
+
         Returns:
             bool: True if connection is successful, False otherwise
         """
+        now = time.monotonic()
+        if now < self._conn_ok_until:
+            return True
+
         try:
-            response = await self.generate("Hello", max_tokens=5)
-            return bool(response.content)
+            response = await self._client.get(
+                f"{self.base_url.rstrip('/')}/models",
+                headers=self._headers,
+                timeout=5.0
+            )
+            response.raise_for_status()
         except Exception as e:
-            print(f"Connection test failed: {e}")
+            logger.warning("[LLM] OpenAI connection test failed: %s", e)
             return False
 
+        self._conn_ok_until = now + _CONN_TEST_TTL
+        return True
+
 
 # Factory function for easy instantiation
 def get_openai_provider(
@@ -5,13 +5,48 @@ This module provides a factory function to create LLM provider instances
 based on provider type and model selection.
 """
 
-from typing import Optional
+import hashlib
+from typing import Dict, Optional, Tuple
 from .base import BaseLLMProvider
 from .ollama_client import OllamaProvider
 from .openai_client import OpenAIProvider
 from src.utils import logger
 
 
+# Memoized provider instances keyed by construction parameters. Each
+# provider owns a connection pool (and rate limiters), so handing out one
+# shared instance per configuration keeps a single keep-alive pool
+# process-wide instead of building a fresh one per WebSocket connection.
+# API keys enter the cache key as a digest, never as the raw secret
+_provider_cache: Dict[Tuple, BaseLLMProvider] = {}
+
+
+# Provider classes keyed by their PROVIDER_TYPE - a dict lookup replaces
+# the old if/elif chain, and new providers plug in via register_provider
+# without editing get_provider itself
+_REGISTRY: Dict[str, type] = {
+    OllamaProvider.PROVIDER_TYPE: OllamaProvider,
+    OpenAIProvider.PROVIDER_TYPE: OpenAIProvider,
+}
+
+
+def register_provider(provider_cls: type) -> type:
+    """
+    Register a provider class with the factory.
+
+    The class's PROVIDER_TYPE attribute becomes its get_provider key.
+    Usable as a decorator on new BaseLLMProvider subclasses.
+
+    Args:
+        provider_cls: BaseLLMProvider subclass to register
+
+    Returns:
+        type: The class, unchanged (decorator-friendly)
+    """
+    _REGISTRY[provider_cls.PROVIDER_TYPE] = provider_cls
+    return provider_cls
+
+
 def get_provider(
     provider_type: str,
     model: Optional[str] = None,
@@ -25,6 +60,12 @@ def get_provider(
     The model parameter is passed directly to the provider without validation,
     allowing the LLM API to validate model availability.
 
+    Instances are memoized per (provider_type, model, api_key, base_url),
+    so repeat calls - e.g. one per WebSocket connection - share a single
+    provider and its pooled HTTP client. Shared instances are closed via
+    close_all_providers() on application shutdown; callers must not
+    aclose() them individually.
+
     Args:
         provider_type: Type of provider ("ollama" or "openai")
         model: Model identifier (e.g., "gpt-4o-mini", "mistral:instruct")
@@ -50,34 +91,50 @@ def get_provider(
     """
     provider_type = provider_type.lower()
 
-    # Log provider creation
-    logger.info(f"[PROVIDER] Creating {provider_type} provider with model: {model or 'default'}")
-
-    if provider_type == "ollama":
-        # Create Ollama provider
-        default_model = model or "mistral:instruct"
-        return OllamaProvider(
-            api_key=api_key,
-            base_url=base_url,
-            default_model=default_model
-        )
-
-    elif provider_type == "openai":
-        # Create OpenAI provider
-        default_model = model or "gpt-4o-mini"
-        return OpenAIProvider(
-            api_key=api_key,
-            base_url=base_url,
-            default_model=default_model
-        )
-
-    else:
-        # Unknown provider type
+    cache_key = (
+        provider_type,
+        model,
+        hashlib.sha256(api_key.encode()).hexdigest() if api_key else None,
+        base_url
+    )
+    provider = _provider_cache.get(cache_key)
+    if provider is not None:
+        return provider
+
+    provider_cls = _REGISTRY.get(provider_type)
+    if provider_cls is None:
+        supported = ", ".join(f"'{name}'" for name in sorted(_REGISTRY))
         raise ValueError(
             f"Unknown provider type: '{provider_type}'. "
-            f"Supported providers: 'ollama', 'openai'"
+            f"Supported providers: {supported}"
         )
 
+    # Log provider creation (cache misses only)
+    logger.info("[PROVIDER] Creating %s provider with model: %s", provider_type, model or 'default')
+
+    # Each provider class carries its own default model, so the model
+    # argument is only forwarded when the caller actually chose one
+    kwargs = {"api_key": api_key, "base_url": base_url}
+    if model:
+        kwargs["default_model"] = model
+    provider = provider_cls(**kwargs)
+
+    _provider_cache[cache_key] = provider
+    return provider
+
+
+async def close_all_providers() -> None:
+    """
+    Close every memoized provider's pooled resources.
+
+    Called on application shutdown; afterwards the cache is empty and
+    the next get_provider call builds a fresh instance.
+    """
+    providers = list(_provider_cache.values())
+    _provider_cache.clear()
+    for provider in providers:
+        await provider.aclose()
+
 
 def get_provider_info(provider: BaseLLMProvider) -> dict:
     """
@@ -95,14 +152,8 @@ def get_provider_info(provider: BaseLLMProvider) -> dict:
         >>> print(info)
         {'type': 'openai', 'model': 'gpt-4o-mini', 'available_models': [...]}
     """
-    provider_type = None
-    if isinstance(provider, OllamaProvider):
-        provider_type = "ollama"
-    elif isinstance(provider, OpenAIProvider):
-        provider_type = "openai"
-
     return {
-        "type": provider_type,
+        "type": provider.PROVIDER_TYPE,
         "model": provider.default_model,
         "available_models": provider.get_available_models()
     }
@@ -0,0 +1,81 @@
+"""
+Client-side rate limiting for LLM providers.
+
+Remote LLM APIs enforce requests-per-second and tokens-per-minute
+quotas and answer bursts past them with 429s, which httpx does not
+retry - callers then eat the full backoff as tail latency. An async
+token bucket smooths bursts into the allowed rate on the client side,
+so requests queue for a few milliseconds instead of bouncing off the
+server and being re-billed on retry.
+"""
+
+import asyncio
+import time
+
+
+def estimate_tokens(text_chars: int, completion_tokens: int = 0) -> int:
+    """
+    Roughly estimate the token cost of a request.
+
+    Uses the ~4 characters/token rule of thumb for English text; exact
+    tokenization isn't needed to keep a bucket honest.
+
+    Args:
+        text_chars: Total characters of prompt/messages content
+        completion_tokens: Expected completion budget (e.g. max_tokens)
+
+    Returns:
+        int: Estimated token count (at least 1)
+    """
+    return max(1, text_chars // 4 + completion_tokens)
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket that awaits (rather than errors) when depleted.
+
+    Tokens refill continuously at `rate` per second up to `burst`.
+    acquire() returns immediately while the bucket has capacity and
+    otherwise sleeps exactly as long as the refill needs - no polling.
+    Waiters are serviced in arrival order via an asyncio.Lock.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Sustained refill rate in tokens per second
+            burst: Maximum tokens the bucket can hold (burst headroom)
+        """
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Tokens to consume (clamped to the bucket's burst
+                size so an oversized request can't wait forever)
+        """
+        tokens = min(float(tokens), self.burst)
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                # Sleep exactly until the deficit refills; the lock stays
+                # held so later arrivals queue behind this one
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
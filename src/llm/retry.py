@@ -0,0 +1,100 @@
+"""
+Retry support for LLM provider calls.
+
+Transient 5xx responses and network hiccups from remote LLM APIs
+previously propagated as hard exceptions, forcing callers to re-issue
+the whole request (and pay a fresh round-trip) themselves. The
+async_retry decorator retries such failures in place with exponential
+jittered backoff, honoring the Retry-After header the API sends with
+429/503 responses.
+"""
+
+import asyncio
+import functools
+import random
+from typing import Callable
+
+import httpx
+
+from src.utils import logger
+
+
+# Status codes worth retrying: rate limits and transient server errors.
+# Client errors (4xx other than 429) indicate a bad request and would
+# fail identically on every attempt
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Compute a full-jitter exponential backoff delay.
+
+    Args:
+        attempt: 1-based attempt number that just failed
+        base_delay: Delay ceiling for the first retry
+        max_delay: Overall delay ceiling
+
+    Returns:
+        float: Seconds to sleep before the next attempt
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+
+
+def async_retry(
+    max_attempts: int = 4,
+    base_delay: float = 0.25,
+    max_delay: float = 8.0
+) -> Callable:
+    """
+    Retry an async HTTP-calling method on transient failures.
+
+    Retries httpx transport errors and retryable status codes (429 and
+    5xx) with exponential jittered backoff; a Retry-After header on the
+    failing response overrides the computed delay when longer. Anything
+    else propagates immediately.
+
+    Args:
+        max_attempts: Total attempts including the first call
+        base_delay: Backoff ceiling for the first retry in seconds
+        max_delay: Maximum backoff delay in seconds
+
+    Returns:
+        Callable: Decorator for an async function
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            attempt = 1
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except httpx.HTTPStatusError as e:
+                    status = e.response.status_code
+                    if status not in _RETRYABLE_STATUS or attempt >= max_attempts:
+                        raise
+                    delay = _retry_delay(attempt, base_delay, max_delay)
+
+                    # 429/503 often carry an explicit Retry-After; honor
+                    # it when it asks for more patience than our backoff
+                    retry_after = e.response.headers.get("Retry-After")
+                    if retry_after:
+                        try:
+                            delay = max(delay, float(retry_after))
+                        except ValueError:
+                            pass
+                    reason = f"HTTP {status}"
+                except httpx.TransportError as e:
+                    if attempt >= max_attempts:
+                        raise
+                    delay = _retry_delay(attempt, base_delay, max_delay)
+                    reason = type(e).__name__
+
+                logger.warning(
+                    "[LLM] %s attempt %d/%d failed (%s); retrying in %.2fs",
+                    func.__qualname__, attempt, max_attempts, reason, delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        return wrapper
+    return decorator
@@ -3,17 +3,503 @@ Query functions for the ArticleApproveds table.
 
 This module provides functions to query the ArticleApproveds table
 using raw SQL queries.
+
+Values pass through in SQLite storage form - isApproved as 0/1 ints
+(truthy/falsy as-is) and the date columns as their stored ISO-8601
+strings, which compare and sort correctly without parsing. No per-row
+Python-side type conversion happens anywhere in this module, and none
+should be added; convert at the presentation edge if a caller needs
+real bools or datetime objects.
 """
 
-from typing import List, Dict, Any, Optional
+import copy
+import functools
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Union
 from datetime import date
 from src.database.connection import get_db
+from src.utils import logger
+
+
+# Composite indexes that would let SQLite stream the hot list queries
+# (filter + ORDER BY createdAt DESC LIMIT N) straight from an index
+# instead of scanning and sorting the whole table. This codebase cannot
+# create them - the NewsNexus schema belongs to the external Sequelize
+# application - so _check_index_coverage only detects their absence and
+# logs the DDL for the owning application to apply
+_RECOMMENDED_INDEXES = (
+    "CREATE INDEX idx_aa_approved_created ON ArticleApproveds(isApproved, createdAt DESC)",
+    "CREATE INDEX idx_aa_user_created ON ArticleApproveds(userId, isApproved, createdAt DESC)",
+    "CREATE INDEX idx_aa_pubdate ON ArticleApproveds(publicationDateForPdfReport DESC)",
+    # Lets prefix_only LIKE searches (headline%) plan as an index range
+    # scan via SQLite's LIKE optimization instead of a full scan
+    "CREATE INDEX idx_aa_headline_nocase ON ArticleApproveds(headlineForPdfReport COLLATE NOCASE)",
+)
+
+_index_check_done = False
+
+
+def _check_index_coverage(cursor) -> None:
+    """
+    Warn once if the hot ArticleApproveds query shapes run as table scans.
+
+    Runs EXPLAIN QUERY PLAN (never the queries themselves) on the two
+    dominant access patterns the first time a list query executes. On an
+    indexed database this costs two plan compilations once per process;
+    on an unindexed one it tells the operator exactly which indexes the
+    NewsNexus application should add.
+
+    Args:
+        cursor: Open cursor on the shared connection
+    """
+    global _index_check_done
+
+    if _index_check_done:
+        return
+    _index_check_done = True
+
+    probes = (
+        "SELECT id FROM ArticleApproveds WHERE isApproved = 1 "
+        "ORDER BY createdAt DESC LIMIT 1",
+        "SELECT id FROM ArticleApproveds WHERE userId = 1 "
+        "ORDER BY createdAt DESC LIMIT 1",
+    )
+
+    scans = 0
+    for probe in probes:
+        cursor.execute(f"EXPLAIN QUERY PLAN {probe}")
+        plan = " ".join(row['detail'] for row in cursor.fetchall())
+        if "USING INDEX" not in plan.upper():
+            scans += 1
+
+    if scans:
+        ddl = "; ".join(_RECOMMENDED_INDEXES)
+        logger.warning(
+            "[DB] %d hot ArticleApproveds query shape(s) run as full "
+            "table scans. Ask the NewsNexus application to add: %s", scans, ddl
+        )
+
+
+# Query-result cache for read-mostly functions: repeated identical calls
+# (dashboard counts, re-fetched article details) are answered from memory
+# instead of re-running the SELECT. Entries are keyed by function name
+# plus bind parameters and expire after a short TTL, which also bounds
+# how stale results can get when the external NewsNexus application
+# writes to the database. LRU eviction caps memory
+_QUERY_CACHE_MAX_SIZE = 512
+_QUERY_CACHE_TTL = 30.0
+_query_cache: OrderedDict = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
+def _cached_query(unless=None):
+    """
+    Decorator memoizing a query function by its bind parameters.
+
+    Results are deep-copied on the way out so callers can mutate them
+    without corrupting the cached copy.
+
+    Args:
+        unless: Optional predicate (args, kwargs) -> bool; when it
+                returns True the call bypasses the cache entirely
+
+    Returns:
+        Decorator wrapping the query function with LRU+TTL caching
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if unless is not None and unless(args, kwargs):
+                return func(*args, **kwargs)
+
+            # List arguments (e.g. fields=[...]) are unhashable as-is
+            hashable = lambda v: tuple(v) if isinstance(v, list) else v
+            key = (
+                func.__name__,
+                tuple(hashable(a) for a in args),
+                tuple(sorted((k, hashable(v)) for k, v in kwargs.items())),
+            )
+            now = time.monotonic()
+
+            with _query_cache_lock:
+                entry = _query_cache.get(key)
+                if entry is not None:
+                    value, expiry = entry
+                    if now < expiry:
+                        _query_cache.move_to_end(key)
+                        return copy.deepcopy(value)
+                    del _query_cache[key]
+
+            value = func(*args, **kwargs)
+
+            with _query_cache_lock:
+                _query_cache[key] = (copy.deepcopy(value), now + _QUERY_CACHE_TTL)
+                _query_cache.move_to_end(key)
+                while len(_query_cache) > _QUERY_CACHE_MAX_SIZE:
+                    _query_cache.popitem(last=False)
+
+            return value
+        return wrapper
+    return decorator
+
+
+def invalidate_cache() -> None:
+    """
+    Drop all cached query results (and the full-text index fingerprint).
+
+    Call this from any code path that writes to ArticleApproveds so the
+    next reads see fresh data immediately instead of after the TTL.
+    """
+    global _fts_fingerprint
+
+    with _query_cache_lock:
+        _query_cache.clear()
+    _fts_fingerprint = None
+
+
+# Rows fetched from the cursor per batch. fetchall() materializes the
+# whole result set as Row objects before the dict conversion builds a
+# second full copy - batched fetching keeps peak memory at one batch of
+# Rows plus the output list instead of 2x the result set
+_FETCH_BATCH_SIZE = 256
+
+
+def _iter_rows(cursor, batch_size: int = _FETCH_BATCH_SIZE):
+    """
+    Yield result rows as dicts, fetching in fixed-size batches.
+
+    Must be consumed while the cursor's connection context is still
+    open (callers wrap it in list() inside their get_cursor block).
+
+    Args:
+        cursor: Cursor with an executed SELECT
+        batch_size: Rows fetched from SQLite per fetchmany call
+
+    Yields:
+        Dict[str, Any]: One row per iteration
+    """
+    cursor.arraysize = batch_size
+    while True:
+        batch = cursor.fetchmany(batch_size)
+        if not batch:
+            return
+        for row in batch:
+            yield dict(row)
+
+
+def _columnar_result(cursor) -> Dict[str, Any]:
+    """
+    Drain a cursor into a columnar {'columns': [...], 'rows': [...]} dict.
+
+    Skips the per-row dict construction entirely (12 hash-map inserts
+    per row for these queries) and keeps each column name once instead
+    of once per row, which also shrinks JSON payloads built from the
+    result. Rows are plain tuples in column order.
+
+    Args:
+        cursor: Cursor with an executed SELECT
+
+    Returns:
+        Dictionary with 'columns' (names in order) and 'rows' (tuples)
+    """
+    columns = [description[0] for description in cursor.description]
+    cursor.arraysize = _FETCH_BATCH_SIZE
+
+    rows = []
+    while True:
+        batch = cursor.fetchmany(_FETCH_BATCH_SIZE)
+        if not batch:
+            break
+        rows.extend(tuple(row) for row in batch)
+
+    return {"columns": columns, "rows": rows}
+
+
+# Column list every row query returns, defined once instead of being
+# repeated (and re-concatenated) in each SQL template
+_ARTICLE_COLUMN_NAMES = (
+    'id',
+    'userId',
+    'articleId',
+    'isApproved',
+    'headlineForPdfReport',
+    'publicationNameForPdfReport',
+    'publicationDateForPdfReport',
+    'textForPdfReport',
+    'urlForPdfReport',
+    'kmNotes',
+    'createdAt',
+    'updatedAt'
+)
+_ARTICLE_COLUMNS = ", ".join(_ARTICLE_COLUMN_NAMES)
+_ARTICLE_COLUMNS_AA = ", ".join(f"aa.{name}" for name in _ARTICLE_COLUMN_NAMES)
+
+def _columns_clause(fields: Optional[List[str]]) -> str:
+    """
+    Validate a caller-supplied field list and render it for a SELECT.
+
+    Lets callers that only need headlines skip fetching multi-KB
+    textForPdfReport blobs. None keeps the full column set.
+
+    Args:
+        fields: Columns to select, or None for all article columns
+
+    Returns:
+        str: Comma-separated column list
+
+    Raises:
+        ValueError: If fields contains an unknown column name
+    """
+    if fields is None:
+        return _ARTICLE_COLUMNS
+
+    invalid_fields = [field for field in fields if field not in _ARTICLE_COLUMN_NAMES]
+    if invalid_fields:
+        raise ValueError(f"fields must be a subset of {list(_ARTICLE_COLUMN_NAMES)}")
+    return ", ".join(fields)
+
+
+# Single-row lookup has no structural variants, so its statement is a
+# plain module constant
+_BY_ID_SQL = f"""
+    SELECT
+        {_ARTICLE_COLUMNS}
+    FROM ArticleApproveds
+    WHERE id = ?
+"""
+
+# Bulk variant: the id list travels as one JSON-encoded bind parameter
+# expanded by json_each, so any number of ids is a single statement and
+# a single round-trip instead of N by-id calls (and the statement text
+# never varies, keeping sqlite3's prepared-statement cache warm)
+_BY_IDS_SQL = f"""
+    SELECT
+        {_ARTICLE_COLUMNS}
+    FROM ArticleApproveds
+    WHERE id IN (SELECT value FROM json_each(?))
+    ORDER BY id
+"""
+
+# One GROUP BY walk yields the counts for every approval status at
+# once - the in-process equivalent of a trigger-maintained summary
+# table, which this codebase cannot create in the read-only NewsNexus
+# schema. The TTL cache on _approval_counts bounds staleness
+_COUNT_SQL = """
+    SELECT isApproved, COUNT(*) as count
+    FROM ArticleApproveds
+    GROUP BY isApproved
+"""
+
+# isApproved bind-value lookup; replaces the per-call conditional at
+# every call site (and reads as intent: Python bool -> stored int)
+_BOOL = {True: 1, False: 0}
+
+
+def _list_sql(
+    columns: str,
+    conditions: tuple,
+    order_by: str = "createdAt DESC",
+    limit_clause: str = "LIMIT ?"
+) -> str:
+    """
+    Assemble one ArticleApproveds list statement from its parts.
+
+    Single shared template behind the per-shape builders below, so the
+    SELECT/FROM/ORDER BY scaffolding is written once. Only ever runs on
+    a builder's lru_cache miss; the finished string is interned there
+    and reused, keeping sqlite3's prepared-statement cache hot.
+
+    Args:
+        columns: Validated SELECT column list
+        conditions: WHERE fragments, joined with AND (may be empty)
+        order_by: ORDER BY expression
+        limit_clause: Pagination clause (LIMIT ?, or LIMIT ? OFFSET ?)
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    return f"""
+        SELECT
+            {columns}
+        FROM ArticleApproveds
+        {where_clause}
+        ORDER BY {order_by}
+        {limit_clause}
+    """
+
+
+# Columns mirrored into the full-text index (the four fields
+# search_approved_articles_by_text accepts)
+_FTS_COLUMNS = (
+    'headlineForPdfReport',
+    'kmNotes',
+    'textForPdfReport',
+    'publicationNameForPdfReport'
+)
+
+# Seconds between staleness checks of the full-text index. The NewsNexus
+# database is written by another application, so the index is refreshed
+# when its (row count, max updatedAt) fingerprint changes rather than by
+# triggers - this codebase must not alter the shared schema
+_FTS_CHECK_INTERVAL = 60.0
+
+# Index state. No extra lock needed: these are only touched inside
+# get_cursor(), which already serializes access to the shared connection.
+# _fts_generation records which connection the index was built on - the
+# temp schema dies with its connection, so a close()/reconnect cycle
+# must invalidate the cached fingerprint
+_fts_available = True
+_fts_fingerprint = None
+_fts_checked_at = 0.0
+_fts_generation = -1
+
+
+def _ensure_fts_index(cursor) -> bool:
+    """
+    Build or refresh the in-memory full-text index over ArticleApproveds.
+
+    The index is an FTS5 virtual table in the connection's temp schema
+    (temp_store=MEMORY), so the shared database file is never modified.
+    A full rebuild runs only when the table fingerprint changes; between
+    checks the existing index is trusted for _FTS_CHECK_INTERVAL seconds.
+
+    Args:
+        cursor: Open cursor on the shared connection
+
+    Returns:
+        bool: True if the index is usable, False if FTS5 is unavailable
+    """
+    global _fts_available, _fts_fingerprint, _fts_checked_at, _fts_generation
+
+    if not _fts_available:
+        return False
+
+    # A reconnect (DatabaseConnection.close() then lazy connect) starts
+    # with an empty temp schema; trusting the old fingerprint would
+    # route searches at a table that no longer exists
+    generation = get_db().generation
+    if generation != _fts_generation:
+        _fts_fingerprint = None
+        _fts_generation = generation
+
+    now = time.monotonic()
+    if _fts_fingerprint is not None and now - _fts_checked_at < _FTS_CHECK_INTERVAL:
+        return True
+
+    cursor.execute("SELECT COUNT(*) AS n, MAX(updatedAt) AS m FROM ArticleApproveds")
+    row = cursor.fetchone()
+    fingerprint = (row['n'], row['m'])
+    _fts_checked_at = now
+
+    if fingerprint == _fts_fingerprint:
+        return True
+
+    columns = ", ".join(_FTS_COLUMNS)
+    try:
+        cursor.execute("DROP TABLE IF EXISTS temp.ArticleApproveds_fts")
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE temp.ArticleApproveds_fts "
+            f"USING fts5({columns}, tokenize='unicode61')"
+        )
+        cursor.execute(
+            f"INSERT INTO temp.ArticleApproveds_fts (rowid, {columns}) "
+            f"SELECT id, {columns} FROM ArticleApproveds"
+        )
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5 - remember and fall back to LIKE
+        _fts_available = False
+        return False
+
+    _fts_fingerprint = fingerprint
+    return True
+
+
+def _build_fts_match(search_text: str, search_fields: List[str]) -> str:
+    """
+    Build an FTS5 MATCH expression for a literal search string.
+
+    The text is quoted as a phrase (embedded double quotes doubled) so
+    FTS5 operators like '-' or 'AND' in user input stay literal, with a
+    trailing '*' for prefix matching. Fields are column-qualified when
+    the caller searches a subset of the indexed columns.
+
+    Args:
+        search_text: Literal text to search for
+        search_fields: Indexed columns to search in
+
+    Returns:
+        str: MATCH expression, e.g. 'kmNotes:"safety"* OR textForPdfReport:"safety"*'
+    """
+    phrase = '"{}"*'.format(search_text.replace('"', '""'))
+
+    if set(search_fields) == set(_FTS_COLUMNS):
+        return phrase
+    return " OR ".join(f"{field}:{phrase}" for field in search_fields)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_fts_search_sql(has_is_approved: bool) -> str:
+    """
+    Build the FTS search statement for one structural shape.
+
+    Cached (like every _build_*_sql helper) so calls with the same shape
+    hand sqlite3 the identical statement text and its prepared-statement
+    cache hits instead of re-parsing and re-planning; the actual values
+    always travel as bind parameters.
+
+    Args:
+        has_is_approved: Whether an isApproved filter is present
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    where_clause = "fts.ArticleApproveds_fts MATCH ?"
+    if has_is_approved:
+        where_clause += " AND aa.isApproved = ?"
+
+    return f"""
+        SELECT
+            {_ARTICLE_COLUMNS_AA}
+        FROM temp.ArticleApproveds_fts fts
+        JOIN ArticleApproveds aa ON aa.id = fts.rowid
+        WHERE {where_clause}
+        ORDER BY aa.createdAt DESC
+        LIMIT ?
+    """
+
+
+@_cached_query()
+def _approval_counts() -> Dict[int, int]:
+    """
+    Get row counts per approval status in one table walk.
+
+    Cached for the TTL (see _cached_query), so within a cache window
+    both count parameterizations cost zero queries total after the
+    first call instead of one B-tree walk each.
+
+    Returns:
+        Dictionary mapping stored isApproved value (0/1) to row count
+    """
+    db = get_db()
+
+    with db.get_cursor() as cursor:
+        cursor.execute(_COUNT_SQL)
+        return {row['isApproved']: row['count'] for row in cursor.fetchall()}
 
 
 def get_approved_articles_count(is_approved: bool = True) -> int:
     """
     Get the count of articles with a specific approval status.
 
+    Answered from the cached per-status summary (see _approval_counts),
+    so repeat calls - and the opposite parameterization - are free.
+
     Args:
         is_approved: If True, count approved articles. If False, count non-approved.
 
@@ -24,29 +510,44 @@ def get_approved_articles_count(is_approved: bool = True) -> int:
         >>> count = get_approved_articles_count(is_approved=True)
         >>> print(f"Total approved articles: {count}")
     """
-    db = get_db()
+    return _approval_counts().get(_BOOL[is_approved], 0)
 
-    query = """
-        SELECT COUNT(*) as count
-        FROM ArticleApproveds
-        WHERE isApproved = ?
+
+def get_approved_articles_counts_grouped() -> Dict[bool, int]:
     """
+    Get approved and not-approved counts in one call.
 
-    with db.get_cursor() as cursor:
-        cursor.execute(query, (1 if is_approved else 0,))
-        result = cursor.fetchone()
-        return result['count'] if result else 0
+    Callers needing both numbers read them from the same cached GROUP BY
+    walk (see _approval_counts) instead of making two count calls.
+
+    Returns:
+        Dictionary mapping True/False to the matching row count
+
+    Example:
+        >>> counts = get_approved_articles_counts_grouped()
+        >>> print(counts[True], counts[False])
+    """
+    counts = _approval_counts()
+    return {True: counts.get(1, 0), False: counts.get(0, 0)}
 
 
 def search_approved_articles_by_text(
     search_text: str,
     search_fields: Optional[List[str]] = None,
     is_approved: Optional[bool] = None,
-    limit: int = 100
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    columnar: bool = False,
+    prefix_only: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Search approved articles by text content across specified fields.
 
+    Matching runs against an in-memory FTS5 index (see _ensure_fts_index),
+    which answers from an inverted index instead of LIKE-scanning every
+    row of the table per query. Note the FTS index matches on word and
+    word-prefix boundaries, not arbitrary mid-word substrings. When the
+    SQLite build lacks FTS5 the original LIKE scan is used instead.
+
     Args:
         search_text: Text to search for
         search_fields: List of fields to search in. Options: 'headlineForPdfReport',
@@ -54,9 +555,20 @@ def search_approved_articles_by_text(
                       If None, searches all fields.
         is_approved: Filter by approval status. If None, returns all statuses.
         limit: Maximum number of results to return (default: 100)
+        columnar: Return {'columns': [...], 'rows': [...]} instead of
+                  per-row dicts (see _columnar_result)
+        prefix_only: Match only values that start with search_text, via
+                     LIKE 'text%' rather than the FTS index. This shape
+                     qualifies for SQLite's LIKE optimization, so it can
+                     plan as an index range scan once the owning schema
+                     grows a COLLATE NOCASE index on the searched column
 
     Returns:
-        List of dictionaries containing article data
+        List of dictionaries containing article data, or the columnar
+        dict when columnar=True
+
+    Raises:
+        ValueError: If search_fields contains an unindexed field name
 
     Example:
         >>> results = search_approved_articles_by_text("safety", is_approved=True)
@@ -65,61 +577,233 @@ def search_approved_articles_by_text(
 
     # Default to searching all text fields
     if search_fields is None:
-        search_fields = [
-            'headlineForPdfReport',
-            'kmNotes',
-            'textForPdfReport',
-            'publicationNameForPdfReport'
-        ]
-
-    # Build WHERE clause for text search
-    text_conditions = []
-    params = []
+        search_fields = list(_FTS_COLUMNS)
+
+    invalid_fields = [field for field in search_fields if field not in _FTS_COLUMNS]
+    if invalid_fields:
+        raise ValueError(f"search_fields must be a subset of {list(_FTS_COLUMNS)}")
+
+    # Punctuation-heavy input (URLs, hyphenated codes) doesn't survive
+    # FTS tokenization faithfully - the tokenizer splits on exactly the
+    # characters the caller is searching for - so only word-like text
+    # goes to the token index; everything else keeps LIKE's exact
+    # substring semantics
+    word_like = search_text.replace(" ", "").isalnum()
+
+    with db.get_cursor() as cursor:
+        # Column-prefix matching is LIKE semantics, not token matching -
+        # it always takes the LIKE path regardless of FTS availability
+        if prefix_only or not word_like or not _ensure_fts_index(cursor):
+            return _search_by_like(
+                cursor, search_text, search_fields, is_approved, limit,
+                columnar, prefix_only
+            )
+
+        params = [_build_fts_match(search_text, search_fields)]
+
+        # Add approval status filter if specified
+        if is_approved is not None:
+            params.append(_BOOL[is_approved])
+
+        params.append(limit)
+
+        cursor.execute(_build_fts_search_sql(is_approved is not None), params)
+        if columnar:
+            return _columnar_result(cursor)
+        return list(_iter_rows(cursor))
 
-    for field in search_fields:
-        text_conditions.append(f"{field} LIKE ?")
-        params.append(f"%{search_text}%")
 
-    where_clause = f"({' OR '.join(text_conditions)})"
+@functools.lru_cache(maxsize=64)
+def _build_like_search_sql(search_fields: tuple, has_is_approved: bool) -> str:
+    """
+    Build the LIKE fallback search statement for one structural shape.
+
+    Cached by field tuple and filter flag (see _build_fts_search_sql).
+
+    Args:
+        search_fields: Validated tuple of fields to search in
+        has_is_approved: Whether an isApproved filter is present
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    text_conditions = " OR ".join(f"{field} LIKE ?" for field in search_fields)
+    conditions = (f"({text_conditions})",)
+    if has_is_approved:
+        conditions += ("isApproved = ?",)
+
+    return _list_sql(_ARTICLE_COLUMNS, conditions)
+
+
+def _search_by_like(
+    cursor,
+    search_text: str,
+    search_fields: List[str],
+    is_approved: Optional[bool],
+    limit: int,
+    columnar: bool = False,
+    prefix_only: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    LIKE-based fallback search for SQLite builds without FTS5.
+
+    Args:
+        cursor: Open cursor on the shared connection
+        search_text: Text to search for
+        search_fields: Validated list of fields to search in
+        is_approved: Filter by approval status. If None, returns all statuses.
+        limit: Maximum number of results to return
+        columnar: Return the columnar shape instead of per-row dicts
+        prefix_only: Use a 'text%' prefix pattern instead of the
+                     substring '%text%' pattern
+
+    Returns:
+        List of dictionaries containing article data, or the columnar
+        dict when columnar=True
+    """
+    pattern = f"{search_text}%" if prefix_only else f"%{search_text}%"
+    params = [pattern] * len(search_fields)
 
     # Add approval status filter if specified
     if is_approved is not None:
-        where_clause += " AND isApproved = ?"
-        params.append(1 if is_approved else 0)
+        params.append(_BOOL[is_approved])
 
-    query = f"""
-        SELECT
-            id,
-            userId,
-            articleId,
-            isApproved,
-            headlineForPdfReport,
-            publicationNameForPdfReport,
-            publicationDateForPdfReport,
-            textForPdfReport,
-            urlForPdfReport,
-            kmNotes,
-            createdAt,
-            updatedAt
-        FROM ArticleApproveds
-        WHERE {where_clause}
-        ORDER BY createdAt DESC
-        LIMIT ?
+    params.append(limit)
+
+    cursor.execute(
+        _build_like_search_sql(tuple(search_fields), is_approved is not None),
+        params
+    )
+    if columnar:
+        return _columnar_result(cursor)
+    return list(_iter_rows(cursor))
+
+
+@functools.lru_cache(maxsize=16)
+def _build_terms_search_sql(num_terms: int, has_is_approved: bool) -> str:
     """
+    Build the multi-term search statement for one structural shape.
 
-    params.append(limit)
+    Cached by term count and filter flag (see _build_fts_search_sql).
+    The terms bind into a VALUES CTE joined against the table, and a
+    window function ranks matches within each term so one statement
+    returns up to limit_per_term rows per term.
+
+    Args:
+        num_terms: Number of search-term placeholders in the VALUES list
+        has_is_approved: Whether an isApproved filter is present
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    values = ", ".join("(?)" for _ in range(num_terms))
+    text_conditions = " OR ".join(
+        f"a.{field} LIKE '%' || terms.term || '%'" for field in _FTS_COLUMNS
+    )
+    columns = ",\n                ".join(
+        f"a.{name}" for name in _ARTICLE_COLUMN_NAMES
+    )
+    approval_condition = "AND a.isApproved = ?" if has_is_approved else ""
+
+    return f"""
+        WITH terms(term) AS (VALUES {values}),
+        ranked AS (
+            SELECT
+                terms.term AS term,
+                {columns},
+                ROW_NUMBER() OVER (
+                    PARTITION BY terms.term
+                    ORDER BY a.createdAt DESC
+                ) AS term_rank
+            FROM terms
+            JOIN ArticleApproveds a
+                ON ({text_conditions}) {approval_condition}
+        )
+        SELECT * FROM ranked WHERE term_rank <= ?
+    """
+
+
+def search_approved_articles_by_terms(
+    search_terms: List[str],
+    is_approved: Optional[bool] = None,
+    limit_per_term: int = 10
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Search approved articles for several terms in one query.
+
+    Calling search_approved_articles_by_text per term costs one round
+    trip and one plan per term; here every term binds into a single
+    statement, so the table is matched against all terms in one pass
+    and the planning cost is paid once. Matching uses LIKE substring
+    semantics across all searchable text fields.
+
+    Args:
+        search_terms: Terms to search for
+        is_approved: Filter by approval status. If None, returns all statuses.
+        limit_per_term: Maximum number of results per term (default: 10)
+
+    Returns:
+        Dictionary mapping each term to its matching article rows,
+        newest first. Terms with no matches map to empty lists.
+
+    Example:
+        >>> grouped = search_approved_articles_by_terms(["safety", "recall"])
+        >>> print(len(grouped["safety"]))
+    """
+    if not search_terms:
+        return {}
+
+    db = get_db()
+
+    params = list(search_terms)
+    if is_approved is not None:
+        params.append(_BOOL[is_approved])
+    params.append(limit_per_term)
+
+    grouped: Dict[str, List[Dict[str, Any]]] = {
+        term: [] for term in search_terms
+    }
 
     with db.get_cursor() as cursor:
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        cursor.execute(
+            _build_terms_search_sql(len(search_terms), is_approved is not None),
+            params
+        )
+        for row in _iter_rows(cursor):
+            row.pop('term_rank', None)
+            grouped[row.pop('term')].append(row)
+
+    return grouped
+
+
+@functools.lru_cache(maxsize=32)
+def _build_user_sql(has_is_approved: bool, columns: str = _ARTICLE_COLUMNS) -> str:
+    """
+    Build the by-user list statement for one structural shape.
+
+    Cached by filter flag and column list (see _build_fts_search_sql).
+
+    Args:
+        has_is_approved: Whether an isApproved filter is present
+        columns: Validated SELECT column list
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    conditions = ("userId = ?",)
+    if has_is_approved:
+        conditions += ("isApproved = ?",)
+
+    return _list_sql(columns, conditions)
 
 
 def get_approved_articles_by_user(
     user_id: int,
     is_approved: Optional[bool] = None,
-    limit: int = 100
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    columnar: bool = False,
+    fields: Optional[List[str]] = None
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Get articles approved by a specific user.
 
@@ -127,48 +811,70 @@ def get_approved_articles_by_user(
         user_id: ID of the user who approved the articles
         is_approved: Filter by approval status. If None, returns all statuses.
         limit: Maximum number of results to return (default: 100)
+        columnar: Return {'columns': [...], 'rows': [...]} instead of
+                  per-row dicts (see _columnar_result)
+        fields: Columns to return (default: all). Pass a subset to skip
+                fetching large text blobs (see _columns_clause)
 
     Returns:
-        List of dictionaries containing article data
+        List of dictionaries containing article data, or the columnar
+        dict when columnar=True
 
     Example:
         >>> user_articles = get_approved_articles_by_user(user_id=1, is_approved=True)
     """
     db = get_db()
 
-    where_clause = "userId = ?"
     params = [user_id]
 
     if is_approved is not None:
-        where_clause += " AND isApproved = ?"
-        params.append(1 if is_approved else 0)
-
-    query = f"""
-        SELECT
-            id,
-            userId,
-            articleId,
-            isApproved,
-            headlineForPdfReport,
-            publicationNameForPdfReport,
-            publicationDateForPdfReport,
-            textForPdfReport,
-            urlForPdfReport,
-            kmNotes,
-            createdAt,
-            updatedAt
-        FROM ArticleApproveds
-        WHERE {where_clause}
-        ORDER BY createdAt DESC
-        LIMIT ?
-    """
+        params.append(_BOOL[is_approved])
 
     params.append(limit)
 
+    query = _build_user_sql(is_approved is not None, _columns_clause(fields))
+
     with db.get_cursor() as cursor:
+        _check_index_coverage(cursor)
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        if columnar:
+            return _columnar_result(cursor)
+        return list(_iter_rows(cursor))
+
+
+@functools.lru_cache(maxsize=64)
+def _build_date_range_sql(
+    date_field: str,
+    has_start: bool,
+    has_end: bool,
+    has_is_approved: bool,
+    columns: str = _ARTICLE_COLUMNS
+) -> str:
+    """
+    Build the date-range list statement for one structural shape.
+
+    Cached by the validated date field and bound-presence flags (see
+    _build_fts_search_sql).
+
+    Args:
+        date_field: Validated date column to filter and sort by
+        has_start: Whether a lower date bound is present
+        has_end: Whether an upper date bound is present
+        has_is_approved: Whether an isApproved filter is present
+        columns: Validated SELECT column list
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    conditions = ()
+    if has_start:
+        conditions += (f"{date_field} >= ?",)
+    if has_end:
+        conditions += (f"{date_field} <= ?",)
+    if has_is_approved:
+        conditions += ("isApproved = ?",)
+
+    return _list_sql(columns, conditions, order_by=f"{date_field} DESC")
 
 
 def get_approved_articles_by_date_range(
@@ -176,8 +882,10 @@ def get_approved_articles_by_date_range(
     end_date: Optional[str] = None,
     date_field: str = 'createdAt',
     is_approved: Optional[bool] = None,
-    limit: int = 100
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    columnar: bool = False,
+    fields: Optional[List[str]] = None
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Get articles within a date range.
 
@@ -187,9 +895,14 @@ def get_approved_articles_by_date_range(
         date_field: Field to filter by ('createdAt', 'updatedAt', or 'publicationDateForPdfReport')
         is_approved: Filter by approval status. If None, returns all statuses.
         limit: Maximum number of results to return (default: 100)
+        columnar: Return {'columns': [...], 'rows': [...]} instead of
+                  per-row dicts (see _columnar_result)
+        fields: Columns to return (default: all). Pass a subset to skip
+                fetching large text blobs (see _columns_clause)
 
     Returns:
-        List of dictionaries containing article data
+        List of dictionaries containing article data, or the columnar
+        dict when columnar=True
 
     Example:
         >>> articles = get_approved_articles_by_date_range(
@@ -205,83 +918,83 @@ def get_approved_articles_by_date_range(
     if date_field not in valid_date_fields:
         raise ValueError(f"date_field must be one of {valid_date_fields}")
 
-    conditions = []
     params = []
 
     if start_date:
-        conditions.append(f"{date_field} >= ?")
         params.append(start_date)
 
     if end_date:
-        conditions.append(f"{date_field} <= ?")
         params.append(end_date)
 
     if is_approved is not None:
-        conditions.append("isApproved = ?")
-        params.append(1 if is_approved else 0)
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    query = f"""
-        SELECT
-            id,
-            userId,
-            articleId,
-            isApproved,
-            headlineForPdfReport,
-            publicationNameForPdfReport,
-            publicationDateForPdfReport,
-            textForPdfReport,
-            urlForPdfReport,
-            kmNotes,
-            createdAt,
-            updatedAt
-        FROM ArticleApproveds
-        WHERE {where_clause}
-        ORDER BY {date_field} DESC
-        LIMIT ?
-    """
+        params.append(_BOOL[is_approved])
 
     params.append(limit)
 
+    query = _build_date_range_sql(
+        date_field,
+        bool(start_date),
+        bool(end_date),
+        is_approved is not None,
+        _columns_clause(fields)
+    )
+
     with db.get_cursor() as cursor:
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        if columnar:
+            return _columnar_result(cursor)
+        return list(_iter_rows(cursor))
 
 
-def get_approved_article_by_id(article_approved_id: int) -> Optional[Dict[str, Any]]:
+@functools.lru_cache(maxsize=16)
+def _build_by_id_sql(columns: str) -> str:
+    """
+    Build the by-id lookup statement for one column projection.
+
+    Cached by column list (see _build_fts_search_sql). The full-column
+    shape stays the module-level _BY_ID_SQL constant.
+
+    Args:
+        columns: Validated SELECT column list
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    return f"""
+    SELECT
+        {columns}
+    FROM ArticleApproveds
+    WHERE id = ?
+"""
+
+
+@_cached_query()
+def get_approved_article_by_id(
+    article_approved_id: int,
+    fields: Optional[List[str]] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get a single approved article record by its ID.
 
+    Results are cached for a short TTL (see _cached_query).
+
     Args:
         article_approved_id: ID of the ArticleApproved record
+        fields: Columns to return (default: all). Pass a subset to skip
+                fetching large text blobs (see _columns_clause)
 
     Returns:
         Dictionary containing article data, or None if not found
 
     Example:
         >>> article = get_approved_article_by_id(1)
+        >>> headline = get_approved_article_by_id(
+        ...     1, fields=['id', 'headlineForPdfReport']
+        ... )
     """
     db = get_db()
 
-    query = """
-        SELECT
-            id,
-            userId,
-            articleId,
-            isApproved,
-            headlineForPdfReport,
-            publicationNameForPdfReport,
-            publicationDateForPdfReport,
-            textForPdfReport,
-            urlForPdfReport,
-            kmNotes,
-            createdAt,
-            updatedAt
-        FROM ArticleApproveds
-        WHERE id = ?
-    """
+    query = _BY_ID_SQL if fields is None else _build_by_id_sql(_columns_clause(fields))
 
     with db.get_cursor() as cursor:
         cursor.execute(query, (article_approved_id,))
@@ -289,57 +1002,269 @@ def get_approved_article_by_id(article_approved_id: int) -> Optional[Dict[str, A
         return dict(row) if row else None
 
 
+@_cached_query()
+def get_approved_articles_by_ids(ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Get multiple approved article records by their IDs in one query.
+
+    Fetching N rows through get_approved_article_by_id costs N
+    round-trips; here the whole id list binds as a single JSON parameter
+    expanded by json_each, so the lookup is one statement regardless of
+    list size. Missing ids are silently absent from the result.
+
+    Args:
+        ids: IDs of the ArticleApproved records to fetch
+
+    Returns:
+        List of dictionaries containing article data, ordered by id
+
+    Example:
+        >>> articles = get_approved_articles_by_ids([1, 5, 9])
+    """
+    if not ids:
+        return []
+
+    db = get_db()
+
+    with db.get_cursor() as cursor:
+        cursor.execute(_BY_IDS_SQL, (json.dumps(list(ids)),))
+        return list(_iter_rows(cursor))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_all_sql(
+    has_is_approved: bool,
+    has_cursor: bool = False,
+    columns: str = _ARTICLE_COLUMNS
+) -> str:
+    """
+    Build the paginated list statement for one structural shape.
+
+    Cached by filter flags and column list (see _build_fts_search_sql).
+
+    Args:
+        has_is_approved: Whether an isApproved filter is present
+        has_cursor: Whether keyset pagination (createdAt < ?) is used
+                    instead of OFFSET
+        columns: Validated SELECT column list
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    conditions = ()
+    if has_is_approved:
+        conditions += ("isApproved = ?",)
+    if has_cursor:
+        conditions += ("createdAt < ?",)
+
+    limit_clause = "LIMIT ?" if has_cursor else "LIMIT ? OFFSET ?"
+
+    return _list_sql(columns, conditions, limit_clause=limit_clause)
+
+
+@_cached_query(
+    # Only the first page is hot enough to be worth cache slots; deep
+    # pagination (by offset or keyset cursor) would just churn the LRU
+    unless=lambda args, kwargs: (
+        (len(args) > 2 and args[2] != 0)
+        or kwargs.get('offset', 0) != 0
+        or kwargs.get('created_before') is not None
+    )
+)
 def get_all_approved_articles(
     is_approved: Optional[bool] = None,
     limit: int = 100,
-    offset: int = 0
-) -> List[Dict[str, Any]]:
+    offset: int = 0,
+    columnar: bool = False,
+    fields: Optional[List[str]] = None,
+    created_before: Optional[str] = None
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Get all approved article records with pagination.
 
+    First-page calls (offset=0) are cached for a short TTL (see
+    _cached_query); paginated calls always hit the database. For deep
+    pagination prefer created_before (keyset pagination): OFFSET makes
+    SQLite walk and discard offset rows on every page, while
+    'createdAt < last seen value' jumps straight to the next page.
+
     Args:
         is_approved: Filter by approval status. If None, returns all statuses.
         limit: Maximum number of results to return (default: 100)
-        offset: Number of records to skip (default: 0)
+        offset: Number of records to skip (default: 0); ignored when
+                created_before is given
+        columnar: Return {'columns': [...], 'rows': [...]} instead of
+                  per-row dicts (see _columnar_result)
+        fields: Columns to return (default: all). Pass a subset to skip
+                fetching large text blobs (see _columns_clause)
+        created_before: Keyset cursor - return only rows with createdAt
+                strictly before this value (the last createdAt of the
+                previous page)
 
     Returns:
-        List of dictionaries containing article data
+        List of dictionaries containing article data, or the columnar
+        dict when columnar=True
 
     Example:
-        >>> articles = get_all_approved_articles(is_approved=True, limit=50)
+        >>> page = get_all_approved_articles(is_approved=True, limit=50)
+        >>> next_page = get_all_approved_articles(
+        ...     is_approved=True, limit=50, created_before=page[-1]['createdAt']
+        ... )
     """
     db = get_db()
 
-    where_clause = "1=1"
     params = []
 
     if is_approved is not None:
-        where_clause = "isApproved = ?"
-        params.append(1 if is_approved else 0)
+        params.append(_BOOL[is_approved])
 
-    query = f"""
-        SELECT
-            id,
-            userId,
-            articleId,
-            isApproved,
-            headlineForPdfReport,
-            publicationNameForPdfReport,
-            publicationDateForPdfReport,
-            textForPdfReport,
-            urlForPdfReport,
-            kmNotes,
-            createdAt,
-            updatedAt
-        FROM ArticleApproveds
-        WHERE {where_clause}
-        ORDER BY createdAt DESC
-        LIMIT ? OFFSET ?
-    """
+    if created_before is not None:
+        params.extend([created_before, limit])
+    else:
+        params.extend([limit, offset])
 
-    params.extend([limit, offset])
+    query = _build_all_sql(
+        is_approved is not None,
+        created_before is not None,
+        _columns_clause(fields)
+    )
 
     with db.get_cursor() as cursor:
+        _check_index_coverage(cursor)
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        if columnar:
+            return _columnar_result(cursor)
+        return list(_iter_rows(cursor))
+
+
+# Columns whose full values can run to multiple kB per row; the preview
+# variant truncates these in SQL so the excess bytes never cross the
+# SQLite-to-Python boundary
+_PREVIEW_TEXT_COLUMNS = frozenset((
+    'headlineForPdfReport',
+    'publicationNameForPdfReport',
+    'textForPdfReport',
+    'urlForPdfReport',
+    'kmNotes',
+))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_preview_sql(has_is_approved: bool) -> str:
+    """
+    Build the preview list statement with SQL-side text truncation.
+
+    Cached by filter flag (see _build_fts_search_sql). Text columns are
+    wrapped in substr with the length bound as a parameter, so one
+    cached statement serves every max_chars value.
+
+    Args:
+        has_is_approved: Whether an isApproved filter is present
+
+    Returns:
+        str: Complete parameterized SQL statement
+    """
+    columns = ",\n            ".join(
+        f"substr({name}, 1, ?) AS {name}"
+        if name in _PREVIEW_TEXT_COLUMNS else name
+        for name in _ARTICLE_COLUMN_NAMES
+    )
+
+    conditions = ("isApproved = ?",) if has_is_approved else ()
+
+    return _list_sql(columns, conditions)
+
+
+@_cached_query()
+def get_all_approved_articles_preview(
+    is_approved: Optional[bool] = None,
+    limit: int = 100,
+    max_chars: int = 100
+) -> List[Dict[str, Any]]:
+    """
+    Get articles with long text columns truncated in SQL.
+
+    For list views and logs that only ever display a prefix, substr in
+    the SELECT list caps each text column at max_chars before the row
+    leaves SQLite - a multi-kB textForPdfReport costs max_chars bytes of
+    transfer and Python string construction instead of its full length.
+
+    Args:
+        is_approved: Filter by approval status. If None, returns all statuses.
+        limit: Maximum number of results to return (default: 100)
+        max_chars: Per-column character cap for the text columns (default: 100)
+
+    Returns:
+        List of dictionaries containing article data with truncated text
+
+    Example:
+        >>> previews = get_all_approved_articles_preview(is_approved=True, limit=5)
+    """
+    db = get_db()
+
+    # substr bounds come first: the params appear in SELECT-list order
+    params = [max_chars] * len(_PREVIEW_TEXT_COLUMNS)
+
+    if is_approved is not None:
+        params.append(_BOOL[is_approved])
+
+    params.append(limit)
+
+    with db.get_cursor() as cursor:
+        cursor.execute(_build_preview_sql(is_approved is not None), params)
+        return list(_iter_rows(cursor))
+
+
+@_cached_query()
+def get_dashboard_snapshot(
+    user_id: int,
+    is_approved: bool = True,
+    limit: int = 100
+) -> Dict[str, Any]:
+    """
+    Get the count, latest articles, and a user's articles in one pass.
+
+    Dashboard code previously called get_approved_articles_count,
+    get_all_approved_articles, and get_approved_articles_by_user
+    separately - three lock acquisitions and three transactions on the
+    shared connection. This issues all three statements on one cursor
+    inside a single transaction (sqlite3 has no multi-resultset support,
+    so sequential executes on one cursor are the equivalent batch),
+    reusing the same cached statement text as the individual functions.
+
+    Args:
+        user_id: ID of the user whose approvals to include
+        is_approved: Approval status for all three result sets (default: True)
+        limit: Maximum rows for each article list (default: 100)
+
+    Returns:
+        Dictionary with 'approved_count', 'latest_articles', and
+        'user_articles' keys
+
+    Example:
+        >>> snapshot = get_dashboard_snapshot(user_id=1)
+        >>> print(snapshot['approved_count'], len(snapshot['latest_articles']))
+    """
+    db = get_db()
+
+    status = _BOOL[is_approved]
+
+    with db.get_cursor() as cursor:
+        cursor.execute(
+            "SELECT COUNT(*) as count FROM ArticleApproveds WHERE isApproved = ?",
+            (status,)
+        )
+        row = cursor.fetchone()
+        approved_count = row['count'] if row else 0
+
+        cursor.execute(_build_all_sql(True), (status, limit, 0))
+        latest_articles = list(_iter_rows(cursor))
+
+        cursor.execute(_build_user_sql(True), (user_id, status, limit))
+        user_articles = list(_iter_rows(cursor))
+
+    return {
+        'approved_count': approved_count,
+        'latest_articles': latest_articles,
+        'user_articles': user_articles
+    }
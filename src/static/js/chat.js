@@ -105,6 +105,11 @@ class ChatClient {
         const { type, content } = message;
 
         switch (type) {
+            case 'batch':
+                // Server coalesces consecutive messages into one frame
+                message.items.forEach((item) => this.handleMessage(item));
+                break;
+
             case 'system':
                 this.addMessage('system', content);
                 break;
@@ -4,7 +4,12 @@ Logging configuration for Fluxion00API.
 Provides structured logging for agent progress tracking with time-only timestamps.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 
 
@@ -12,6 +17,11 @@ def setup_logger(name: str = "fluxion") -> logging.Logger:
     """
     Set up logger with custom formatting.
 
+    Log records are handed to a QueueHandler, and a background
+    QueueListener thread does the formatting and stream writes - the
+    asyncio event loop never blocks on the logging lock or a write()
+    syscall, which matters with several log lines per chat turn.
+
     Args:
         name: Logger name (default: "fluxion")
 
@@ -36,11 +46,40 @@ def setup_logger(name: str = "fluxion") -> logging.Logger:
         )
         handler.setFormatter(formatter)
 
-        logger.addHandler(handler)
+        # Callers only enqueue the record; the listener thread writes
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
 
+# Collapses runs of whitespace (incl. newlines) in one pass; compiled
+# once instead of split/join building a full word list per call
+_WS = re.compile(r"\s+")
+
+# Only short inputs are memoized - caching arbitrary prompt bodies as
+# lru_cache keys would pin megabytes of chat text in memory. Repeated
+# short strings (tool names, usernames, status words) dominate the logs
+_CACHEABLE_LENGTH = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def _truncate_cached(text: str, max_length: int) -> str:
+    """Memoized core of truncate_text for short, recurring strings."""
+    clean_text = _WS.sub(" ", text).strip()
+
+    if len(clean_text) <= max_length:
+        return clean_text
+
+    return clean_text[:max_length] + "..."
+
+
 def truncate_text(text: str, max_length: int = 30) -> str:
     """
     Truncate text to specified length for logging.
@@ -55,8 +94,13 @@ def truncate_text(text: str, max_length: int = 30) -> str:
     if not text:
         return ""
 
-    # Remove newlines and extra whitespace for cleaner logs
-    clean_text = " ".join(text.split())
+    if len(text) <= _CACHEABLE_LENGTH:
+        return _truncate_cached(text, max_length)
+
+    # Long texts get truncated to max_length + a slop window first so
+    # the whitespace pass never walks an entire prompt; the window keeps
+    # the result stable when collapsing shrinks the prefix
+    clean_text = _WS.sub(" ", text[:max_length * 4]).strip()
 
     if len(clean_text) <= max_length:
         return clean_text
@@ -5,7 +5,11 @@ This script tests the Ollama provider implementation.
 """
 
 import asyncio
+import contextvars
+import functools
+import io
 import os
+import sys
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -21,12 +25,49 @@ def print_section(title: str):
     print('='*60)
 
 
-async def test_connection():
+# Per-task print buffer so independent tests can run concurrently via
+# asyncio.gather without interleaving their section output. Each task
+# gets its own context copy, so setting the var inside a task only
+# redirects that task's prints
+_task_output: contextvars.ContextVar = contextvars.ContextVar(
+    "task_output", default=None
+)
+
+
+class _TaskStdout:
+    """Routes writes to the current task's buffer, else the real stdout."""
+
+    def __init__(self, real):
+        self._real = real
+
+    def write(self, s):
+        buf = _task_output.get()
+        return (buf if buf is not None else self._real).write(s)
+
+    def flush(self):
+        buf = _task_output.get()
+        (buf if buf is not None else self._real).flush()
+
+
+async def _buffered(test_func):
+    """Run one test with its prints captured; return (result, output)."""
+    buf = io.StringIO()
+    _task_output.set(buf)
+    try:
+        result = await test_func()
+    except Exception as e:
+        print(f"\n✗ FATAL ERROR: {e}")
+        import traceback
+        traceback.print_exc(file=sys.stdout)
+        result = False
+    return result, buf.getvalue()
+
+
+async def test_connection(provider: OllamaProvider):
     """Test basic connection to Ollama API."""
     print_section("Testing Ollama Connection")
 
     try:
-        provider = OllamaProvider()
         print(f"✓ Provider initialized")
         print(f"  Base URL: {provider.base_url}")
         print(f"  API Endpoint: {provider.api_endpoint}")
@@ -49,13 +90,11 @@ async def test_connection():
         return False
 
 
-async def test_simple_generation():
+async def test_simple_generation(provider: OllamaProvider):
     """Test simple text generation."""
     print_section("Testing Simple Text Generation")
 
     try:
-        provider = OllamaProvider()
-
         prompt = "What is Python programming language? Answer in one sentence."
         print(f"Prompt: {prompt}\n")
 
@@ -77,13 +116,11 @@ async def test_simple_generation():
         return False
 
 
-async def test_system_prompt():
+async def test_system_prompt(provider: OllamaProvider):
     """Test generation with system prompt."""
     print_section("Testing Generation with System Prompt")
 
     try:
-        provider = OllamaProvider()
-
         system_prompt = "You are a helpful assistant that answers in a very concise manner."
         prompt = "What is FastAPI?"
 
@@ -107,13 +144,11 @@ async def test_system_prompt():
         return False
 
 
-async def test_chat_format():
+async def test_chat_format(provider: OllamaProvider):
     """Test chat format with conversation history."""
     print_section("Testing Chat Format")
 
     try:
-        provider = OllamaProvider()
-
         messages = [
             LLMMessage(role="system", content="You are a helpful assistant."),
             LLMMessage(role="user", content="What is 2+2?"),
@@ -139,13 +174,11 @@ async def test_chat_format():
         return False
 
 
-async def test_streaming():
+async def test_streaming(provider: OllamaProvider):
     """Test streaming generation."""
     print_section("Testing Streaming Generation")
 
     try:
-        provider = OllamaProvider()
-
         prompt = "Count from 1 to 5, one number per line."
         print(f"Prompt: {prompt}\n")
         print("Streaming response:")
@@ -169,13 +202,11 @@ async def test_streaming():
         return False
 
 
-async def test_temperature_variation():
+async def test_temperature_variation(provider: OllamaProvider):
     """Test different temperature settings."""
     print_section("Testing Temperature Variation")
 
     try:
-        provider = OllamaProvider()
-
         prompt = "Say hello"
         temperatures = [0.0, 0.5, 1.0]
 
@@ -196,13 +227,11 @@ async def test_temperature_variation():
         return False
 
 
-async def test_available_models():
+async def test_available_models(provider: OllamaProvider):
     """Test getting available models."""
     print_section("Testing Available Models")
 
     try:
-        provider = OllamaProvider()
-
         models = provider.get_available_models()
         print(f"✓ Available models: {len(models)}")
         for model in models:
@@ -226,26 +255,48 @@ async def main():
     print(f"  URL_BASE_OLLAMA: {os.getenv('URL_BASE_OLLAMA')}")
     print(f"  KEY_OLLAMA: {'Set' if os.getenv('KEY_OLLAMA') else 'Not set'}")
 
-    tests = [
+    # One provider for the whole run (same pattern as test_agent.py
+    # passing one agent around): every test shares its pooled HTTP
+    # client, so TCP connections are set up once and kept alive instead
+    # of re-handshaking per test
+    provider = OllamaProvider()
+
+    # These tests are independent network-bound coroutines, so they run
+    # concurrently and the wall time is the slowest test, not the sum.
+    # Prints are buffered per task (see _buffered) and replayed in order
+    independent = [
         ("Connection Test", test_connection),
         ("Simple Generation", test_simple_generation),
         ("System Prompt", test_system_prompt),
         ("Chat Format", test_chat_format),
-        ("Streaming", test_streaming),
         ("Temperature Variation", test_temperature_variation),
         ("Available Models", test_available_models),
     ]
 
-    results = []
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
+    sys.stdout = _TaskStdout(sys.stdout)
+
+    try:
+        outcomes = await asyncio.gather(
+            *(_buffered(functools.partial(test_func, provider))
+              for _, test_func in independent)
+        )
+
+        results = []
+        for (test_name, _), (result, output) in zip(independent, outcomes):
+            print(output, end="")
             results.append((test_name, result))
+
+        # Streaming stays serial: its incremental flush-as-you-go output is
+        # the behavior under test and would be meaningless buffered
+        try:
+            results.append(("Streaming", await test_streaming(provider)))
         except Exception as e:
-            print(f"\n✗ FATAL ERROR in {test_name}: {e}")
+            print(f"\n✗ FATAL ERROR in Streaming: {e}")
             import traceback
             traceback.print_exc()
-            results.append((test_name, False))
+            results.append(("Streaming", False))
+    finally:
+        await provider.aclose()
 
     # Summary
     print_section("TEST SUMMARY")
@@ -4,7 +4,11 @@ Test script for database connection and query functions.
 This script tests all the query functions for the ArticleApproveds table.
 """
 
+import io
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -15,10 +19,13 @@ load_dotenv(override=True)
 from src.queries.queries_approved_articles import (
     get_approved_articles_count,
     search_approved_articles_by_text,
+    search_approved_articles_by_terms,
     get_approved_articles_by_user,
     get_approved_articles_by_date_range,
     get_approved_article_by_id,
-    get_all_approved_articles
+    get_all_approved_articles,
+    get_all_approved_articles_preview,
+    get_approved_articles_counts_grouped
 )
 
 
@@ -29,6 +36,125 @@ def print_section(title: str):
     print('='*60)
 
 
+# Shared fixture row fetched once per run (see fetch_test_fixture)
+_fixture = None
+
+
+# Per-thread print buffer so the independent tests can run on a thread
+# pool without interleaving their section output (same idea as the
+# per-task buffering in test_ollama.py, but thread-local)
+_thread_output = threading.local()
+
+
+class _ThreadStdout:
+    """Routes writes to the current thread's buffer, else the real stdout."""
+
+    def __init__(self, real):
+        self._real = real
+
+    def write(self, s):
+        return getattr(_thread_output, "buf", self._real).write(s)
+
+    def flush(self):
+        getattr(_thread_output, "buf", self._real).flush()
+
+
+def _buffered(test_func):
+    """Run one test with its prints captured; return (result, output)."""
+    buf = io.StringIO()
+    _thread_output.buf = buf
+    try:
+        result = test_func()
+    except Exception as e:
+        print(f"\n✗ FATAL ERROR: {e}")
+        result = False
+    finally:
+        del _thread_output.buf
+    return result, buf.getvalue()
+
+
+def assert_uses_index(sql: str, params, strict: bool = False) -> bool:
+    """
+    Check a statement's query plan for full-scan/temp-sort regressions.
+
+    Runs EXPLAIN QUERY PLAN (never the query itself) and prints the
+    plan. With strict=True any ArticleApproveds scan fails - use for
+    shapes like primary-key lookups that can always be index searches.
+    Otherwise a scan only fails when the schema actually has an
+    ArticleApproveds index to use: the recommended indexes live in the
+    read-only NewsNexus schema this codebase cannot modify, so their
+    absence is reported as a note, while an index that exists but goes
+    unused is a planner regression.
+
+    Args:
+        sql: Statement to explain
+        params: Bind parameters for the statement
+        strict: Fail on any scan regardless of available indexes
+
+    Returns:
+        bool: True when the plan is acceptable
+    """
+    from src.database.connection import get_db
+
+    with get_db().get_cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = " | ".join(row['detail'] for row in cursor.fetchall())
+
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type='index' "
+            "AND tbl_name='ArticleApproveds' AND sql IS NOT NULL"
+        )
+        indexed = cursor.fetchone()[0] > 0
+
+    print(f"  Plan: {plan}")
+    upper = plan.upper()
+    scans = "SCAN ARTICLEAPPROVEDS" in upper or "SCAN TABLE ARTICLEAPPROVEDS" in upper
+
+    if scans and (strict or indexed):
+        print("✗ ERROR: query runs as a full ArticleApproveds scan")
+        return False
+    if indexed and "USE TEMP B-TREE" in upper:
+        print("✗ ERROR: query sorts via temp B-tree despite available indexes")
+        return False
+    if scans:
+        print("  Note: full scan expected until the recommended indexes exist")
+
+    return True
+
+
+def fetch_test_fixture():
+    """
+    Fetch the per-run test fixture in a single round trip.
+
+    One SELECT with conditional aggregation plus scalar subqueries
+    yields the approval counts and sample id/userId that several tests
+    need, replacing the repeated get_all_approved_articles(limit=1)
+    pattern - every later test reads this dict from Python instead of
+    re-querying SQLite for the same row.
+
+    Returns:
+        dict: approved, not_approved, sample_id, sample_user
+    """
+    global _fixture
+
+    if _fixture is None:
+        from src.database.connection import get_db
+
+        with get_db().get_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    SUM(CASE WHEN isApproved = 1 THEN 1 ELSE 0 END) AS approved,
+                    SUM(CASE WHEN isApproved = 0 THEN 1 ELSE 0 END) AS not_approved,
+                    (SELECT id FROM ArticleApproveds ORDER BY id LIMIT 1) AS sample_id,
+                    (SELECT userId FROM ArticleApproveds
+                     WHERE userId IS NOT NULL LIMIT 1) AS sample_user
+                FROM ArticleApproveds
+            """)
+            _fixture = dict(cursor.fetchone())
+
+    return _fixture
+
+
 def test_database_connection():
     """Test database connection."""
     print_section("Testing Database Connection")
@@ -43,12 +169,47 @@ def test_database_connection():
             print("✗ ERROR: Database file not found!")
             return False
 
-        # Test connection
+        # Test connection. Iterating the cursor pulls rows straight off
+        # the sqlite3.Row factory - no intermediate fetchall list plus
+        # second conversion pass. Only the five displayed names leave
+        # SQLite; the total comes from COUNT(*) instead of materializing
+        # every schema row just to len() it
         with db.get_cursor() as cursor:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            print(f"✓ Connection successful! Found {len(tables)} tables")
-            print(f"  Tables: {[t['name'] for t in tables][:5]}...")  # Show first 5 tables
+            cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
+            table_count = cursor.fetchone()[0]
+
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' LIMIT 5"
+            )
+            table_names = [row['name'] for row in cursor]
+
+            print(f"✓ Connection successful! Found {table_count} tables")
+            print(f"  Tables: {table_names}...")  # Show first 5 tables
+
+            # Verify the read-side tuning pragmas are in effect - every
+            # later test runs on this connection, so a silently missing
+            # pragma would cost the whole suite. journal_mode is NOT
+            # checked against 'wal': it persists into the database file,
+            # which belongs to the NewsNexus application
+            cursor.execute("PRAGMA temp_store")
+            temp_store = cursor.fetchone()[0]
+            cursor.execute("PRAGMA cache_size")
+            cache_size = cursor.fetchone()[0]
+            cursor.execute("PRAGMA mmap_size")
+            mmap_size = cursor.fetchone()[0]
+
+            print(f"✓ Pragmas: temp_store={temp_store}, "
+                  f"cache_size={cache_size}, mmap_size={mmap_size}")
+
+            if temp_store != 2:  # 2 = MEMORY
+                print("✗ ERROR: temp_store is not MEMORY")
+                return False
+            if cache_size != -65536:
+                print("✗ ERROR: cache_size is not -65536 (64MB)")
+                return False
+            if mmap_size <= 0:
+                print("✗ ERROR: mmap_size is not set")
+                return False
 
         return True
     except Exception as e:
@@ -61,12 +222,32 @@ def test_count_approved_articles():
     print_section("Testing: Count Approved Articles")
 
     try:
-        approved_count = get_approved_articles_count(is_approved=True)
-        not_approved_count = get_approved_articles_count(is_approved=False)
+        # One grouped call yields both counts; the per-status calls are
+        # kept to verify they agree with it
+        counts = get_approved_articles_counts_grouped()
+        approved_count = counts[True]
+        not_approved_count = counts[False]
+
+        if approved_count != get_approved_articles_count(is_approved=True):
+            print("✗ ERROR: grouped approved count disagrees with single count")
+            return False
+        if not_approved_count != get_approved_articles_count(is_approved=False):
+            print("✗ ERROR: grouped not-approved count disagrees with single count")
+            return False
 
         print(f"✓ Approved articles: {approved_count}")
         print(f"✓ Not approved articles: {not_approved_count}")
         print(f"✓ Total: {approved_count + not_approved_count}")
+
+        # Cross-check against the independently fetched fixture counts
+        fixture = fetch_test_fixture()
+        if approved_count != (fixture['approved'] or 0):
+            print(f"✗ ERROR: approved count mismatch (fixture: {fixture['approved']})")
+            return False
+        if not_approved_count != (fixture['not_approved'] or 0):
+            print(f"✗ ERROR: not-approved count mismatch (fixture: {fixture['not_approved']})")
+            return False
+
         return True
     except Exception as e:
         print(f"✗ ERROR: {e}")
@@ -78,16 +259,16 @@ def test_get_all_articles():
     print_section("Testing: Get All Approved Articles (Limited)")
 
     try:
-        articles = get_all_approved_articles(is_approved=True, limit=5)
+        # Preview variant truncates text columns to 100 chars in SQL,
+        # so full article bodies never cross into Python just to be
+        # cut down for display here
+        articles = get_all_approved_articles_preview(is_approved=True, limit=5)
         print(f"✓ Retrieved {len(articles)} articles")
 
         if articles:
             print("\nFirst article:")
             for key, value in articles[0].items():
-                if value and len(str(value)) > 100:
-                    print(f"  {key}: {str(value)[:100]}...")
-                else:
-                    print(f"  {key}: {value}")
+                print(f"  {key}: {value}")
         else:
             print("  No articles found")
 
@@ -105,21 +286,58 @@ def test_search_by_text():
         # Search for a common word (you may need to adjust this based on your data)
         search_terms = ["safety", "recall", "injury", "product"]
 
-        for term in search_terms:
-            results = search_approved_articles_by_text(
-                search_text=term,
-                is_approved=True,
-                limit=3
-            )
+        # All four terms go out as one statement (one round trip, one
+        # plan) and come back grouped per term
+        hits_by_term = search_approved_articles_by_terms(
+            search_terms=search_terms,
+            is_approved=True,
+            limit_per_term=3
+        )
+        for term, results in hits_by_term.items():
             print(f"✓ Search for '{term}': {len(results)} results")
 
             if results:
                 print(f"  First result headline: {results[0].get('headlineForPdfReport', 'N/A')[:80]}...")
-                break  # Stop after first successful search
 
-        if not any(search_approved_articles_by_text(term, limit=1) for term in search_terms):
+        if not any(hits_by_term.values()):
             print("  Note: No results found for common search terms")
 
+        # The grouped query above is an independent LIKE statement, so
+        # search_approved_articles_by_text keeps direct coverage of the
+        # FTS path: a word match implies the substring is present, so
+        # every FTS hit must appear in the grouped LIKE results for the
+        # same term (comparable whenever the grouped list wasn't cut
+        # off at its limit)
+        fts_results = search_approved_articles_by_text(
+            search_text="safety",
+            is_approved=True,
+            limit=3
+        )
+        print(f"✓ FTS search for 'safety': {len(fts_results)} results")
+
+        fts_ids = {row['id'] for row in fts_results}
+        like_ids = {row['id'] for row in hits_by_term["safety"]}
+        if len(hits_by_term["safety"]) < 3 and not fts_ids <= like_ids:
+            print(f"✗ FTS hits {fts_ids - like_ids} missing from LIKE results")
+            return False
+
+        # Prefix mode takes the LIKE 'text%' branch
+        prefix_results = search_approved_articles_by_text(
+            search_text="saf",
+            prefix_only=True,
+            limit=3
+        )
+        print(f"✓ Prefix search for 'saf': {len(prefix_results)} results")
+
+        # Punctuation-heavy input must route to the LIKE fallback
+        # (the FTS tokenizer splits on these characters) and still
+        # return cleanly
+        punct_results = search_approved_articles_by_text(
+            search_text="safety-recall",
+            limit=3
+        )
+        print(f"✓ Punctuated search for 'safety-recall': {len(punct_results)} results")
+
         return True
     except Exception as e:
         print(f"✗ ERROR: {e}")
@@ -131,11 +349,10 @@ def test_get_by_user():
     print_section("Testing: Get Articles by User")
 
     try:
-        # First, get a valid user ID from an existing article
-        articles = get_all_approved_articles(limit=1)
+        # Sample user comes from the shared fixture row - no extra query
+        user_id = fetch_test_fixture()['sample_user']
 
-        if articles and articles[0]['userId']:
-            user_id = articles[0]['userId']
+        if user_id:
             user_articles = get_approved_articles_by_user(
                 user_id=user_id,
                 is_approved=True,
@@ -145,7 +362,11 @@ def test_get_by_user():
         else:
             print("  No articles with user IDs found to test")
 
-        return True
+        # Plan guardrail for the by-user shape (adaptive: see
+        # assert_uses_index)
+        from src.queries.queries_approved_articles import _build_user_sql
+
+        return assert_uses_index(_build_user_sql(True), (1, 1, 5))
     except Exception as e:
         print(f"✗ ERROR: {e}")
         return False
@@ -168,7 +389,16 @@ def test_get_by_date_range():
         if articles:
             print(f"  First article created: {articles[0]['createdAt']}")
 
-        return True
+        # Plan check: once the NewsNexus schema has the recommended
+        # (isApproved, createdAt DESC) index, this query must use it
+        # with no temp B-tree sort - a regression back to scan+sort is
+        # a failure. Until then the scan is expected and only noted
+        from src.queries.queries_approved_articles import _build_date_range_sql
+
+        return assert_uses_index(
+            _build_date_range_sql('createdAt', True, True, True),
+            ('2020-01-01', '2025-12-31', 1, 5)
+        )
     except Exception as e:
         print(f"✗ ERROR: {e}")
         return False
@@ -179,12 +409,15 @@ def test_get_by_id():
     print_section("Testing: Get Article by ID")
 
     try:
-        # Get first article's ID
-        articles = get_all_approved_articles(limit=1)
-
-        if articles:
-            article_id = articles[0]['id']
-            article = get_approved_article_by_id(article_id)
+        # Sample id comes from the shared fixture row - no extra query
+        article_id = fetch_test_fixture()['sample_id']
+
+        if article_id is not None:
+            # Only the displayed columns are requested; with a covering
+            # index in the schema this lookup never touches the row heap
+            article = get_approved_article_by_id(
+                article_id, fields=['id', 'headlineForPdfReport']
+            )
 
             if article:
                 print(f"✓ Successfully retrieved article ID {article_id}")
@@ -194,7 +427,11 @@ def test_get_by_id():
         else:
             print("  No articles available to test")
 
-        return True
+        # The rowid lookup can always be an index search, so a scan here
+        # is a failure regardless of schema indexes
+        from src.queries.queries_approved_articles import _BY_ID_SQL
+
+        return assert_uses_index(_BY_ID_SQL, (1,), strict=True)
     except Exception as e:
         print(f"✗ ERROR: {e}")
         return False
@@ -221,14 +458,73 @@ def main():
         ("Get by ID", test_get_by_id),
     ]
 
+    # Warm the shared connection once up front: get_db() hands every
+    # query function the same cached connection, so all seven tests run
+    # against a hot page cache and a populated statement cache instead
+    # of each paying connection setup
+    from src.database.connection import get_db
+    db = get_db()
+
     results = []
-    for test_name, test_func in tests:
+    try:
+        db.connect()
+
+        # Warm sqlite3's prepared-statement cache before the first test:
+        # execute each helper's statement once with no-match dummy
+        # bindings so the first real call reuses the compiled plan
+        # instead of paying the parse/plan step. The statements are run
+        # as-is rather than EXPLAIN-prefixed - the cache is keyed by SQL
+        # text, so "EXPLAIN ..." would warm a different slot
+        from src.queries.queries_approved_articles import (
+            _BY_ID_SQL,
+            _COUNT_SQL,
+            _FTS_COLUMNS,
+            _build_all_sql,
+            _build_date_range_sql,
+            _build_like_search_sql,
+            _build_preview_sql,
+            _build_user_sql,
+        )
+        warm_statements = (
+            _BY_ID_SQL,
+            _COUNT_SQL,
+            _build_all_sql(True),
+            _build_preview_sql(True),
+            _build_user_sql(True),
+            _build_date_range_sql('createdAt', True, True, True),
+            _build_like_search_sql(_FTS_COLUMNS, True),
+        )
+        with db.get_cursor() as cursor:
+            for sql in warm_statements:
+                cursor.execute(sql, (0,) * sql.count("?")).fetchall()
+
+        # Connection test runs first and serially - it validates the
+        # setup everything else depends on
+        conn_name, conn_func = tests[0]
         try:
-            result = test_func()
-            results.append((test_name, result))
+            results.append((conn_name, conn_func()))
         except Exception as e:
-            print(f"\n✗ FATAL ERROR in {test_name}: {e}")
-            results.append((test_name, False))
+            print(f"\n✗ FATAL ERROR in {conn_name}: {e}")
+            results.append((conn_name, False))
+
+        # Prefetch the fixture before fanning out so the parallel tests
+        # read the populated module global instead of racing to fill it
+        fetch_test_fixture()
+
+        # The remaining tests are independent reads, so they run on a
+        # thread pool with prints buffered per thread (see _ThreadStdout)
+        # and replayed in order. Queries still serialize on the shared
+        # connection's lock, but the Python-side work overlaps
+        sys.stdout = _ThreadStdout(sys.stdout)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(_buffered, (f for _, f in tests[1:])))
+
+        for (test_name, _), (result, output) in zip(tests[1:], outcomes):
+            print(output, end="")
+            results.append((test_name, result))
+    finally:
+        db.close()
 
     # Summary
     print_section("TEST SUMMARY")
@@ -0,0 +1,211 @@
+"""
+Test script for query plan regression checks.
+
+Runs EXPLAIN QUERY PLAN over the representative SQL shapes built by
+src/queries/queries_approved_articles.py and fails if a shape that can
+use an index silently regresses into a full table scan. The dynamic
+WHERE-clause assembly makes that an easy mistake to reintroduce.
+
+The ArticleApproveds schema is owned by the NewsNexus application, so
+shapes that depend on the recommended secondary indexes only warn (not
+fail) while those indexes are absent; once they exist, a SCAN on those
+shapes becomes a failure.
+"""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables (override=True to always use latest .env values)
+load_dotenv(override=True)
+
+from src.database.connection import get_db
+from src.queries.queries_approved_articles import (
+    _BY_ID_SQL,
+    _RECOMMENDED_INDEXES,
+    _build_all_sql,
+    _build_date_range_sql,
+    _build_user_sql,
+)
+
+
+def print_section(title: str):
+    """Print a formatted section header."""
+    print(f"\n{'='*60}")
+    print(f"{title}")
+    print('='*60)
+
+
+def explain(cursor, sql: str, params) -> str:
+    """
+    Return the EXPLAIN QUERY PLAN output for a statement as one string.
+
+    Args:
+        cursor: Open database cursor
+        sql: Statement to explain
+        params: Bind parameters for the statement
+
+    Returns:
+        str: Plan detail lines joined with ' | '
+    """
+    cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+    return " | ".join(row["detail"] for row in cursor.fetchall())
+
+
+def scans_table(plan: str) -> bool:
+    """Check whether a plan falls back to a full ArticleApproveds scan."""
+    # Older SQLite prints 'SCAN TABLE ArticleApproveds', newer just
+    # 'SCAN ArticleApproveds'
+    return "SCAN TABLE ArticleApproveds" in plan or "SCAN ArticleApproveds" in plan
+
+
+def recommended_indexes_present(cursor) -> bool:
+    """Check whether the advisory secondary indexes exist in the schema."""
+    cursor.execute(
+        "SELECT COUNT(*) AS n FROM sqlite_master "
+        "WHERE type='index' AND tbl_name='ArticleApproveds' AND sql IS NOT NULL"
+    )
+    return cursor.fetchone()["n"] > 0
+
+
+def test_primary_key_lookup():
+    """The by-id lookup must always be an index search, never a scan."""
+    print_section("Testing: Primary Key Lookup Plan")
+
+    try:
+        db = get_db()
+        with db.get_cursor() as cursor:
+            plan = explain(cursor, _BY_ID_SQL, (1,))
+            print(f"  Plan: {plan}")
+
+            if scans_table(plan):
+                print("✗ ERROR: by-id lookup runs as a full table scan")
+                return False
+
+            print("✓ by-id lookup uses the rowid/primary key search")
+
+        return True
+    except Exception as e:
+        print(f"✗ ERROR: {e}")
+        return False
+
+
+def test_filtered_list_plans():
+    """Filtered list shapes should use indexes where the schema has them."""
+    print_section("Testing: Filtered List Query Plans")
+
+    shapes = [
+        ("all + is_approved", _build_all_sql(True), (1, 100, 0)),
+        ("all + keyset cursor", _build_all_sql(True, True), (1, "2025-01-01", 100)),
+        ("by user", _build_user_sql(False), (1, 100)),
+        ("by user + is_approved", _build_user_sql(True), (1, 1, 100)),
+        (
+            "date range (both bounds)",
+            _build_date_range_sql("createdAt", True, True, True),
+            ("2020-01-01", "2025-12-31", 1, 100),
+        ),
+        (
+            "date range (start only)",
+            _build_date_range_sql("createdAt", True, False, False),
+            ("2020-01-01", 100),
+        ),
+    ]
+
+    try:
+        db = get_db()
+        with db.get_cursor() as cursor:
+            indexed = recommended_indexes_present(cursor)
+            print(f"  Secondary indexes present: {indexed}")
+
+            scanning = []
+            for name, sql, params in shapes:
+                plan = explain(cursor, sql, params)
+                marker = "SCAN" if scans_table(plan) else "SEARCH"
+                print(f"  [{marker}] {name}: {plan}")
+                if scans_table(plan):
+                    scanning.append(name)
+
+            if scanning and indexed:
+                print(f"✗ ERROR: indexed shapes regressed to scans: {scanning}")
+                return False
+            if scanning:
+                print(f"  Note: {len(scanning)} shape(s) scan pending these indexes:")
+                for ddl in _RECOMMENDED_INDEXES:
+                    print(f"    {ddl}")
+
+            print("✓ No unexpected full table scans")
+
+        return True
+    except Exception as e:
+        print(f"✗ ERROR: {e}")
+        return False
+
+
+def test_order_by_avoids_sort():
+    """ORDER BY createdAt should use an index, not a temp B-tree, once indexed."""
+    print_section("Testing: ORDER BY Sort Strategy")
+
+    try:
+        db = get_db()
+        with db.get_cursor() as cursor:
+            plan = explain(cursor, _build_all_sql(True), (1, 100, 0))
+            uses_temp_btree = "USE TEMP B-TREE" in plan.upper()
+            print(f"  Plan: {plan}")
+
+            if uses_temp_btree and recommended_indexes_present(cursor):
+                print("✗ ERROR: ORDER BY sorts via temp B-tree despite indexes")
+                return False
+            if uses_temp_btree:
+                print("  Note: temp B-tree sort (expected until indexes exist)")
+            else:
+                print("✓ ORDER BY satisfied without a temp B-tree sort")
+
+        return True
+    except Exception as e:
+        print(f"✗ ERROR: {e}")
+        return False
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("FLUXION00API - QUERY PLAN TESTS")
+    print("="*60)
+
+    print(f"\nEnvironment variables loaded:")
+    print(f"  PATH_TO_DATABASE: {os.getenv('PATH_TO_DATABASE')}")
+    print(f"  NAME_DB: {os.getenv('NAME_DB')}")
+
+    tests = [
+        ("Primary Key Lookup Plan", test_primary_key_lookup),
+        ("Filtered List Query Plans", test_filtered_list_plans),
+        ("ORDER BY Sort Strategy", test_order_by_avoids_sort),
+    ]
+
+    results = []
+    for test_name, test_func in tests:
+        try:
+            result = test_func()
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"\n✗ FATAL ERROR in {test_name}: {e}")
+            results.append((test_name, False))
+
+    # Summary
+    print_section("TEST SUMMARY")
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+
+    for test_name, result in results:
+        status = "✓ PASS" if result else "✗ FAIL"
+        print(f"{status}: {test_name}")
+
+    print(f"\nTotal: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("\n🎉 All tests passed!")
+    else:
+        print(f"\n⚠️  {total - passed} test(s) failed")
+
+
+if __name__ == "__main__":
+    main()